@@ -3,11 +3,15 @@ from flask import Flask, jsonify
 from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
 from config import Config
-from routes import min_qualification_bp, formal_assessment_bp
+from utils.database import db
+from utils.schema import ensure_columns, ensure_indexes
+from utils.background import run_in_one_process
+from routes import min_qualification_bp, formal_assessment_bp, cache_bp, batches_bp, metrics_bp, results_bp
+from services.batch_queue import batch_queue
+from services.bulk_assessor import bulk_assessor
+from services.usage_recorder import usage_recorder
 import os
 
-db = SQLAlchemy()
-
 def create_app():
     app = Flask(__name__)
     app.config.from_object(Config)
@@ -17,9 +21,29 @@ def create_app():
     
     app.register_blueprint(min_qualification_bp, url_prefix='/api/min-qualification')
     app.register_blueprint(formal_assessment_bp, url_prefix='/api/formal-assessment')
+    app.register_blueprint(cache_bp, url_prefix='/api/cache')
+    app.register_blueprint(batches_bp, url_prefix='/api/batches')
+    app.register_blueprint(metrics_bp, url_prefix='/api/metrics')
+    app.register_blueprint(results_bp, url_prefix='/api/results')
     
     with app.app_context():
         db.create_all()
+    # Columns and indexes added since a table was first created
+    ensure_columns(app)
+    ensure_indexes(app)
+    
+    # Start background workers once the tables exist
+    usage_recorder.init_app(app)
+    batch_queue.init_app(app)
+    bulk_assessor.init_app(app)
+    
+    # The batch dispatcher and the bulk poller run in a single worker process
+    def start_background_workers():
+        batch_queue.start()
+        bulk_assessor.start()
+    
+    if Config.BATCH_WORKER_ENABLED or Config.BULK_WORKER_ENABLED:
+        run_in_one_process(start_background_workers)
     
     @app.route('/health')
     def health_check():
@@ -33,6 +57,10 @@ def create_app():
             'endpoints': {
                 'min_qualification': '/api/min-qualification/*',
                 'formal_assessment': '/api/formal-assessment/*',
+                'cache': '/api/cache/*',
+                'batches': '/api/batches/*',
+                'metrics': '/api/metrics/*',
+                'results': '/api/results/*',
                 'health': '/health'
             }
         }
@@ -45,4 +73,4 @@ if __name__ == '__main__':
         exit(1)
     
     app = create_app()
-    app.run(host='0.0.0.0', port=5004, debug=True)
\ No newline at end of file
+    app.run(host='0.0.0.0', port=Config.PORT, debug=Config.DEBUG)
\ No newline at end of file
@@ -1,3 +1,4 @@
+import multiprocessing
 import os
 
 class Config:
@@ -12,13 +13,128 @@ class Config:
     # Job Management Service Configuration
     JOB_MANAGEMENT_SERVICE_URL = os.environ.get('JOB_MANAGEMENT_SERVICE_URL') or 'http://localhost:5003'
     
+    # Inter-service HTTP (pooled keep-alive session, timeouts in seconds, retries for GETs)
+    SERVICE_HTTP_TIMEOUT = float(os.environ.get('SERVICE_HTTP_TIMEOUT', '5'))
+    SERVICE_HTTP_MAX_RETRIES = int(os.environ.get('SERVICE_HTTP_MAX_RETRIES', '3'))
+    SERVICE_HTTP_RETRY_BACKOFF = float(os.environ.get('SERVICE_HTTP_RETRY_BACKOFF', '0.2'))
+    SERVICE_HTTP_POOL_SIZE = int(os.environ.get('SERVICE_HTTP_POOL_SIZE', '20'))
+    
+    # Background batch queue (persisted in the service database)
+    BATCH_WORKER_ENABLED = os.environ.get('BATCH_WORKER_ENABLED', 'true').lower() == 'true'
+    BATCH_WORKER_CONCURRENCY = int(os.environ.get('BATCH_WORKER_CONCURRENCY', '4'))
+    BATCH_POLL_INTERVAL_SECONDS = float(os.environ.get('BATCH_POLL_INTERVAL_SECONDS', '5'))
+    BATCH_ITEM_LEASE_SECONDS = int(os.environ.get('BATCH_ITEM_LEASE_SECONDS', '600'))
+    # Claims per item; an item whose lease expired this many times (it keeps crashing its worker) fails
+    BATCH_ITEM_MAX_ATTEMPTS = int(os.environ.get('BATCH_ITEM_MAX_ATTEMPTS', '3'))
+    BATCH_MAX_CANDIDATES = int(os.environ.get('BATCH_MAX_CANDIDATES', '5000'))
+    
+    # Offline bulk mode (provider batch API: no rate limits, results within the completion window)
+    BULK_WORKER_ENABLED = os.environ.get('BULK_WORKER_ENABLED', 'true').lower() == 'true'
+    BULK_PROVIDER = os.environ.get('BULK_PROVIDER', 'openai').lower()
+    BULK_PROVIDER_BASE_URL = os.environ.get('BULK_PROVIDER_BASE_URL') or 'https://api.openai.com/v1'
+    BULK_PROVIDER_TIMEOUT = float(os.environ.get('BULK_PROVIDER_TIMEOUT', '120'))
+    BULK_COMPLETION_WINDOW = os.environ.get('BULK_COMPLETION_WINDOW', '24h')
+    BULK_POLL_INTERVAL_SECONDS = float(os.environ.get('BULK_POLL_INTERVAL_SECONDS', '60'))
+    BULK_MAX_REQUESTS_PER_FILE = int(os.environ.get('BULK_MAX_REQUESTS_PER_FILE', '50000'))
+    BULK_COST_MULTIPLIER = float(os.environ.get('BULK_COST_MULTIPLIER', '0.5'))
+    
+    # Job/criteria payload cache, one per worker process. Entries are revalidated with the job
+    # management service's ETags (a cheap 304) once the TTL expires, so the TTL bounds how long
+    # a worker can keep assessing against criteria edited since; keep it short
+    JOB_DATA_CACHE_TTL_SECONDS = int(os.environ.get('JOB_DATA_CACHE_TTL_SECONDS', '5'))
+    JOB_DATA_CACHE_MAX_ENTRIES = int(os.environ.get('JOB_DATA_CACHE_MAX_ENTRIES', '1000'))
+    
     # Usage Tracking
     TRACK_USAGE = os.environ.get('TRACK_USAGE', 'true').lower() == 'true'
+    USAGE_FLUSH_BATCH_SIZE = int(os.environ.get('USAGE_FLUSH_BATCH_SIZE', '200'))
+    USAGE_FLUSH_INTERVAL_SECONDS = float(os.environ.get('USAGE_FLUSH_INTERVAL_SECONDS', '5'))
+    USAGE_BUFFER_MAX_RECORDS = int(os.environ.get('USAGE_BUFFER_MAX_RECORDS', '10000'))
+    
+    # Assessment Concurrency (per-area LLM calls in flight per candidate, 1 = sequential)
+    ASSESSMENT_MAX_CONCURRENCY = int(os.environ.get('ASSESSMENT_MAX_CONCURRENCY', '5'))
+    
+    # Minimum qualification evaluation ('per_area' = one call per area, 'multi_area' = grouped areas per call)
+    MIN_QUAL_EVALUATION_MODE = os.environ.get('MIN_QUAL_EVALUATION_MODE', 'per_area').lower()
+    MIN_QUAL_MULTI_AREA_GROUP_SIZE = int(os.environ.get('MIN_QUAL_MULTI_AREA_GROUP_SIZE', '0'))
+    
+    # Prompt budgets (tokens of candidate data per area / job description per prompt, 0 = unlimited)
+    PROMPT_AREA_TOKEN_BUDGET = int(os.environ.get('PROMPT_AREA_TOKEN_BUDGET', '1500'))
+    PROMPT_JOB_DESCRIPTION_TOKEN_BUDGET = int(os.environ.get('PROMPT_JOB_DESCRIPTION_TOKEN_BUDGET', '1000'))
+    PROMPT_MAX_EXPERIENCES = int(os.environ.get('PROMPT_MAX_EXPERIENCES', '5'))
+    PROMPT_MAX_FIELD_CHARS = int(os.environ.get('PROMPT_MAX_FIELD_CHARS', '600'))
+    PROMPT_TOKENIZER_ENCODING = os.environ.get('PROMPT_TOKENIZER_ENCODING', 'cl100k_base')
+    
+    # Area to candidate field mapping ('full' = whole candidate for unmapped areas, 'none' = send nothing)
+    AREA_FIELDS_UNMAPPED_FALLBACK = os.environ.get('AREA_FIELDS_UNMAPPED_FALLBACK', 'full').lower()
     
-    # Rate Limiting
+    # Rule engine (criteria decided locally from structured candidate fields, without the LLM)
+    RULE_ENGINE_ENABLED = os.environ.get('RULE_ENGINE_ENABLED', 'True').lower() == 'true'
+    RULE_ENGINE_AUTO_DERIVE = os.environ.get('RULE_ENGINE_AUTO_DERIVE', 'True').lower() == 'true'
+    
+    # Fail-fast screening (stop after the first FAIL, historically most-failed areas first)
+    MIN_QUAL_FAIL_FAST = os.environ.get('MIN_QUAL_FAIL_FAST', 'False').lower() == 'true'
+    MIN_QUAL_FAIL_FAST_WAVE_SIZE = int(os.environ.get('MIN_QUAL_FAIL_FAST_WAVE_SIZE', '1'))
+    MIN_QUAL_FAIL_RATE_MIN_SAMPLES = int(os.environ.get('MIN_QUAL_FAIL_RATE_MIN_SAMPLES', '10'))
+    MIN_QUAL_FAIL_RATE_TTL_SECONDS = int(os.environ.get('MIN_QUAL_FAIL_RATE_TTL_SECONDS', '300'))
+    
+    # Idempotent assessments (identical requests replay stored results, concurrent duplicates wait)
+    IDEMPOTENCY_ENABLED = os.environ.get('IDEMPOTENCY_ENABLED', 'True').lower() == 'true'
+    IDEMPOTENCY_WAIT_SECONDS = int(os.environ.get('IDEMPOTENCY_WAIT_SECONDS', '300'))
+    IDEMPOTENCY_POLL_INTERVAL_SECONDS = float(os.environ.get('IDEMPOTENCY_POLL_INTERVAL_SECONDS', '0.5'))
+    IDEMPOTENCY_CLAIM_LEASE_SECONDS = int(os.environ.get('IDEMPOTENCY_CLAIM_LEASE_SECONDS', '600'))
+    
+    # Assessment Engine ('sync' = thread pool per request, 'async' = one shared asyncio event loop)
+    ASSESSMENT_ENGINE = os.environ.get('ASSESSMENT_ENGINE', 'sync').lower()
+    ASYNC_ASSESSMENT_MAX_CONCURRENCY = int(os.environ.get('ASYNC_ASSESSMENT_MAX_CONCURRENCY', '100'))
+    
+    # LLM Response Cache (in-memory LRU in front of a SQLite file)
+    LLM_CACHE_ENABLED = os.environ.get('LLM_CACHE_ENABLED', 'true').lower() == 'true'
+    LLM_CACHE_PATH = os.environ.get('LLM_CACHE_PATH') or 'llm_response_cache.db'
+    LLM_CACHE_TTL_SECONDS = int(os.environ.get('LLM_CACHE_TTL_SECONDS', str(7 * 24 * 3600)))
+    LLM_CACHE_MEMORY_MAX_ENTRIES = int(os.environ.get('LLM_CACHE_MEMORY_MAX_ENTRIES', '1000'))
+    LLM_CACHE_DISK_MAX_ENTRIES = int(os.environ.get('LLM_CACHE_DISK_MAX_ENTRIES', '50000'))
+    # How long a worker waits for another worker's write lock on the cache file
+    LLM_CACHE_BUSY_TIMEOUT_SECONDS = float(os.environ.get('LLM_CACHE_BUSY_TIMEOUT_SECONDS', '2'))
+    
+    # Rate Limiting (budgets for the whole service in front of OpenAI, split evenly between
+    # the gunicorn worker processes; 0 disables a budget)
     RATE_LIMIT_REQUESTS_PER_MINUTE = int(os.environ.get('RATE_LIMIT_REQUESTS_PER_MINUTE', '100'))
+    RATE_LIMIT_TOKENS_PER_MINUTE = int(os.environ.get('RATE_LIMIT_TOKENS_PER_MINUTE', '150000'))
+    RATE_LIMIT_BURST_SECONDS = float(os.environ.get('RATE_LIMIT_BURST_SECONDS', '10'))
+    RATE_LIMIT_COMPLETION_TOKENS_ESTIMATE = int(os.environ.get('RATE_LIMIT_COMPLETION_TOKENS_ESTIMATE', '300'))
+    
+    # Retries on provider 429s (full-jitter exponential backoff, in seconds)
+    OPENAI_MAX_RETRIES = int(os.environ.get('OPENAI_MAX_RETRIES', '5'))
+    OPENAI_RETRY_BASE_DELAY = float(os.environ.get('OPENAI_RETRY_BASE_DELAY', '1'))
+    OPENAI_RETRY_MAX_DELAY = float(os.environ.get('OPENAI_RETRY_MAX_DELAY', '30'))
+    
+    # Production serving (pre-fork gunicorn workers, see gunicorn.conf.py; debug only when asked for)
+    PORT = int(os.environ.get('PORT', '5004'))
+    DEBUG = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
+    WEB_WORKERS = int(os.environ.get('WEB_WORKERS', str(multiprocessing.cpu_count() * 2 + 1)))
+    WEB_THREADS = int(os.environ.get('WEB_THREADS', '4'))
+    WEB_TIMEOUT = int(os.environ.get('WEB_TIMEOUT', '300'))
+    # Bundles of this many most recently assessed jobs are preloaded into each worker's cache.
+    # They go stale after JOB_DATA_CACHE_TTL_SECONDS like any entry, so the preload mostly turns
+    # a worker's first fetch of those jobs into a 304 revalidation; set to 0 to skip it
+    WARMUP_PRELOAD_JOBS = int(os.environ.get('WARMUP_PRELOAD_JOBS', '50'))
+    # Lock file electing the one process per host that runs the batch dispatcher and bulk poller
+    BACKGROUND_LOCK_PATH = os.environ.get('BACKGROUND_LOCK_PATH') or 'background_workers.lock'
     
     # Database for usage tracking
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or \
         'sqlite:///ai_assessment.db'
-    SQLALCHEMY_TRACK_MODIFICATIONS = False
\ No newline at end of file
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    
+    # Connection pool per worker process (request threads plus the background workers)
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', str(WEB_THREADS + 4)))
+    DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', '10'))
+    DB_POOL_TIMEOUT = int(os.environ.get('DB_POOL_TIMEOUT', '30'))
+    DB_POOL_RECYCLE_SECONDS = int(os.environ.get('DB_POOL_RECYCLE_SECONDS', '1800'))
+    SQLALCHEMY_ENGINE_OPTIONS = {'pool_pre_ping': True} if SQLALCHEMY_DATABASE_URI.startswith('sqlite') else {
+        'pool_size': DB_POOL_SIZE,
+        'max_overflow': DB_MAX_OVERFLOW,
+        'pool_timeout': DB_POOL_TIMEOUT,
+        'pool_recycle': DB_POOL_RECYCLE_SECONDS,
+        'pool_pre_ping': True
+    }
\ No newline at end of file
@@ -0,0 +1,18 @@
+from config import Config
+
+# Pre-fork serving. The app is loaded in each worker (not preloaded in the master), so every
+# worker process has its own database pool and caches. The OpenAI rate budgets are split
+# between the workers, and the batch dispatcher and bulk poller run in one of them.
+bind = f"0.0.0.0:{Config.PORT}"
+wsgi_app = 'wsgi:app'
+workers = Config.WEB_WORKERS
+threads = Config.WEB_THREADS
+worker_class = 'gthread'
+timeout = Config.WEB_TIMEOUT
+preload_app = False
+
+def post_worker_init(worker):
+    from services.rate_limiter import rate_limiter
+    from services.warmup import warm_up
+    rate_limiter.share_budget(worker.cfg.workers)
+    warm_up(worker.wsgi)
\ No newline at end of file
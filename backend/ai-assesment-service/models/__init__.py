@@ -1,5 +1,8 @@
 from .usage_tracking import UsageTracking
 from .min_qualification_results import MinQualificationResult
 from .formal_assessment_results import FormalAssessmentResult
+from .assessment_batch import AssessmentBatch, AssessmentBatchItem, ProviderBatch
+from .assessment_record import AssessmentRecord
 
-__all__ = ['UsageTracking', 'MinQualificationResult', 'FormalAssessmentResult']
\ No newline at end of file
+__all__ = ['UsageTracking', 'MinQualificationResult', 'FormalAssessmentResult',
+           'AssessmentBatch', 'AssessmentBatchItem', 'ProviderBatch', 'AssessmentRecord']
\ No newline at end of file
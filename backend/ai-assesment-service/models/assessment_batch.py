@@ -0,0 +1,106 @@
+import json
+from datetime import datetime
+from utils.database import db
+
+class AssessmentBatch(db.Model):
+    __tablename__ = 'assessment_batches'
+    
+    id = db.Column(db.String(32), primary_key=True)
+    job_id = db.Column(db.Integer, nullable=False, index=True)
+    assessment_type = db.Column(db.String(50), nullable=False)
+    # 'assess' runs full assessments, 'reassess' only re-evaluates areas whose criteria changed,
+    # 'bulk' submits the LLM calls through the provider's batch API
+    mode = db.Column(db.String(20), nullable=False, default='assess')
+    status = db.Column(db.Enum('queued', 'running', 'completed', name='assessment_batch_status'), default='queued')
+    total_items = db.Column(db.Integer, nullable=False, default=0)
+    completed_items = db.Column(db.Integer, nullable=False, default=0)
+    failed_items = db.Column(db.Integer, nullable=False, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    completed_at = db.Column(db.DateTime)
+    
+    def to_dict(self):
+        processed = (self.completed_items or 0) + (self.failed_items or 0)
+        return {
+            'id': self.id,
+            'job_id': self.job_id,
+            'assessment_type': self.assessment_type,
+            'mode': self.mode,
+            'status': self.status,
+            'total_items': self.total_items,
+            'completed_items': self.completed_items,
+            'failed_items': self.failed_items,
+            'pending_items': self.total_items - processed,
+            'progress_percentage': round(processed / self.total_items * 100, 2) if self.total_items else 100.0,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'completed_at': self.completed_at.isoformat() if self.completed_at else None
+        }
+
+class AssessmentBatchItem(db.Model):
+    __tablename__ = 'assessment_batch_items'
+    __table_args__ = (
+        db.Index('ix_assessment_batch_items_batch_index', 'batch_id', 'item_index'),
+        db.Index('ix_assessment_batch_items_status', 'status', 'id'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    batch_id = db.Column(db.String(32), db.ForeignKey('assessment_batches.id'), nullable=False)
+    item_index = db.Column(db.Integer, nullable=False)
+    candidate_id = db.Column(db.String(100), nullable=False)
+    candidate_data = db.Column(db.Text, nullable=False)
+    status = db.Column(db.Enum('pending', 'running', 'completed', 'failed', name='assessment_batch_item_status'),
+                       default='pending')
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    claimed_at = db.Column(db.DateTime)
+    result = db.Column(db.Text)
+    error = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    completed_at = db.Column(db.DateTime)
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'batch_id': self.batch_id,
+            'candidate_index': self.item_index,
+            'candidate_id': self.candidate_id,
+            'status': self.status,
+            'attempts': self.attempts,
+            'result': json.loads(self.result) if self.result else None,
+            'error': self.error,
+            'completed_at': self.completed_at.isoformat() if self.completed_at else None
+        }
+
+
+class ProviderBatch(db.Model):
+    __tablename__ = 'provider_batches'
+    __table_args__ = (
+        db.Index('ix_provider_batches_status', 'status', 'id'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    batch_id = db.Column(db.String(32), db.ForeignKey('assessment_batches.id'), nullable=False, index=True)
+    provider = db.Column(db.String(50), nullable=False)
+    provider_batch_id = db.Column(db.String(100), nullable=False)
+    status = db.Column(db.Enum('submitted', 'collected', 'failed', name='provider_batch_status'), default='submitted')
+    provider_status = db.Column(db.String(50))
+    request_count = db.Column(db.Integer, nullable=False, default=0)
+    # Set while a poller checks or collects the batch, so only one worker collects it
+    claimed_at = db.Column(db.DateTime)
+    # JSON snapshot of the assessment bundle the prompts were built from
+    bundle = db.Column(db.Text, nullable=False)
+    # JSON of {item_id: planned calls and rule results}, used to map outputs back to result rows
+    plans = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    completed_at = db.Column(db.DateTime)
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'batch_id': self.batch_id,
+            'provider': self.provider,
+            'provider_batch_id': self.provider_batch_id,
+            'status': self.status,
+            'provider_status': self.provider_status,
+            'request_count': self.request_count,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'completed_at': self.completed_at.isoformat() if self.completed_at else None
+        }
\ No newline at end of file
@@ -0,0 +1,20 @@
+from datetime import datetime
+from utils.database import db
+
+class AssessmentRecord(db.Model):
+    __tablename__ = 'assessment_records'
+    __table_args__ = (
+        db.Index('ix_assessment_records_job_candidate', 'job_id', 'candidate_id'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    fingerprint = db.Column(db.String(64), unique=True, nullable=False)
+    assessment_type = db.Column(db.String(50), nullable=False)
+    job_id = db.Column(db.Integer, nullable=False)
+    candidate_id = db.Column(db.String(100), nullable=False)
+    status = db.Column(db.Enum('running', 'completed', name='assessment_record_status'), nullable=False)
+    # JSON of the completed assessment response, replayed for identical requests
+    response = db.Column(db.Text)
+    claimed_at = db.Column(db.DateTime)
+    completed_at = db.Column(db.DateTime)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -1,8 +1,12 @@
 from datetime import datetime
-from app import db
+from utils.database import db
 
 class FormalAssessmentResult(db.Model):
     __tablename__ = 'formal_assessment_results'
+    __table_args__ = (
+        db.Index('ix_formal_assessment_results_job_candidate', 'job_id', 'candidate_id', 'id'),
+        db.Index('ix_formal_assessment_results_candidate_job', 'candidate_id', 'job_id', 'id'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     job_id = db.Column(db.Integer, nullable=False)
@@ -14,6 +18,10 @@ class FormalAssessmentResult(db.Model):
     percentage = db.Column(db.Numeric(5, 2), nullable=False)
     evidence = db.Column(db.Text, nullable=False)
     justification = db.Column(db.Text, nullable=False)
+    # Version of the criteria the row was assessed against
+    criteria_version = db.Column(db.Integer)
+    # Hash of the criteria content the row was assessed against (see criteria_content_hash)
+    criteria_hash = db.Column(db.String(64))
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     def to_dict(self):
@@ -23,6 +31,8 @@ class FormalAssessmentResult(db.Model):
             'candidate_id': self.candidate_id,
             'criteria_id': self.criteria_id,
             'area': self.area,
+            'criteria_version': self.criteria_version,
+            'criteria_hash': self.criteria_hash,
             'raw_score': float(self.raw_score) if self.raw_score else None,
             'max_score': float(self.max_score) if self.max_score else None,
             'percentage': float(self.percentage) if self.percentage else None,
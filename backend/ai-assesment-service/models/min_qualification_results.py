@@ -1,8 +1,13 @@
 from datetime import datetime
-from app import db
+from utils.database import db
 
 class MinQualificationResult(db.Model):
     __tablename__ = 'min_qualification_results'
+    __table_args__ = (
+        db.Index('ix_min_qualification_results_job_criteria', 'job_id', 'criteria_id', 'result'),
+        db.Index('ix_min_qualification_results_job_candidate', 'job_id', 'candidate_id', 'id'),
+        db.Index('ix_min_qualification_results_candidate_job', 'candidate_id', 'job_id', 'id'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     job_id = db.Column(db.Integer, nullable=False)
@@ -12,6 +17,12 @@ class MinQualificationResult(db.Model):
     result = db.Column(db.Enum('PASS', 'FAIL', name='min_qual_result'), nullable=False)
     justification = db.Column(db.Text, nullable=False)
     evidence_found = db.Column(db.Text)
+    # Version of the criteria the row was assessed against
+    criteria_version = db.Column(db.Integer)
+    # Hash of the criteria content the row was assessed against (see criteria_content_hash)
+    criteria_hash = db.Column(db.String(64))
+    # 'llm' or 'rule' (decided locally by the rule engine)
+    evaluation_method = db.Column(db.String(20), default='llm')
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     def to_dict(self):
@@ -21,8 +32,28 @@ class MinQualificationResult(db.Model):
             'candidate_id': self.candidate_id,
             'criteria_id': self.criteria_id,
             'area': self.area,
+            'criteria_version': self.criteria_version,
+            'criteria_hash': self.criteria_hash,
             'result': self.result,
             'justification': self.justification,
             'evidence_found': self.evidence_found,
+            'evaluation_method': self.evaluation_method,
             'created_at': self.created_at.isoformat() if self.created_at else None
+        }
+    
+    @classmethod
+    def fail_rates(cls, job_id, min_samples=1):
+        """
+        Historical FAIL rate per criteria_id for a job, for criteria with at least min_samples results
+        """
+        rows = db.session.query(
+            cls.criteria_id,
+            db.func.count(cls.id),
+            db.func.sum(db.case((cls.result == 'FAIL', 1), else_=0))
+        ).filter(cls.job_id == job_id).group_by(cls.criteria_id).all()
+        
+        return {
+            criteria_id: int(fails or 0) / total
+            for criteria_id, total, fails in rows
+            if total >= min_samples
         }
\ No newline at end of file
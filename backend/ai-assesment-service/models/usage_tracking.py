@@ -1,8 +1,13 @@
 from datetime import datetime
-from app import db
+from utils.database import db
 
 class UsageTracking(db.Model):
     __tablename__ = 'usage_tracking'
+    __table_args__ = (
+        db.Index('ix_usage_tracking_job_created', 'job_id', 'created_at'),
+        db.Index('ix_usage_tracking_created_at', 'created_at'),
+        db.Index('ix_usage_tracking_type_created', 'assessment_type', 'created_at'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     job_id = db.Column(db.Integer, nullable=False)
@@ -17,24 +22,17 @@ class UsageTracking(db.Model):
     estimated_cost = db.Column(db.Numeric(10, 6), default=0.0)
     processing_time_ms = db.Column(db.Integer)
     success = db.Column(db.Boolean, default=True)
-    created_at = db.Column(db.DateTime, default=datetime.now())
+    cached = db.Column(db.Boolean, default=False)
+    created_at = db.Column(db.DateTime, default=datetime.now)
     
     @classmethod
     def log_usage(cls, job_id, assessment_type, usage_data, success=True, 
-                  candidate_id=None, processing_time_ms=None):
+                  candidate_id=None, processing_time_ms=None, cached=False, model=None):
         try:
-            record = cls(
-                job_id=job_id,
-                assessment_type=assessment_type,
-                candidate_id=candidate_id,
-                prompt_tokens=usage_data.get('prompt_tokens', 0),
-                completion_tokens=usage_data.get('completion_tokens', 0),
-                total_tokens=usage_data.get('total_tokens', 0),
-                model_used=usage_data.get('model'),
-                estimated_cost=cls._calculate_cost(usage_data),
-                processing_time_ms=processing_time_ms,
-                success=success
-            )
+            record = cls(**cls.build_record(
+                job_id, assessment_type, usage_data, success=success,
+                candidate_id=candidate_id, processing_time_ms=processing_time_ms, cached=cached, model=model
+            ))
             
             db.session.add(record)
             db.session.commit()
@@ -44,8 +42,32 @@ class UsageTracking(db.Model):
             return None
     
     @classmethod
-    def _calculate_cost(cls, usage_data):
-        model = usage_data.get('model', '')
+    def build_record(cls, job_id, assessment_type, usage_data, success=True,
+                     candidate_id=None, processing_time_ms=None, cached=False, model=None):
+        """
+        Column values for one usage row, usable for a model instance or a bulk insert.
+        model is the model that answered (completion responses carry it next to, not inside, their usage).
+        """
+        model = model or usage_data.get('model')
+        return {
+            'job_id': job_id,
+            'assessment_type': assessment_type,
+            'candidate_id': candidate_id,
+            'prompt_tokens': usage_data.get('prompt_tokens', 0),
+            'completion_tokens': usage_data.get('completion_tokens', 0),
+            'total_tokens': usage_data.get('total_tokens', 0),
+            'model_used': model,
+            # Cached responses were already paid for by the original call
+            'estimated_cost': 0.0 if cached else cls._calculate_cost(usage_data, model),
+            'processing_time_ms': processing_time_ms,
+            'success': success,
+            'cached': cached,
+            'created_at': datetime.now()
+        }
+    
+    @classmethod
+    def _calculate_cost(cls, usage_data, model=None):
+        model = model or ''
         prompt_tokens = usage_data.get('prompt_tokens', 0)
         completion_tokens = usage_data.get('completion_tokens', 0)
         
@@ -58,19 +80,87 @@ class UsageTracking(db.Model):
         else:
             prompt_rate, completion_rate = 0.03, 0.06
         
-        return (prompt_tokens / 1000) * prompt_rate + (completion_tokens / 1000) * completion_rate
+        # Batch API usage is billed at a discount
+        cost_multiplier = usage_data.get('cost_multiplier', 1.0)
+        return ((prompt_tokens / 1000) * prompt_rate + (completion_tokens / 1000) * completion_rate) * cost_multiplier
     
     @classmethod
-    def get_stats(cls, job_id=None):
-        query = cls.query.filter_by(job_id=job_id) if job_id else cls.query
-        records = query.all()
+    def get_stats(cls, job_id=None, start_date=None, end_date=None):
+        """
+        Totals computed by the database in a single aggregate query
+        """
+        row = cls._filtered(
+            db.session.query(*cls._aggregate_columns()), job_id, start_date, end_date
+        ).one()
         
-        if not records:
+        if not row.total_assessments:
             return {'total_assessments': 0, 'total_tokens': 0, 'total_cost': 0.0}
         
+        return cls._aggregate_dict(row)
+    
+    @classmethod
+    def get_breakdown(cls, group_by, job_id=None, start_date=None, end_date=None, limit=100):
+        """
+        Totals grouped by model, assessment type, candidate or day, largest spend first
+        (days are returned in calendar order)
+        """
+        group_column = cls._group_column(group_by)
+        query = cls._filtered(
+            db.session.query(group_column.label('key'), *cls._aggregate_columns()),
+            job_id, start_date, end_date
+        ).group_by(group_column)
+        
+        if group_by == 'day':
+            query = query.order_by(group_column)
+        else:
+            query = query.order_by(db.desc('total_cost'), group_column)
+        
+        return [
+            {group_by: row.key, **cls._aggregate_dict(row)}
+            for row in query.limit(limit).all()
+        ]
+    
+    @classmethod
+    def _group_column(cls, group_by):
+        columns = {
+            'model': cls.model_used,
+            'assessment_type': cls.assessment_type,
+            'candidate': cls.candidate_id,
+            # date() exists on both SQLite and PostgreSQL
+            'day': db.func.date(cls.created_at)
+        }
+        if group_by not in columns:
+            raise ValueError(f"group_by must be one of: {', '.join(BREAKDOWN_GROUPS)}")
+        return columns[group_by]
+    
+    @classmethod
+    def _aggregate_columns(cls):
+        return (
+            db.func.count(cls.id).label('total_assessments'),
+            db.func.sum(db.case((cls.success == True, 1), else_=0)).label('successful_assessments'),
+            db.func.sum(db.case((cls.cached == True, 1), else_=0)).label('cached_assessments'),
+            db.func.sum(db.case((cls.cached == True, 0), else_=cls.total_tokens)).label('total_tokens'),
+            db.func.sum(cls.estimated_cost).label('total_cost')
+        )
+    
+    @classmethod
+    def _filtered(cls, query, job_id, start_date, end_date):
+        if job_id:
+            query = query.filter(cls.job_id == job_id)
+        if start_date:
+            query = query.filter(cls.created_at >= start_date)
+        if end_date:
+            query = query.filter(cls.created_at < end_date)
+        return query
+    
+    @staticmethod
+    def _aggregate_dict(row):
         return {
-            'total_assessments': len(records),
-            'successful_assessments': sum(1 for r in records if r.success),
-            'total_tokens': sum(r.total_tokens for r in records),
-            'total_cost': round(sum(float(r.estimated_cost or 0) for r in records), 4)
-        }
\ No newline at end of file
+            'total_assessments': row.total_assessments,
+            'successful_assessments': int(row.successful_assessments or 0),
+            'cached_assessments': int(row.cached_assessments or 0),
+            'total_tokens': int(row.total_tokens or 0),
+            'total_cost': round(float(row.total_cost or 0), 4)
+        }
+
+BREAKDOWN_GROUPS = ['model', 'assessment_type', 'candidate', 'day']
\ No newline at end of file
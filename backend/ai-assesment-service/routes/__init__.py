@@ -1,4 +1,8 @@
 from .min_qualification import min_qualification_bp
 from .formal_assessment import formal_assessment_bp
+from .cache import cache_bp
+from .batches import batches_bp
+from .metrics import metrics_bp
+from .results import results_bp
 
-__all__ = ['min_qualification_bp', 'formal_assessment_bp']
\ No newline at end of file
+__all__ = ['min_qualification_bp', 'formal_assessment_bp', 'cache_bp', 'batches_bp', 'metrics_bp', 'results_bp']
\ No newline at end of file
@@ -0,0 +1,162 @@
+from flask import Blueprint, request, jsonify
+from config import Config
+from models.assessment_batch import AssessmentBatch, AssessmentBatchItem, ProviderBatch
+from services.batch_queue import batch_queue
+from services.bulk_assessor import bulk_assessor
+from services.job_data_cache import job_data_cache
+
+batches_bp = Blueprint('batches', __name__)
+
+ASSESSMENT_TYPES = ['min_qualification', 'formal_assessment']
+
+@batches_bp.route('', methods=['POST'])
+def create_batch():
+    """
+    Enqueue candidates for background assessment and return the batch id right away
+    """
+    return _enqueue_batch(request.get_json(), mode='assess')
+
+@batches_bp.route('/reassess', methods=['POST'])
+def create_reassess_batch():
+    """
+    Enqueue candidates whose results should be brought up to date with the job's current criteria.
+    Only areas whose criteria changed (or were added) are re-evaluated; the other results are reused.
+    """
+    return _enqueue_batch(request.get_json(), mode='reassess')
+
+@batches_bp.route('/bulk', methods=['POST'])
+def create_bulk_batch():
+    """
+    Enqueue candidates for offline assessment through the provider's batch API.
+    Cheaper and free of rate limits, but results arrive within the provider's completion window.
+    """
+    return _enqueue_batch(request.get_json(), mode='bulk')
+
+def _enqueue_batch(data, mode):
+    try:
+        # Validate required fields
+        required_fields = ['job_id', 'candidates']
+        if not data or not all(field in data for field in required_fields):
+            return jsonify({
+                'success': False,
+                'error': 'Missing required fields: job_id, candidates'
+            }), 400
+        
+        job_id = data['job_id']
+        candidates = data['candidates']
+        assessment_type = data.get('assessment_type', 'formal_assessment')
+        
+        # Validate job_id
+        try:
+            job_id = int(job_id)
+        except (ValueError, TypeError):
+            return jsonify({
+                'success': False,
+                'error': 'job_id must be a valid integer'
+            }), 400
+        
+        if assessment_type not in ASSESSMENT_TYPES:
+            return jsonify({
+                'success': False,
+                'error': f'assessment_type must be one of: {", ".join(ASSESSMENT_TYPES)}'
+            }), 400
+        
+        # Validate candidates array
+        if not isinstance(candidates, list) or not candidates:
+            return jsonify({
+                'success': False,
+                'error': 'candidates must be a non-empty array'
+            }), 400
+        
+        if len(candidates) > Config.BATCH_MAX_CANDIDATES:
+            return jsonify({
+                'success': False,
+                'error': f'Batch size cannot exceed {Config.BATCH_MAX_CANDIDATES} candidates'
+            }), 400
+        
+        # Reject the whole batch up front rather than queueing items that can only fail
+        queued_candidates = []
+        for i, candidate_info in enumerate(candidates):
+            if not isinstance(candidate_info, dict) or not isinstance(candidate_info.get('candidate_data'), dict):
+                return jsonify({
+                    'success': False,
+                    'error': f'Candidate {i} must have a candidate_data dictionary'
+                }), 400
+            
+            queued_candidates.append({
+                'candidate_id': str(candidate_info.get('candidate_id', f'candidate_{i}')),
+                'candidate_data': candidate_info['candidate_data']
+            })
+        
+        if mode == 'reassess':
+            # Criteria were just edited: make the workers see the new versions right away
+            job_data_cache.invalidate(job_id)
+        
+        batch = batch_queue.enqueue(job_id, assessment_type, queued_candidates, mode=mode)
+        if mode == 'bulk':
+            bulk_assessor.wake()
+        
+        return jsonify({
+            'success': True,
+            'batch': batch.to_dict()
+        }), 202
+    
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': 'Internal server error'
+        }), 500
+
+@batches_bp.route('/<batch_id>', methods=['GET'])
+def get_batch(batch_id):
+    """
+    Report batch progress
+    """
+    batch = AssessmentBatch.query.get(batch_id)
+    if not batch:
+        return jsonify({
+            'success': False,
+            'error': 'Batch not found'
+        }), 404
+    
+    response = {
+        'success': True,
+        'batch': batch.to_dict()
+    }
+    if batch.mode == 'bulk':
+        provider_batches = ProviderBatch.query.filter_by(batch_id=batch_id).order_by(ProviderBatch.id).all()
+        response['provider_batches'] = [provider_batch.to_dict() for provider_batch in provider_batches]
+    
+    return jsonify(response), 200
+
+@batches_bp.route('/<batch_id>/results', methods=['GET'])
+def get_batch_results(batch_id):
+    """
+    Page through per-candidate results in submission order, optionally filtered by status
+    """
+    batch = AssessmentBatch.query.get(batch_id)
+    if not batch:
+        return jsonify({
+            'success': False,
+            'error': 'Batch not found'
+        }), 404
+    
+    page = request.args.get('page', 1, type=int)
+    per_page = min(request.args.get('per_page', 50, type=int), 200)
+    status = request.args.get('status')
+    
+    query = AssessmentBatchItem.query.filter_by(batch_id=batch_id)
+    if status:
+        query = query.filter_by(status=status)
+    
+    items = query.order_by(AssessmentBatchItem.item_index).paginate(page=page, per_page=per_page, error_out=False)
+    
+    return jsonify({
+        'success': True,
+        'batch': batch.to_dict(),
+        'page': items.page,
+        'per_page': items.per_page,
+        'total': items.total,
+        'pages': items.pages,
+        'results': [item.to_dict() for item in items.items]
+    }), 200
\ No newline at end of file
@@ -0,0 +1,36 @@
+from flask import Blueprint, jsonify
+from services.response_cache import get_response_cache
+from services.job_data_cache import job_data_cache
+
+cache_bp = Blueprint('cache', __name__)
+
+@cache_bp.route('/stats', methods=['GET'])
+def cache_stats():
+    """
+    Hit/miss counters for the LLM response cache and the job data cache
+    """
+    response_cache = get_response_cache()
+    
+    return jsonify({
+        'success': True,
+        'llm_response_cache': response_cache.stats() if response_cache else {'enabled': False},
+        'job_data_cache': job_data_cache.stats()
+    }), 200
+
+@cache_bp.route('/jobs', methods=['DELETE'])
+def invalidate_all_job_data():
+    """
+    Drop every cached job and criteria payload of the worker process serving this request.
+    Other workers keep theirs until the TTL expires and they revalidate with the job management service.
+    """
+    removed = job_data_cache.invalidate()
+    return jsonify({'success': True, 'invalidated_entries': removed}), 200
+
+@cache_bp.route('/jobs/<int:job_id>', methods=['DELETE'])
+def invalidate_job_data(job_id):
+    """
+    Drop the cached job and criteria payloads of one job, e.g. right after its criteria were edited.
+    Like DELETE /jobs this only affects the worker process serving the request.
+    """
+    removed = job_data_cache.invalidate(job_id)
+    return jsonify({'success': True, 'job_id': job_id, 'invalidated_entries': removed}), 200
\ No newline at end of file
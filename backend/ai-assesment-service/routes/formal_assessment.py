@@ -1,5 +1,9 @@
 from flask import Blueprint, request, jsonify
+from config import Config
 from services.assessment_processor import AssessmentProcessor
+from services.async_assessment_processor import AsyncAssessmentProcessor
+from utils.event_loop import run_async
+from utils.sse import stream_assessment
 
 formal_assessment_bp = Blueprint('formal_assessment', __name__)
 
@@ -11,37 +15,12 @@ def assess_formal():
     try:
         data = request.get_json()
         
-        # Validate required fields
-        required_fields = ['job_id', 'candidate_id', 'candidate_data']
-        if not data or not all(field in data for field in required_fields):
-            return jsonify({
-                'success': False,
-                'error': 'Missing required fields: job_id, candidate_id, candidate_data'
-            }), 400
-        
-        job_id = data['job_id']
-        candidate_id = data['candidate_id']
-        candidate_data = data['candidate_data']
-        
-        # Validate job_id
-        try:
-            job_id = int(job_id)
-        except (ValueError, TypeError):
-            return jsonify({
-                'success': False,
-                'error': 'job_id must be a valid integer'
-            }), 400
-        
-        # Validate candidate_data is dict
-        if not isinstance(candidate_data, dict):
-            return jsonify({
-                'success': False,
-                'error': 'candidate_data must be a dictionary'
-            }), 400
+        error_response = _validate_assess_request(data)
+        if error_response:
+            return error_response
         
         # Process assessment
-        processor = AssessmentProcessor()
-        result = processor.process_formal_assessment(job_id, candidate_id, candidate_data)
+        result = _run_assessment(data)
         
         if not result['success']:
             return jsonify(result), 500
@@ -54,6 +33,64 @@ def assess_formal():
             'error': 'Internal server error'
         }), 500
 
+@formal_assessment_bp.route('/assess/stream', methods=['POST'])
+def stream_formal():
+    """
+    Score a candidate and stream each area result as a server-sent event, then a summary event
+    """
+    data = request.get_json()
+    
+    error_response = _validate_assess_request(data)
+    if error_response:
+        return error_response
+    
+    return stream_assessment(lambda emit: _run_assessment(data, on_area_result=emit))
+
+def _validate_assess_request(data):
+    """
+    Return an error response for an invalid assess request, or None
+    """
+    # Validate required fields
+    required_fields = ['job_id', 'candidate_id', 'candidate_data']
+    if not data or not all(field in data for field in required_fields):
+        return jsonify({
+            'success': False,
+            'error': 'Missing required fields: job_id, candidate_id, candidate_data'
+        }), 400
+    
+    # Validate job_id
+    try:
+        data['job_id'] = int(data['job_id'])
+    except (ValueError, TypeError):
+        return jsonify({
+            'success': False,
+            'error': 'job_id must be a valid integer'
+        }), 400
+    
+    # Validate candidate_data is dict
+    if not isinstance(data['candidate_data'], dict):
+        return jsonify({
+            'success': False,
+            'error': 'candidate_data must be a dictionary'
+        }), 400
+    
+    return None
+
+def _run_assessment(data, on_area_result=None):
+    """
+    Run the assessment on the configured engine
+    """
+    if Config.ASSESSMENT_ENGINE == 'async':
+        processor = AsyncAssessmentProcessor()
+        return run_async(processor.process_formal_assessment(
+            data['job_id'], data['candidate_id'], data['candidate_data'], on_area_result=on_area_result
+        ))
+    
+    processor = AssessmentProcessor()
+    return processor.process_formal_assessment(
+        data['job_id'], data['candidate_id'], data['candidate_data'], on_area_result=on_area_result
+    )
+
 @formal_assessment_bp.route('/batch-assess', methods=['POST'])
 def batch_assess_formal():
     """
@@ -94,42 +131,58 @@ def batch_assess_formal():
         if len(candidates) > max_batch_size:
             return jsonify({
                 'success': False,
-                'error': f'Batch size cannot exceed {max_batch_size} candidates for formal assessments'
+                'error': f'Batch size cannot exceed {max_batch_size} candidates for formal assessments, '
+                         f'use /api/batches for larger batches'
             }), 400
         
-        # Process each candidate
-        processor = AssessmentProcessor()
-        results = []
+        # Validate each candidate
+        results = [None] * len(candidates)
+        valid_candidates = []
         
         for i, candidate_info in enumerate(candidates):
             # Validate candidate structure
             if not isinstance(candidate_info, dict) or 'candidate_data' not in candidate_info:
-                results.append({
+                results[i] = {
                     'candidate_index': i,
                     'success': False,
                     'error': 'Invalid candidate structure - missing candidate_data'
-                })
+                }
                 continue
             
             candidate_data = candidate_info['candidate_data']
             candidate_id = candidate_info.get('candidate_id', f'candidate_{i}')
             
             # Validate candidate_data
-            if not isinstance(candidate_data, str) or not candidate_data.strip():
-                results.append({
+            if not isinstance(candidate_data, dict) or not candidate_data:
+                results[i] = {
                     'candidate_index': i,
                     'candidate_id': candidate_id,
                     'success': False,
-                    'error': 'candidate_data must be a non-empty string'
-                })
+                    'error': 'candidate_data must be a non-empty dictionary'
+                }
                 continue
             
-            # Process assessment
-            result = processor.process_formal_assessment(job_id, candidate_data)
-            result['candidate_index'] = i
-            result['candidate_id'] = candidate_id
-            
-            results.append(result)
+            valid_candidates.append({
+                'candidate_index': i,
+                'candidate_id': candidate_id,
+                'candidate_data': candidate_data
+            })
+        
+        # Process assessments
+        if Config.ASSESSMENT_ENGINE == 'async':
+            processor = AsyncAssessmentProcessor()
+            assessments = run_async(processor.process_formal_batch(job_id, valid_candidates))
+        else:
+            processor = AssessmentProcessor()
+            assessments = [
+                processor.process_formal_assessment(job_id, candidate['candidate_id'], candidate['candidate_data'])
+                for candidate in valid_candidates
+            ]
+        
+        for candidate, result in zip(valid_candidates, assessments):
+            result['candidate_index'] = candidate['candidate_index']
+            result['candidate_id'] = candidate['candidate_id']
+            results[candidate['candidate_index']] = result
         
         # Calculate summary statistics
         successful_assessments = [r for r in results if r.get('success', False)]
@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta
+from flask import Blueprint, request, jsonify
+from models.usage_tracking import UsageTracking, BREAKDOWN_GROUPS
+from services.rate_limiter import rate_limiter
+from services.area_fields import area_field_mapper
+
+metrics_bp = Blueprint('metrics', __name__)
+
+@metrics_bp.route('/rate-limit', methods=['GET'])
+def rate_limit_metrics():
+    """
+    Queue wait and 429 counters for the shared OpenAI rate limiter
+    """
+    return jsonify({
+        'success': True,
+        'rate_limiter': rate_limiter.stats()
+    }), 200
+
+@metrics_bp.route('/area-fields', methods=['GET'])
+def area_field_metrics():
+    """
+    Criteria areas that matched no candidate fields, by job
+    """
+    return jsonify({
+        'success': True,
+        'area_fields': area_field_mapper.stats()
+    }), 200
+
+@metrics_bp.route('/usage', methods=['GET'])
+def usage_stats():
+    """
+    Token and cost totals, optionally for one job and a date range
+    """
+    try:
+        filters = _usage_filters()
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    
+    return jsonify({
+        'success': True,
+        'usage': UsageTracking.get_stats(**filters)
+    }), 200
+
+@metrics_bp.route('/usage/breakdown', methods=['GET'])
+def usage_breakdown():
+    """
+    Usage totals grouped by model, assessment_type, candidate or day
+    """
+    group_by = request.args.get('group_by', 'model')
+    if group_by not in BREAKDOWN_GROUPS:
+        return jsonify({
+            'success': False,
+            'error': f'group_by must be one of: {", ".join(BREAKDOWN_GROUPS)}'
+        }), 400
+    
+    try:
+        filters = _usage_filters()
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    
+    limit = max(1, min(request.args.get('limit', 100, type=int), 1000))
+    
+    return jsonify({
+        'success': True,
+        'group_by': group_by,
+        'breakdown': UsageTracking.get_breakdown(group_by, limit=limit, **filters)
+    }), 200
+
+def _usage_filters():
+    """
+    Read job_id, start_date and end_date from the query string.
+    A date-only end_date includes that whole day.
+    """
+    filters = {'job_id': request.args.get('job_id', type=int)}
+    
+    for name in ['start_date', 'end_date']:
+        value = request.args.get(name)
+        if not value:
+            filters[name] = None
+            continue
+        
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            raise ValueError(f'{name} must be an ISO 8601 date or datetime')
+        
+        if name == 'end_date' and len(value) == 10:
+            parsed += timedelta(days=1)
+        filters[name] = parsed
+    
+    return filters
\ No newline at end of file
@@ -1,8 +1,14 @@
 from flask import Blueprint, request, jsonify
+from config import Config
 from services.assessment_processor import AssessmentProcessor
+from services.async_assessment_processor import AsyncAssessmentProcessor
+from utils.event_loop import run_async
+from utils.sse import stream_assessment
 
 min_qualification_bp = Blueprint('min_qualification', __name__)
 
+EVALUATION_MODES = ['per_area', 'multi_area']
+
 @min_qualification_bp.route('/assess', methods=['POST'])
 def assess_min_qualification():
     """
@@ -11,37 +17,12 @@ def assess_min_qualification():
     try:
         data = request.get_json()
         
-        # Validate required fields
-        required_fields = ['job_id', 'candidate_id', 'candidate_data']
-        if not data or not all(field in data for field in required_fields):
-            return jsonify({
-                'success': False,
-                'error': 'Missing required fields: job_id, candidate_id, candidate_data'
-            }), 400
-        
-        job_id = data['job_id']
-        candidate_id = data['candidate_id']
-        candidate_data = data['candidate_data']
-        
-        # Validate job_id is integer
-        try:
-            job_id = int(job_id)
-        except (ValueError, TypeError):
-            return jsonify({
-                'success': False,
-                'error': 'job_id must be a valid integer'
-            }), 400
-        
-        # Validate candidate_data is dict
-        if not isinstance(candidate_data, dict):
-            return jsonify({
-                'success': False,
-                'error': 'candidate_data must be a dictionary'
-            }), 400
+        error_response = _validate_assess_request(data)
+        if error_response:
+            return error_response
         
         # Process assessment
-        processor = AssessmentProcessor()
-        result = processor.process_min_qualification_assessment(job_id, candidate_id, candidate_data)
+        result = _run_assessment(data)
         
         if not result['success']:
             return jsonify(result), 500
@@ -54,6 +35,85 @@ def assess_min_qualification():
             'error': 'Internal server error'
         }), 500
 
+@min_qualification_bp.route('/assess/stream', methods=['POST'])
+def stream_min_qualification():
+    """
+    Assess a candidate and stream each area result as a server-sent event, then a summary event
+    """
+    data = request.get_json()
+    
+    error_response = _validate_assess_request(data)
+    if error_response:
+        return error_response
+    
+    return stream_assessment(lambda emit: _run_assessment(data, on_area_result=emit))
+
+def _validate_assess_request(data):
+    """
+    Return an error response for an invalid assess request, or None
+    """
+    # Validate required fields
+    required_fields = ['job_id', 'candidate_id', 'candidate_data']
+    if not data or not all(field in data for field in required_fields):
+        return jsonify({
+            'success': False,
+            'error': 'Missing required fields: job_id, candidate_id, candidate_data'
+        }), 400
+    
+    # Validate job_id is integer
+    try:
+        data['job_id'] = int(data['job_id'])
+    except (ValueError, TypeError):
+        return jsonify({
+            'success': False,
+            'error': 'job_id must be a valid integer'
+        }), 400
+    
+    # Validate candidate_data is dict
+    if not isinstance(data['candidate_data'], dict):
+        return jsonify({
+            'success': False,
+            'error': 'candidate_data must be a dictionary'
+        }), 400
+    
+    # Validate optional evaluation mode
+    evaluation_mode = data.get('evaluation_mode')
+    if evaluation_mode is not None and evaluation_mode not in EVALUATION_MODES:
+        return jsonify({
+            'success': False,
+            'error': f'evaluation_mode must be one of: {", ".join(EVALUATION_MODES)}'
+        }), 400
+    
+    fail_fast = data.get('fail_fast')
+    if fail_fast is not None and not isinstance(fail_fast, bool):
+        return jsonify({
+            'success': False,
+            'error': 'fail_fast must be a boolean'
+        }), 400
+    
+    return None
+
+def _run_assessment(data, on_area_result=None):
+    """
+    Run the assessment on the configured engine
+    """
+    options = {
+        'evaluation_mode': data.get('evaluation_mode'),
+        'fail_fast': data.get('fail_fast'),
+        'on_area_result': on_area_result
+    }
+    
+    if Config.ASSESSMENT_ENGINE == 'async':
+        processor = AsyncAssessmentProcessor()
+        return run_async(processor.process_min_qualification_assessment(
+            data['job_id'], data['candidate_id'], data['candidate_data'], **options
+        ))
+    
+    processor = AssessmentProcessor()
+    return processor.process_min_qualification_assessment(
+        data['job_id'], data['candidate_id'], data['candidate_data'], **options
+    )
+
 @min_qualification_bp.route('/preview', methods=['POST'])
 def preview_assessment():
     """
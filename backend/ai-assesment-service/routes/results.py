@@ -0,0 +1,86 @@
+import base64
+import json
+from flask import Blueprint, request, jsonify
+from models.min_qualification_results import MinQualificationResult
+from models.formal_assessment_results import FormalAssessmentResult
+from utils.database import db
+
+results_bp = Blueprint('results', __name__)
+
+RESULT_MODELS = {
+    'min_qualification': MinQualificationResult,
+    'formal_assessment': FormalAssessmentResult
+}
+
+@results_bp.route('/jobs/<int:job_id>', methods=['GET'])
+def get_job_results(job_id):
+    """
+    Page through a job's stored results, grouped by candidate
+    """
+    return _paged_results(
+        lambda model: model.job_id == job_id,
+        ('candidate_id', 'id'),
+        extra_filter=('candidate_id', request.args.get('candidate_id'))
+    )
+
+@results_bp.route('/candidates/<candidate_id>', methods=['GET'])
+def get_candidate_results(candidate_id):
+    """
+    Page through a candidate's stored results across jobs
+    """
+    return _paged_results(
+        lambda model: model.candidate_id == candidate_id,
+        ('job_id', 'id'),
+        extra_filter=('job_id', request.args.get('job_id', type=int))
+    )
+
+def _paged_results(base_filter, order_columns, extra_filter):
+    """
+    Keyset pagination over an indexed result table. The cursor holds the sort key of the
+    last row returned, so every page is an index range scan however deep the client pages.
+    """
+    assessment_type = request.args.get('assessment_type', 'min_qualification')
+    model = RESULT_MODELS.get(assessment_type)
+    if model is None:
+        return jsonify({
+            'success': False,
+            'error': f'assessment_type must be one of: {", ".join(RESULT_MODELS)}'
+        }), 400
+    
+    limit = max(1, min(request.args.get('limit', 50, type=int), 500))
+    columns = [getattr(model, name) for name in order_columns]
+    
+    query = model.query.filter(base_filter(model))
+    name, value = extra_filter
+    if value is not None:
+        query = query.filter(getattr(model, name) == value)
+    
+    cursor = request.args.get('cursor')
+    if cursor:
+        try:
+            last_key = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+            if not isinstance(last_key, list) or len(last_key) != len(columns):
+                raise ValueError(cursor)
+        except (ValueError, TypeError):
+            return jsonify({
+                'success': False,
+                'error': 'Invalid cursor'
+            }), 400
+        query = query.filter(db.tuple_(*columns) > db.tuple_(*last_key))
+    
+    rows = query.order_by(*columns).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    
+    next_cursor = None
+    if has_more:
+        last_key = [getattr(rows[-1], name) for name in order_columns]
+        next_cursor = base64.urlsafe_b64encode(json.dumps(last_key).encode()).decode()
+    
+    return jsonify({
+        'success': True,
+        'assessment_type': assessment_type,
+        'results': [row.to_dict() for row in rows],
+        'limit': limit,
+        'next_cursor': next_cursor
+    }), 200
\ No newline at end of file
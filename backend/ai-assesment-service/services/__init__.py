@@ -1,4 +1,5 @@
-from .openai_client import OpenAIClient
+from .openai_client import OpenAIClient, AsyncOpenAIClient
 from .assessment_processor import AssessmentProcessor
+from .async_assessment_processor import AsyncAssessmentProcessor
 
-__all__ = ['OpenAIClient', 'AssessmentProcessor']
\ No newline at end of file
+__all__ = ['OpenAIClient', 'AsyncOpenAIClient', 'AssessmentProcessor', 'AsyncAssessmentProcessor']
\ No newline at end of file
@@ -0,0 +1,149 @@
+import logging
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, Any, List, Tuple
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Fallback mapping when a job configures nothing for an area: first keyword found in the area name wins
+DEFAULT_AREA_FIELDS = [
+    ('personal', ['personal_information']),
+    ('address', ['address']),
+    ('education', ['education']),
+    ('experience', ['professional_experience']),
+    ('years', ['years_of_experience']),
+    ('computer', ['computer_proficiency']),
+    ('public', ['public_sector_employment']),
+    ('language', ['language_proficiency']),
+    ('skill', ['additional_skills']),
+    ('other', ['other_information']),
+    ('certification', ['certification_statement'])
+]
+
+class CompiledAreaFields:
+    """
+    Area -> candidate field paths for one job, resolved once per loaded criteria set.
+    Keyed by area name: the mapping only depends on the area, and criteria ids are not
+    unique across the minimum qualification and formal assessment tables.
+    """
+    def __init__(self, job_id: int, fields_by_area: Dict[str, Tuple[str, ...]],
+                 job_mapping: Dict[str, Tuple[str, ...]], mapper: 'AreaFieldMapper'):
+        self.job_id = job_id
+        self.fields_by_area = fields_by_area
+        self._job_mapping = job_mapping
+        self._mapper = mapper
+    
+    def fields_for(self, criterion: dict) -> Tuple[str, ...]:
+        fields = self.fields_by_area.get(_area_key(criterion['area']))
+        if fields is None:
+            fields = self._mapper.resolve(criterion['area'], self._job_mapping)
+        return fields
+    
+    def extract(self, candidate_data: dict, criterion: dict) -> Any:
+        """
+        The slice of candidate data for a criterion: the field's value for a single field,
+        or a {field: value} object for several
+        """
+        fields = self.fields_for(criterion)
+        if not fields:
+            return self._mapper.unmapped(self.job_id, criterion['area'], candidate_data)
+        
+        if len(fields) == 1:
+            found, value = _lookup(candidate_data, fields[0])
+            return value if found else ''
+        
+        sliced = {}
+        for field in fields:
+            found, value = _lookup(candidate_data, field)
+            if found:
+                sliced[field] = value
+        return sliced
+
+class AreaFieldMapper:
+    """
+    Compiles each job's area -> candidate field mapping (the job's area_field_mapping,
+    then DEFAULT_AREA_FIELDS) once per criteria payload instead of matching area names
+    for every prompt. Areas that map to nothing are counted and logged, and get the
+    whole application unless AREA_FIELDS_UNMAPPED_FALLBACK='none'.
+    """
+    def __init__(self, max_jobs: int):
+        self.max_jobs = max_jobs
+        self._compiled = OrderedDict()
+        self._unmapped = Counter()
+        self._lock = threading.Lock()
+    
+    def compile(self, job_id: int, bundle: dict) -> CompiledAreaFields:
+        """
+        Compiled mapping for a job's criteria, reused while the same bundle payload is cached
+        """
+        with self._lock:
+            entry = self._compiled.get(job_id)
+            if entry is not None and entry[0] is bundle:
+                self._compiled.move_to_end(job_id)
+                return entry[1]
+        
+        job_mapping = {
+            _area_key(area): tuple(fields)
+            for area, fields in ((bundle.get('job') or {}).get('area_field_mapping') or {}).items()
+        }
+        fields_by_area = {}
+        for criterion in (bundle.get('min_qualification_criteria') or []) + (bundle.get('formal_assessment_criteria') or []):
+            area_key = _area_key(criterion['area'])
+            if area_key in fields_by_area:
+                continue
+            
+            fields = self.resolve(criterion['area'], job_mapping)
+            fields_by_area[area_key] = fields
+            if not fields:
+                logger.warning("Job %s area '%s' maps to no candidate fields", job_id, criterion['area'])
+        
+        compiled = CompiledAreaFields(job_id, fields_by_area, job_mapping, self)
+        with self._lock:
+            self._compiled[job_id] = (bundle, compiled)
+            self._compiled.move_to_end(job_id)
+            while len(self._compiled) > self.max_jobs:
+                self._compiled.popitem(last=False)
+        return compiled
+    
+    def resolve(self, area: str, job_mapping: Dict[str, Tuple[str, ...]]) -> Tuple[str, ...]:
+        area_lower = _area_key(area)
+        if area_lower in job_mapping:
+            return job_mapping[area_lower]
+        
+        for keyword, fields in DEFAULT_AREA_FIELDS:
+            if keyword in area_lower:
+                return tuple(fields)
+        return ()
+    
+    def unmapped(self, job_id: int, area: str, candidate_data: dict) -> Any:
+        """
+        Count an extraction for an unmapped area and send the whole candidate,
+        or nothing with AREA_FIELDS_UNMAPPED_FALLBACK='none'
+        """
+        with self._lock:
+            self._unmapped[(job_id, area)] += 1
+        return '' if Config.AREA_FIELDS_UNMAPPED_FALLBACK == 'none' else candidate_data
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'compiled_jobs': len(self._compiled),
+                'unmapped_extractions': sum(self._unmapped.values()),
+                'unmapped_areas': [
+                    {'job_id': job_id, 'area': area, 'count': count}
+                    for (job_id, area), count in self._unmapped.most_common(50)
+                ]
+            }
+
+def _area_key(area: str) -> str:
+    return area.strip().lower()
+
+def _lookup(data: Any, path: str) -> Tuple[bool, Any]:
+    for key in path.split('.'):
+        if not isinstance(data, dict) or key not in data:
+            return False, None
+        data = data[key]
+    return True, data
+
+area_field_mapper = AreaFieldMapper(max_jobs=Config.JOB_DATA_CACHE_MAX_ENTRIES)
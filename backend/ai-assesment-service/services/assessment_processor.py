@@ -1,59 +1,105 @@
+import hashlib
 import json
 import logging
 from typing import Dict, List, Any, Optional
 from datetime import datetime
-import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from services.openai_client import OpenAIClient
+from services.job_data_cache import job_data_cache
+from services.usage_recorder import usage_recorder
+from services.rule_engine import rule_engine
+from services.prompt_budget import prompt_budget
+from services.area_fields import area_field_mapper, CompiledAreaFields
+from services.idempotency import assessment_registry
 from utils.prompts import (
     SYSTEM_PROMPT_MIN_QUALIFICATION,
+    SYSTEM_PROMPT_MIN_QUALIFICATION_MULTI_AREA,
     SYSTEM_PROMPT_FORMAL_ASSESSMENT
 )
 from config import Config
-from models import UsageTracking
 from models.min_qualification_results import MinQualificationResult
 from models.formal_assessment_results import FormalAssessmentResult
 from utils.database import db
+from utils.http import get_http_session
+
+# What a criterion's result depends on (order and ids don't change an area's outcome)
+CRITERIA_HASH_FIELDS = ['area', 'criteria', 'explanation', 'max_score', 'rule']
+
+def criteria_content_hash(criterion: dict) -> str:
+    """
+    Hash of a criterion's content, stored with each result so a reassessment can tell whether the
+    result still applies even if the criteria id was reused for different content
+    """
+    content = json.dumps(
+        {field: criterion.get(field) for field in CRITERIA_HASH_FIELDS},
+        sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
 
 class AssessmentProcessor:
-    def __init__(self):
+    def __init__(self, max_concurrency: Optional[int] = None):
         self.openai_client = OpenAIClient()
         self.job_service_url = Config.JOB_MANAGEMENT_SERVICE_URL
+        self.max_concurrency = max_concurrency or Config.ASSESSMENT_MAX_CONCURRENCY
     
     def fetch_job_data(self, job_id: int) -> Dict[str, Any]:
         """
         Fetch job data from job management service
         """
-        try:
-            response = requests.get(f"{self.job_service_url}/api/jobs/{job_id}")
-            if response.status_code == 200:
-                return response.json()
-            else:
-                return None
-        except Exception as e:
-            return None
+        return self._fetch_cached(f"job:{job_id}", f"{self.job_service_url}/api/jobs/{job_id}")
     
     def fetch_job_criteria(self, job_id: int) -> Dict[str, Any]:
         """
         Fetch job criteria from job management service
         """
+        return self._fetch_cached(f"criteria:{job_id}", f"{self.job_service_url}/api/jobs/{job_id}/criteria")
+    
+    def fetch_assessment_bundle(self, job_id: int) -> Dict[str, Any]:
+        """
+        Fetch job data and both ordered criteria lists in a single request
+        """
+        return self._fetch_cached(f"bundle:{job_id}", f"{self.job_service_url}/api/jobs/{job_id}/assessment-bundle")
+    
+    def _fetch_cached(self, cache_key: str, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Serve from the job data cache, revalidating stale entries with a conditional GET
+        """
+        payload = job_data_cache.get_fresh(cache_key)
+        if payload is not None:
+            return payload
+        
         try:
-            response = requests.get(f"{self.job_service_url}/api/jobs/{job_id}/criteria")
-            if response.status_code == 200:
-                return response.json()
-            else:
-                return None
+            response = get_http_session().get(
+                url,
+                headers=job_data_cache.validators(cache_key),
+                timeout=Config.SERVICE_HTTP_TIMEOUT
+            )
+            return self._handle_fetch_response(cache_key, response.status_code, response.json, response.headers)
         except Exception as e:
             return None
     
-    def process_min_qualification_assessment(self, job_id: int, candidate_id: str, candidate_data: dict) -> Dict[str, Any]:
+    def _handle_fetch_response(self, cache_key: str, status_code: int, read_json, headers) -> Optional[Dict[str, Any]]:
+        if status_code == 304:
+            return job_data_cache.revalidate(cache_key)
+        if status_code == 200:
+            payload = read_json()
+            job_data_cache.store(cache_key, payload, headers.get('ETag'), headers.get('Last-Modified'))
+            return payload
+        return None
+    
+    def process_min_qualification_assessment(self, job_id: int, candidate_id: str, candidate_data: dict,
+                                             evaluation_mode: str = None, fail_fast: bool = None,
+                                             on_area_result=None) -> Dict[str, Any]:
         """
-        Process minimum qualification assessment area by area
+        Process minimum qualification assessment area by area, or several areas per call in multi_area mode.
+        With fail_fast, areas are evaluated most-failed first and evaluation stops at the first FAIL.
+        on_area_result, if given, receives each area's result as soon as it is known.
         """
         start_time = datetime.now()
         
         try:
             # Fetch job criteria
-            criteria_data = self.fetch_job_criteria(job_id)
+            criteria_data = self.fetch_assessment_bundle(job_id)
             if not criteria_data:
                 return {"success": False, "error": "Failed to fetch job criteria"}
             
@@ -61,212 +107,772 @@ class AssessmentProcessor:
             if not min_qual_criteria:
                 return {"success": False, "error": "No minimum qualification criteria found"}
             
-            results = []
-            overall_pass = True
+            evaluation_mode = evaluation_mode or Config.MIN_QUAL_EVALUATION_MODE
+            fail_fast = Config.MIN_QUAL_FAIL_FAST if fail_fast is None else fail_fast
             
-            # Process each area separately
-            for criterion in min_qual_criteria:
-                area = criterion['area']
-                
-                # Get candidate data for this specific area
-                area_data = self._extract_area_data(candidate_data, area)
-                
-                # Build area-specific prompt
-                prompt = self._build_min_qual_area_prompt(criterion, area_data)
-                
-                # Generate AI assessment for this area
-                ai_response = self.openai_client.generate_completion(
-                    prompt=prompt,
-                    system_prompt=SYSTEM_PROMPT_MIN_QUALIFICATION
+            # Identical requests against unchanged criteria replay the stored result
+            fingerprint = assessment_registry.fingerprint(
+                "min_qualification", job_id, candidate_id, candidate_data, min_qual_criteria,
+                {"evaluation_mode": evaluation_mode, "fail_fast": fail_fast}
+            )
+            result = assessment_registry.run(
+                fingerprint, {"assessment_type": "min_qualification", "job_id": job_id, "candidate_id": candidate_id},
+                lambda: self._assess_min_qualification(
+                    job_id, candidate_id, candidate_data, criteria_data, min_qual_criteria, evaluation_mode,
+                    fail_fast, on_area_result, start_time
                 )
-                
-                if not ai_response["success"]:
-                    overall_pass = False
-                    continue
-                
-                content = ai_response["content"]
-                result = content.get("result", "FAIL")
-                
-                # Save result to database
-                area_result = MinQualificationResult(
-                    job_id=job_id,
-                    candidate_id=candidate_id,
-                    criteria_id=criterion['id'],
-                    area=area,
-                    result=result,
-                    justification=content.get("justification", ""),
-                    evidence_found=content.get("evidence_found", "")
-                )
-                
-                db.session.add(area_result)
-                results.append(area_result.to_dict())
-                
-                if result == "FAIL":
-                    overall_pass = False
-                
-                # Track usage for this area
-                if Config.TRACK_USAGE:
-                    UsageTracking.log_usage(
-                        job_id=job_id,
-                        assessment_type="min_qualification",
-                        usage_data=ai_response["usage"],
-                        success=True,
-                        candidate_id=candidate_id
-                    )
+            )
+            if result.get("idempotent_replay"):
+                self._replay_area_results(result, on_area_result)
+            return result
+        
+        except Exception as e:
+            db.session.rollback()
+            return {"success": False, "error": str(e)}
+    
+    def _assess_min_qualification(self, job_id: int, candidate_id: str, candidate_data: dict, criteria_data: dict,
+                                  min_qual_criteria: List[dict], evaluation_mode: str, fail_fast: bool,
+                                  on_area_result, start_time: datetime) -> Dict[str, Any]:
+        # Build every prompt up front, then fan out the LLM calls
+        min_qual_criteria = self._order_min_qual_criteria(job_id, min_qual_criteria, fail_fast)
+        rule_pairs, min_qual_criteria = self._apply_rules(min_qual_criteria, candidate_data)
+        area_fields = area_field_mapper.compile(job_id, criteria_data)
+        prompts, system_prompt = self._plan_min_qual_calls(
+            min_qual_criteria, candidate_data, evaluation_mode, area_fields
+        )
+        # Stream callers get rule results right away and LLM results as each call finishes
+        on_response = self._min_qual_emitter(
+            job_id, candidate_id, self._call_groups(min_qual_criteria, evaluation_mode), evaluation_mode,
+            on_area_result
+        )
+        if on_area_result:
+            self._emit_min_qual_areas(job_id, candidate_id, rule_pairs, on_area_result)
+        
+        if fail_fast and self._rules_failed(rule_pairs):
+            call_responses = []
+        elif fail_fast:
+            call_responses = self._run_until_fail(prompts, system_prompt, evaluation_mode, on_response)
+        else:
+            call_responses = self._run_completions(prompts, system_prompt, on_response)
+        
+        result = self._finish_min_qualification(
+            job_id, candidate_id, min_qual_criteria, evaluation_mode, fail_fast, call_responses, start_time,
+            rule_pairs
+        )
+        result["prompt_tokens"] = self._prompt_token_report(
+            prompts, self._call_groups(min_qual_criteria, evaluation_mode)
+        )
+        return result
+    
+    def _finish_min_qualification(self, job_id: int, candidate_id: str, criteria: List[dict], evaluation_mode: str,
+                                  fail_fast: bool, call_responses: List[dict], start_time: datetime,
+                                  rule_pairs: List[tuple] = ()) -> Dict[str, Any]:
+        """
+        Save the rule-evaluated and LLM-evaluated areas and report the areas a fail-fast run skipped
+        """
+        evaluated = self._evaluated_criteria(criteria, evaluation_mode, len(call_responses))
+        ai_responses = self._min_qual_area_responses(evaluated, evaluation_mode, call_responses)
+        
+        # Report areas in criteria order, whatever order they were evaluated in
+        evaluated_pairs = sorted(
+            list(rule_pairs) + list(zip(evaluated, ai_responses)),
+            key=lambda pair: pair[0].get('order_index') or 0
+        )
+        result = self._collect_min_qualification_results(
+            job_id, candidate_id, [c for c, _ in evaluated_pairs], [r for _, r in evaluated_pairs], start_time
+        )
+        result["usage_summary"] = self._summarize_usage(evaluation_mode, call_responses)
+        result["usage_summary"]["rule_evaluated_areas"] = len(rule_pairs)
+        
+        if fail_fast:
+            result["fail_fast"] = True
+            result["skipped_areas"] = [
+                {"criteria_id": criterion['id'], "area": criterion['area']}
+                for criterion in criteria[len(evaluated):]
+            ]
+        return result
+    
+    def _collect_min_qualification_results(self, job_id: int, candidate_id: str, criteria: List[dict],
+                                           ai_responses: List[dict], start_time: datetime) -> Dict[str, Any]:
+        """
+        Save per-area minimum qualification results and aggregate the overall PASS/FAIL
+        """
+        result_rows = []
+        failed_areas = []
+        overall_pass = True
+        
+        for criterion, ai_response in zip(criteria, ai_responses):
+            area = criterion['area']
             
-            db.session.commit()
+            if not ai_response["success"]:
+                overall_pass = False
+                failed_areas.append({"criteria_id": criterion['id'], "area": area, "error": ai_response.get("error")})
+                continue
             
-            processing_time = int((datetime.now() - start_time).total_seconds() * 1000)
+            # Queue the row for a single bulk insert
+            area_result = self._min_qual_result_values(job_id, candidate_id, criterion, ai_response)
+            result_rows.append(area_result)
             
-            return {
-                "success": True,
-                "assessment_type": "min_qualification",
-                "job_id": job_id,
-                "candidate_id": candidate_id,
-                "overall_result": "PASS" if overall_pass else "FAIL",
-                "area_results": results,
-                "processing_time_ms": processing_time
-            }
+            if area_result['result'] == "FAIL":
+                overall_pass = False
             
-        except Exception as e:
-            db.session.rollback()
-            return {"success": False, "error": str(e)}
+            # Track usage for this area (multi-area calls carry their usage on the first area only)
+            if Config.TRACK_USAGE and ai_response["usage"]:
+                usage_recorder.record(
+                    job_id=job_id,
+                    assessment_type="min_qualification",
+                    usage_data=ai_response["usage"],
+                    success=True,
+                    candidate_id=candidate_id,
+                    cached=ai_response.get("cached", False),
+                    model=ai_response.get("model")
+                )
+        
+        results = self._insert_results(MinQualificationResult, result_rows)
+        db.session.commit()
+        
+        processing_time = int((datetime.now() - start_time).total_seconds() * 1000)
+        
+        return {
+            "success": True,
+            "assessment_type": "min_qualification",
+            "job_id": job_id,
+            "candidate_id": candidate_id,
+            "overall_result": "PASS" if overall_pass else "FAIL",
+            "area_results": results,
+            "failed_areas": failed_areas,
+            "processing_time_ms": processing_time
+        }
     
-    def process_formal_assessment(self, job_id: int, candidate_id: str, candidate_data: dict) -> Dict[str, Any]:
+    def process_formal_assessment(self, job_id: int, candidate_id: str, candidate_data: dict,
+                                  on_area_result=None) -> Dict[str, Any]:
         """
         Process formal assessment area by area
         """
         start_time = datetime.now()
         
         try:
-            # Fetch job data and criteria
-            job_data = self.fetch_job_data(job_id)
-            if not job_data:
+            # Fetch job data and criteria in one round trip
+            bundle = self.fetch_assessment_bundle(job_id)
+            if not bundle:
                 return {"success": False, "error": "Failed to fetch job data"}
             
-            criteria_data = self.fetch_job_criteria(job_id)
-            if not criteria_data:
-                return {"success": False, "error": "Failed to fetch job criteria"}
-            
-            formal_criteria = criteria_data.get('formal_assessment_criteria', [])
+            job_data = bundle['job']
+            formal_criteria = bundle.get('formal_assessment_criteria', [])
             if not formal_criteria:
                 return {"success": False, "error": "No formal assessment criteria found"}
             
-            results = []
-            total_score = 0
-            total_max_score = 0
-            
-            # Process each area separately
-            for criterion in formal_criteria:
-                area = criterion['area']
-                max_score = float(criterion['max_score'])
-                
-                # Get candidate data for this specific area
-                area_data = self._extract_area_data(candidate_data, area)
-                
-                # Build area-specific prompt (experience needs job description)
-                if area.lower() == 'professional experience':
-                    prompt = self._build_formal_experience_prompt(criterion, area_data, job_data)
-                else:
-                    prompt = self._build_formal_area_prompt(criterion, area_data)
-                
-                # Generate AI assessment for this area
-                ai_response = self.openai_client.generate_completion(
-                    prompt=prompt,
-                    system_prompt=SYSTEM_PROMPT_FORMAL_ASSESSMENT
+            # Identical requests against unchanged criteria replay the stored result
+            fingerprint = assessment_registry.fingerprint(
+                "formal_assessment", job_id, candidate_id, candidate_data, formal_criteria,
+                {"job_description": job_data.get('description')}
+            )
+            result = assessment_registry.run(
+                fingerprint, {"assessment_type": "formal_assessment", "job_id": job_id, "candidate_id": candidate_id},
+                lambda: self._assess_formal(
+                    job_id, candidate_id, candidate_data, bundle, formal_criteria, on_area_result, start_time
                 )
-                
-                if not ai_response["success"]:
-                    continue
-                
-                content = ai_response["content"]
-                raw_score = min(float(content.get("raw_score", 0)), max_score)
-                percentage = (raw_score / max_score * 100) if max_score > 0 else 0
-                
-                # Save result to database
-                area_result = FormalAssessmentResult(
+            )
+            if result.get("idempotent_replay"):
+                self._replay_area_results(result, on_area_result)
+            return result
+        
+        except Exception as e:
+            db.session.rollback()
+            return {"success": False, "error": str(e)}
+    
+    def _assess_formal(self, job_id: int, candidate_id: str, candidate_data: dict, bundle: dict,
+                       formal_criteria: List[dict], on_area_result, start_time: datetime) -> Dict[str, Any]:
+        job_data = bundle['job']
+        # Build every area prompt up front, then fan out the LLM calls
+        formal_criteria = self._order_criteria(formal_criteria)
+        area_fields = area_field_mapper.compile(job_id, bundle)
+        prompts = self._build_formal_prompts(formal_criteria, candidate_data, job_data, area_fields)
+        ai_responses = self._run_completions(
+            prompts, SYSTEM_PROMPT_FORMAL_ASSESSMENT,
+            self._formal_emitter(job_id, candidate_id, formal_criteria, on_area_result)
+        )
+        
+        result = self._collect_formal_results(
+            job_id, candidate_id, formal_criteria, ai_responses, start_time
+        )
+        result["prompt_tokens"] = self._prompt_token_report(
+            prompts, [[criterion] for criterion in formal_criteria]
+        )
+        return result
+    
+    def _collect_formal_results(self, job_id: int, candidate_id: str, criteria: List[dict],
+                                ai_responses: List[dict], start_time: datetime) -> Dict[str, Any]:
+        """
+        Save per-area formal assessment results and aggregate the overall score
+        """
+        result_rows = []
+        failed_areas = []
+        
+        for criterion, ai_response in zip(criteria, ai_responses):
+            area = criterion['area']
+            
+            if not ai_response["success"]:
+                failed_areas.append({"criteria_id": criterion['id'], "area": area, "error": ai_response.get("error")})
+                continue
+            
+            # Queue the row for a single bulk insert
+            result_rows.append(self._formal_result_values(job_id, candidate_id, criterion, ai_response))
+            
+            # Track usage for this area
+            if Config.TRACK_USAGE:
+                usage_recorder.record(
                     job_id=job_id,
+                    assessment_type="formal_assessment",
+                    usage_data=ai_response["usage"],
+                    success=True,
                     candidate_id=candidate_id,
-                    criteria_id=criterion['id'],
-                    area=area,
-                    raw_score=raw_score,
-                    max_score=max_score,
-                    percentage=percentage,
-                    evidence=content.get("evidence", ""),
-                    justification=content.get("justification", "")
+                    cached=ai_response.get("cached", False),
+                    model=ai_response.get("model")
                 )
+        
+        results = self._insert_results(FormalAssessmentResult, result_rows)
+        db.session.commit()
+        
+        processing_time = int((datetime.now() - start_time).total_seconds() * 1000)
+        
+        return {
+            "success": True,
+            "assessment_type": "formal_assessment",
+            "job_id": job_id,
+            "candidate_id": candidate_id,
+            # Same shape as a reassessment's overall score
+            "overall_score": self._overall_score(results),
+            "area_results": results,
+            "failed_areas": failed_areas,
+            "processing_time_ms": processing_time
+        }
+    
+    def reassess_candidate(self, assessment_type: str, job_id: int, candidate_id: str,
+                           candidate_data: dict) -> Dict[str, Any]:
+        """
+        Re-evaluate only the areas whose criteria changed (or were added) since the candidate's
+        latest results, reuse the stored results of the other areas and recompute the overall result
+        """
+        start_time = datetime.now()
+        
+        try:
+            bundle = self.fetch_assessment_bundle(job_id)
+            if not bundle:
+                return {"success": False, "error": "Failed to fetch job criteria"}
+            
+            if assessment_type == "min_qualification":
+                model, criteria_key = MinQualificationResult, 'min_qualification_criteria'
+            else:
+                model, criteria_key = FormalAssessmentResult, 'formal_assessment_criteria'
+            criteria = self._order_criteria(bundle.get(criteria_key, []))
+            if not criteria:
+                return {"success": False, "error": "No criteria found"}
+            
+            current = self._latest_results(model, job_id, candidate_id)
+            stale = [criterion for criterion in criteria if self._is_stale(current.get(criterion['id']), criterion)]
+            
+            area_fields = area_field_mapper.compile(job_id, bundle)
+            if assessment_type == "min_qualification":
+                pairs = self._reevaluate_min_qualification(stale, candidate_data, area_fields)
+                build_values = self._min_qual_result_values
+            else:
+                prompts = self._build_formal_prompts(stale, candidate_data, bundle['job'], area_fields)
+                pairs = list(zip(stale, self._run_completions(prompts, SYSTEM_PROMPT_FORMAL_ASSESSMENT)))
+                build_values = self._formal_result_values
+            
+            result_rows = []
+            failed_areas = []
+            for criterion, area_response in pairs:
+                if not area_response["success"]:
+                    failed_areas.append({
+                        "criteria_id": criterion['id'], "area": criterion['area'], "error": area_response.get("error")
+                    })
+                    continue
                 
-                db.session.add(area_result)
-                results.append(area_result.to_dict())
-                
-                total_score += raw_score
-                total_max_score += max_score
-                
-                # Track usage for this area
-                if Config.TRACK_USAGE:
-                    UsageTracking.log_usage(
+                result_rows.append(build_values(job_id, candidate_id, criterion, area_response))
+                if Config.TRACK_USAGE and area_response.get("usage"):
+                    usage_recorder.record(
                         job_id=job_id,
-                        assessment_type="formal_assessment",
-                        usage_data=ai_response["usage"],
+                        assessment_type=assessment_type,
+                        usage_data=area_response["usage"],
                         success=True,
-                        candidate_id=candidate_id
+                        candidate_id=candidate_id,
+                        cached=area_response.get("cached", False),
+                        model=area_response.get("model")
                     )
             
+            for row in self._insert_results(model, result_rows):
+                current[row['criteria_id']] = row
             db.session.commit()
             
-            # Calculate overall score
-            overall_percentage = (total_score / total_max_score * 100) if total_max_score > 0 else 0
-            processing_time = int((datetime.now() - start_time).total_seconds() * 1000)
-            
-            return {
+            area_results = [current[criterion['id']] for criterion in criteria if criterion['id'] in current]
+            result = {
                 "success": True,
-                "assessment_type": "formal_assessment",
+                "assessment_type": assessment_type,
                 "job_id": job_id,
                 "candidate_id": candidate_id,
-                "overall_score": {
-                    "total_score": round(total_score, 2),
-                    "total_max_score": round(total_max_score, 2),
-                    "percentage": round(overall_percentage, 2),
-                    "grade": grade
-                },
-                "area_results": results,
-                "processing_time_ms": processing_time
+                "area_results": area_results,
+                "reassessed_areas": len(result_rows),
+                "reused_areas": len(criteria) - len(stale),
+                "failed_areas": failed_areas,
+                "processing_time_ms": int((datetime.now() - start_time).total_seconds() * 1000)
             }
-            
+            if assessment_type == "min_qualification":
+                all_passed = len(area_results) == len(criteria) and all(r['result'] == "PASS" for r in area_results)
+                result["overall_result"] = "PASS" if all_passed else "FAIL"
+            else:
+                result["overall_score"] = self._overall_score(area_results)
+            return result
+        
         except Exception as e:
             db.session.rollback()
             return {"success": False, "error": str(e)}
     
-    def _extract_area_data(self, candidate_data: dict, area: str) -> str:
-        """
-        Extract relevant data for specific area
-        """
-        area_lower = area.lower()
-        
-        if 'personal' in area_lower:
-            return candidate_data.get('personal_information', '')
-        elif 'address' in area_lower:
-            return candidate_data.get('address', '')
-        elif 'education' in area_lower:
-            return candidate_data.get('education', '')
-        elif 'experience' in area_lower:
-            return candidate_data.get('professional_experience', '')
-        elif 'years' in area_lower:
-            return candidate_data.get('years_of_experience', '')
-        elif 'computer' in area_lower:
-            return candidate_data.get('computer_proficiency', '')
-        elif 'public' in area_lower:
-            return candidate_data.get('public_sector_employment', '')
-        elif 'language' in area_lower:
-            return candidate_data.get('language_proficiency', '')
-        elif 'skill' in area_lower:
-            return candidate_data.get('additional_skills', '')
-        elif 'other' in area_lower:
-            return candidate_data.get('other_information', '')
-        elif 'certification' in area_lower:
-            return candidate_data.get('certification_statement', '')
+    def _latest_results(self, model, job_id: int, candidate_id: str) -> Dict[int, Dict[str, Any]]:
+        """
+        The candidate's most recent stored result per criteria_id
+        """
+        rows = model.query.filter_by(job_id=job_id, candidate_id=candidate_id).order_by(model.id).all()
+        return {row.criteria_id: row.to_dict() for row in rows}
+    
+    def _is_stale(self, stored_result: Optional[Dict[str, Any]], criterion: dict) -> bool:
+        if stored_result is None:
+            return True
+        # Ids can be reused for new criteria (SQLite reuses the highest rowid after a delete),
+        # so the content hash decides; rows stored before it existed fall back to the version,
+        # and rows stored before criteria were versioned were assessed against the first version
+        if stored_result.get('criteria_hash'):
+            return stored_result['criteria_hash'] != criteria_content_hash(criterion)
+        return (stored_result.get('criteria_version') or 1) != (criterion.get('version') or 1)
+    
+    def _reevaluate_min_qualification(self, criteria: List[dict], candidate_data: dict,
+                                      area_fields: CompiledAreaFields) -> List[tuple]:
+        """
+        Evaluate the given areas (rules first, then the LLM) and return (criterion, response) pairs
+        """
+        evaluation_mode = Config.MIN_QUAL_EVALUATION_MODE
+        rule_pairs, llm_criteria = self._apply_rules(criteria, candidate_data)
+        prompts, system_prompt = self._plan_min_qual_calls(llm_criteria, candidate_data, evaluation_mode, area_fields)
+        call_responses = self._run_completions(prompts, system_prompt)
+        area_responses = self._min_qual_area_responses(llm_criteria, evaluation_mode, call_responses)
+        return list(rule_pairs) + list(zip(llm_criteria, area_responses))
+    
+    def _overall_score(self, area_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        total_score = sum(r['raw_score'] or 0 for r in area_results)
+        total_max_score = sum(r['max_score'] or 0 for r in area_results)
+        return {
+            "total_score": round(total_score, 2),
+            "total_max_score": round(total_max_score, 2),
+            "percentage": round(total_score / total_max_score * 100, 2) if total_max_score > 0 else 0
+        }
+    
+    def plan_assessment(self, assessment_type: str, job_id: int, candidate_data: dict, bundle: dict,
+                        evaluation_mode: str = None) -> Dict[str, Any]:
+        """
+        Decide the rule-evaluated areas and build the LLM prompts of one assessment without
+        calling the LLM, so the calls can be submitted through the provider's batch API
+        """
+        area_fields = area_field_mapper.compile(job_id, bundle)
+        if assessment_type == "min_qualification":
+            evaluation_mode = evaluation_mode or Config.MIN_QUAL_EVALUATION_MODE
+            criteria = self._order_criteria(bundle.get('min_qualification_criteria', []))
+            rule_pairs, llm_criteria = self._apply_rules(criteria, candidate_data)
+            prompts, system_prompt = self._plan_min_qual_calls(llm_criteria, candidate_data, evaluation_mode, area_fields)
+            call_groups = self._call_groups(llm_criteria, evaluation_mode)
         else:
-            return str(candidate_data)
+            criteria = self._order_criteria(bundle.get('formal_assessment_criteria', []))
+            rule_pairs = []
+            prompts = self._build_formal_prompts(criteria, candidate_data, bundle['job'], area_fields)
+            system_prompt = SYSTEM_PROMPT_FORMAL_ASSESSMENT
+            call_groups = [[criterion] for criterion in criteria]
+        
+        return {
+            "criteria": criteria,
+            "rule_pairs": rule_pairs,
+            "call_groups": call_groups,
+            "prompts": prompts,
+            "system_prompt": system_prompt,
+            "evaluation_mode": evaluation_mode
+        }
+    
+    def finish_planned_assessment(self, assessment_type: str, job_id: int, candidate_id: str,
+                                  rule_pairs: List[tuple], call_groups: List[List[dict]], evaluation_mode: str,
+                                  call_responses: List[dict], start_time: datetime) -> Dict[str, Any]:
+        """
+        Save the results of a planned assessment once its call responses are known
+        """
+        if assessment_type == "min_qualification":
+            llm_criteria = [criterion for group in call_groups for criterion in group]
+            return self._finish_min_qualification(
+                job_id, candidate_id, llm_criteria, evaluation_mode, False, call_responses, start_time, rule_pairs
+            )
+        
+        return self._collect_formal_results(
+            job_id, candidate_id, [group[0] for group in call_groups], call_responses, start_time
+        )
+    
+    def _replay_area_results(self, result: Dict[str, Any], on_area_result):
+        """
+        Stream the stored areas of a replayed assessment
+        """
+        if on_area_result is None:
+            return
+        for area_result in result.get("area_results", []):
+            on_area_result({"success": True, "result": area_result})
+    
+    def _insert_results(self, model, rows: List[dict]) -> List[Dict[str, Any]]:
+        """
+        Insert result rows in one statement and return their dicts with database ids and timestamps
+        """
+        if not rows:
+            return []
+        
+        inserted = db.session.scalars(db.insert(model).returning(model, sort_by_parameter_order=True), rows)
+        return [result.to_dict() for result in inserted]
+    
+    def _min_qual_result_values(self, job_id: int, candidate_id: str, criterion: dict,
+                                ai_response: dict) -> Dict[str, Any]:
+        content = ai_response["content"]
+        return {
+            'job_id': job_id,
+            'candidate_id': candidate_id,
+            'criteria_id': criterion['id'],
+            'area': criterion['area'],
+            'criteria_version': criterion.get('version'),
+            'criteria_hash': criteria_content_hash(criterion),
+            'result': content.get("result", "FAIL"),
+            'justification': content.get("justification", ""),
+            'evidence_found': content.get("evidence_found", ""),
+            'evaluation_method': "rule" if ai_response.get("rule_evaluated") else "llm",
+            'created_at': datetime.utcnow()
+        }
+    
+    def _formal_result_values(self, job_id: int, candidate_id: str, criterion: dict,
+                              ai_response: dict) -> Dict[str, Any]:
+        content = ai_response["content"]
+        max_score = float(criterion['max_score'])
+        raw_score = min(float(content.get("raw_score", 0)), max_score)
+        return {
+            'job_id': job_id,
+            'candidate_id': candidate_id,
+            'criteria_id': criterion['id'],
+            'area': criterion['area'],
+            'criteria_version': criterion.get('version'),
+            'criteria_hash': criteria_content_hash(criterion),
+            'raw_score': raw_score,
+            'max_score': max_score,
+            'percentage': (raw_score / max_score * 100) if max_score > 0 else 0,
+            'evidence': content.get("evidence", ""),
+            'justification': content.get("justification", ""),
+            'created_at': datetime.utcnow()
+        }
+    
+    def _area_event(self, criterion: dict, area_response: dict, build_row) -> Dict[str, Any]:
+        """
+        Streamed per-area payload: the result dict as it will be stored, or the area's error
+        """
+        if not area_response["success"]:
+            return {
+                "success": False,
+                "criteria_id": criterion['id'],
+                "area": criterion['area'],
+                "error": area_response.get("error")
+            }
+        return {"success": True, "result": build_row().to_dict()}
+    
+    def _emit_min_qual_areas(self, job_id: int, candidate_id: str, pairs, on_area_result):
+        for criterion, area_response in pairs:
+            on_area_result(self._area_event(
+                criterion, area_response,
+                lambda: MinQualificationResult(
+                    **self._min_qual_result_values(job_id, candidate_id, criterion, area_response)
+                )
+            ))
+    
+    def _min_qual_emitter(self, job_id: int, candidate_id: str, call_groups: List[List[dict]],
+                          evaluation_mode: str, on_area_result):
+        """
+        Completion callback turning each finished call into per-area events
+        """
+        if on_area_result is None:
+            return None
+        
+        def emit(index, call_response):
+            group = call_groups[index]
+            area_responses = self._min_qual_area_responses(group, evaluation_mode, [call_response])
+            self._emit_min_qual_areas(job_id, candidate_id, zip(group, area_responses), on_area_result)
+        
+        return emit
+    
+    def _formal_emitter(self, job_id: int, candidate_id: str, criteria: List[dict], on_area_result):
+        if on_area_result is None:
+            return None
+        
+        def emit(index, call_response):
+            criterion = criteria[index]
+            on_area_result(self._area_event(
+                criterion, call_response,
+                lambda: FormalAssessmentResult(
+                    **self._formal_result_values(job_id, candidate_id, criterion, call_response)
+                )
+            ))
+        
+        return emit
+    
+    def _order_criteria(self, criteria: List[dict]) -> List[dict]:
+        """
+        Order criteria by order_index so results come back in a stable order
+        """
+        return sorted(criteria, key=lambda c: c.get('order_index') or 0)
+    
+    def _order_min_qual_criteria(self, job_id: int, criteria: List[dict], fail_fast: bool) -> List[dict]:
+        """
+        Criteria in order_index order, or for fail-fast runs highest historical FAIL rate first
+        (criteria without enough history keep their order_index position among equals)
+        """
+        criteria = self._order_criteria(criteria)
+        if not fail_fast:
+            return criteria
+        
+        fail_rates = self._fail_rates(job_id)
+        return sorted(criteria, key=lambda c: -fail_rates.get(c['id'], 0.0))
+    
+    def _apply_rules(self, criteria: List[dict], candidate_data: dict):
+        """
+        Decide what the rule engine can from structured candidate fields.
+        Returns (criterion, response) pairs for rule-evaluated areas and the criteria left for the LLM.
+        """
+        if not Config.RULE_ENGINE_ENABLED:
+            return [], criteria
+        
+        rule_pairs = []
+        llm_criteria = []
+        for criterion in criteria:
+            rule = rule_engine.rule_for(criterion, Config.RULE_ENGINE_AUTO_DERIVE)
+            outcome = rule_engine.evaluate(rule, candidate_data) if rule else None
+            if outcome is None:
+                llm_criteria.append(criterion)
+                continue
+            
+            passed, evidence = outcome
+            rule_pairs.append((criterion, {
+                "success": True,
+                "content": {
+                    "result": "PASS" if passed else "FAIL",
+                    "justification": f"Rule evaluated: {rule_engine.describe(rule)}",
+                    "evidence_found": evidence
+                },
+                "usage": None,
+                "rule_evaluated": True
+            }))
+        return rule_pairs, llm_criteria
+    
+    def _rules_failed(self, rule_pairs: List[tuple]) -> bool:
+        return any(response["content"]["result"] == "FAIL" for _, response in rule_pairs)
+    
+    def _fail_rates(self, job_id: int) -> Dict[int, float]:
+        """
+        Per-criterion FAIL rates from min_qualification_results, briefly cached per job
+        """
+        cache_key = f"fail_rates:{job_id}"
+        fail_rates = job_data_cache.get_fresh(cache_key)
+        if fail_rates is None:
+            fail_rates = MinQualificationResult.fail_rates(job_id, Config.MIN_QUAL_FAIL_RATE_MIN_SAMPLES)
+            job_data_cache.store(cache_key, fail_rates, ttl_seconds=Config.MIN_QUAL_FAIL_RATE_TTL_SECONDS)
+        return fail_rates
+    
+    def _run_until_fail(self, prompts: List[str], system_prompt: str, evaluation_mode: str,
+                        on_response=None) -> List[Dict[str, Any]]:
+        """
+        Run completions in waves of MIN_QUAL_FAIL_FAST_WAVE_SIZE and stop after the wave with the first FAIL
+        """
+        wave_size = max(1, Config.MIN_QUAL_FAIL_FAST_WAVE_SIZE)
+        call_responses = []
+        for i in range(0, len(prompts), wave_size):
+            wave = self._run_completions(prompts[i:i + wave_size], system_prompt, self._offset(on_response, i))
+            call_responses.extend(wave)
+            if any(self._has_fail(response, evaluation_mode) for response in wave):
+                break
+        return call_responses
+    
+    def _offset(self, on_response, offset: int):
+        if on_response is None:
+            return None
+        return lambda index, response: on_response(offset + index, response)
+    
+    def _has_fail(self, call_response: dict, evaluation_mode: str) -> bool:
+        """
+        Whether a completion returned a FAIL verdict (errors are not verdicts)
+        """
+        content = call_response.get("content") if call_response.get("success") else None
+        if not isinstance(content, dict):
+            return False
+        
+        items = content.get("results") if evaluation_mode == 'multi_area' else [content]
+        return any(isinstance(item, dict) and item.get("result") == "FAIL" for item in items or [])
+    
+    def _evaluated_criteria(self, criteria: List[dict], evaluation_mode: str, call_count: int) -> List[dict]:
+        """
+        The criteria covered by the first call_count calls of a run
+        """
+        return [criterion for group in self._call_groups(criteria, evaluation_mode)[:call_count] for criterion in group]
+    
+    def _build_min_qual_prompts(self, criteria: List[dict], candidate_data: dict,
+                                area_fields: CompiledAreaFields) -> List[str]:
+        """
+        Build one minimum qualification prompt per criterion
+        """
+        return [
+            self._build_min_qual_area_prompt(criterion, self._extract_area_data(candidate_data, criterion, area_fields))
+            for criterion in criteria
+        ]
+    
+    def _plan_min_qual_calls(self, criteria: List[dict], candidate_data: dict, evaluation_mode: str,
+                             area_fields: CompiledAreaFields):
+        """
+        Return the prompts and system prompt for a minimum qualification run
+        """
+        if evaluation_mode == 'multi_area':
+            prompts = [
+                self._build_min_qual_multi_area_prompt(group, candidate_data, area_fields)
+                for group in self._group_criteria(criteria)
+            ]
+            return prompts, SYSTEM_PROMPT_MIN_QUALIFICATION_MULTI_AREA
+        
+        return self._build_min_qual_prompts(criteria, candidate_data, area_fields), SYSTEM_PROMPT_MIN_QUALIFICATION
+    
+    def _group_criteria(self, criteria: List[dict]) -> List[List[dict]]:
+        """
+        Split criteria into groups of MIN_QUAL_MULTI_AREA_GROUP_SIZE (0 = a single group)
+        """
+        group_size = Config.MIN_QUAL_MULTI_AREA_GROUP_SIZE or len(criteria) or 1
+        return [criteria[i:i + group_size] for i in range(0, len(criteria), group_size)]
+    
+    def _min_qual_area_responses(self, criteria: List[dict], evaluation_mode: str,
+                                 call_responses: List[dict]) -> List[Dict[str, Any]]:
+        """
+        Map completion responses back to one response per criterion
+        """
+        if evaluation_mode != 'multi_area':
+            return call_responses
+        
+        area_responses = []
+        for group, call_response in zip(self._group_criteria(criteria), call_responses):
+            if not call_response["success"]:
+                area_responses.extend(call_response for _ in group)
+                continue
+            
+            # Index the returned array by criteria_id, tolerating ids echoed back as strings
+            by_criteria_id = {}
+            for item in call_response["content"].get("results") or []:
+                try:
+                    by_criteria_id[int(item.get("criteria_id"))] = item
+                except (TypeError, ValueError, AttributeError):
+                    continue
+            
+            for index, criterion in enumerate(group):
+                content = by_criteria_id.get(criterion['id'])
+                if content is None:
+                    area_responses.append({
+                        "success": False,
+                        "error": "Area missing from multi-area response",
+                        "content": None,
+                        "usage": None
+                    })
+                    continue
+                
+                area_responses.append({
+                    "success": True,
+                    "content": content,
+                    "usage": call_response["usage"] if index == 0 else None,
+                    "model": call_response.get("model"),
+                    "cached": call_response.get("cached", False)
+                })
+        
+        return area_responses
+    
+    def _call_groups(self, criteria: List[dict], evaluation_mode: str) -> List[List[dict]]:
+        """
+        The criteria covered by each call of a minimum qualification run
+        """
+        if evaluation_mode == 'multi_area':
+            return self._group_criteria(criteria)
+        return [[criterion] for criterion in criteria]
+    
+    def _prompt_token_report(self, prompts: List[str], call_groups: List[List[dict]]) -> List[Dict[str, Any]]:
+        """
+        Locally counted prompt tokens per call
+        """
+        return [
+            {
+                "criteria_ids": [criterion['id'] for criterion in group],
+                "areas": [criterion['area'] for criterion in group],
+                "prompt_tokens": prompt_budget.count_tokens(prompt)
+            }
+            for prompt, group in zip(prompts, call_groups)
+        ]
+    
+    def _summarize_usage(self, evaluation_mode: str, call_responses: List[dict]) -> Dict[str, Any]:
+        """
+        Token totals per run, for comparing per-area and multi-area evaluation
+        """
+        usages = [r["usage"] for r in call_responses if r.get("usage")]
+        return {
+            "evaluation_mode": evaluation_mode,
+            "llm_calls": len(call_responses),
+            "cached_calls": sum(1 for r in call_responses if r.get("cached")),
+            "prompt_tokens": sum(u.get("prompt_tokens", 0) for u in usages),
+            "completion_tokens": sum(u.get("completion_tokens", 0) for u in usages),
+            "total_tokens": sum(u.get("total_tokens", 0) for u in usages),
+            "rate_limit_wait_ms": sum(r.get("rate_limit_wait_ms", 0) for r in call_responses)
+        }
+    
+    def _build_formal_prompts(self, criteria: List[dict], candidate_data: dict, job_data: dict,
+                              area_fields: CompiledAreaFields) -> List[str]:
+        """
+        Build one formal assessment prompt per criterion (experience needs job description)
+        """
+        prompts = []
+        for criterion in criteria:
+            area_data = self._extract_area_data(candidate_data, criterion, area_fields)
+            if criterion['area'].lower() == 'professional experience':
+                prompts.append(self._build_formal_experience_prompt(criterion, area_data, job_data))
+            else:
+                prompts.append(self._build_formal_area_prompt(criterion, area_data))
+        return prompts
+    
+    def _run_completions(self, prompts: List[str], system_prompt: str, on_response=None) -> List[Dict[str, Any]]:
+        """
+        Run one completion per prompt, at most max_concurrency at a time.
+        Responses are returned in the same order as the prompts; on_response(index, response)
+        is called as each one finishes.
+        """
+        if self.max_concurrency <= 1 or len(prompts) <= 1:
+            responses = []
+            for index, prompt in enumerate(prompts):
+                responses.append(self.openai_client.generate_completion(prompt=prompt, system_prompt=system_prompt))
+                if on_response:
+                    on_response(index, responses[-1])
+            return responses
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(prompts))) as executor:
+            futures = {
+                executor.submit(self.openai_client.generate_completion, prompt=prompt, system_prompt=system_prompt): index
+                for index, prompt in enumerate(prompts)
+            }
+            responses = [None] * len(prompts)
+            for future in as_completed(futures):
+                responses[futures[future]] = future.result()
+                if on_response:
+                    on_response(futures[future], responses[futures[future]])
+            return responses
+    
+    def _extract_area_data(self, candidate_data: dict, criterion: dict, area_fields: CompiledAreaFields) -> Any:
+        """
+        Extract relevant data for specific area, using the job's compiled area-to-field mapping
+        """
+        return area_fields.extract(candidate_data, criterion)
     
     def _build_min_qual_area_prompt(self, criterion: dict, area_data: str) -> str:
         """
@@ -280,7 +886,7 @@ Criteria: {criterion['criteria']}
 {f"Additional Info: {criterion['explanation']}" if criterion.get('explanation') else ""}
 
 Candidate Data for this area:
-{area_data}
+{prompt_budget.fit(area_data)}
 
 Return JSON:
 {{
@@ -288,6 +894,38 @@ Return JSON:
   "justification": "Clear explanation why candidate passes/fails",
   "evidence_found": "Specific evidence from candidate data"
 }}
+"""
+    
+    def _build_min_qual_multi_area_prompt(self, criteria: List[dict], candidate_data: dict,
+                                          area_fields: CompiledAreaFields) -> str:
+        """
+        Build one prompt covering several minimum qualification areas
+        """
+        areas = "\n".join(
+            f"""
+Area {index} (criteria_id: {criterion['id']}): {criterion['area']}
+Criteria: {criterion['criteria']}
+{f"Additional Info: {criterion['explanation']}" if criterion.get('explanation') else ""}
+Candidate Data for this area:
+{prompt_budget.fit(self._extract_area_data(candidate_data, criterion, area_fields))}
+"""
+            for index, criterion in enumerate(criteria, start=1)
+        )
+        
+        return f"""
+Evaluate if the candidate meets the minimum qualification for each of the following areas:
+{areas}
+Return JSON with exactly one entry per area, using the criteria_id given for it:
+{{
+  "results": [
+    {{
+      "criteria_id": 0,
+      "result": "PASS" or "FAIL",
+      "justification": "Clear explanation why candidate passes/fails",
+      "evidence_found": "Specific evidence from candidate data"
+    }}
+  ]
+}}
 """
     
     def _build_formal_area_prompt(self, criterion: dict, area_data: str) -> str:
@@ -303,7 +941,7 @@ Max Score: {criterion['max_score']}
 {f"Additional Info: {criterion['explanation']}" if criterion.get('explanation') else ""}
 
 Candidate Data for this area:
-{area_data}
+{prompt_budget.fit(area_data)}
 
 Return JSON:
 {{
@@ -321,7 +959,7 @@ Return JSON:
 Score the candidate's experience against the job requirements:
 
 Job Title: {job_data.get('title', '')}
-Job Description: {job_data.get('description', '')}
+Job Description: {prompt_budget.truncate(job_data.get('description') or '', Config.PROMPT_JOB_DESCRIPTION_TOKEN_BUDGET)}
 
 Assessment Area: {criterion['area']}
 Criteria: {criterion['criteria']}
@@ -329,7 +967,7 @@ Max Score: {criterion['max_score']}
 {f"Additional Info: {criterion['explanation']}" if criterion.get('explanation') else ""}
 
 Candidate Experience:
-{area_data}
+{prompt_budget.fit(area_data)}
 
 Evaluate how the candidate's experience aligns with the job requirements.
 
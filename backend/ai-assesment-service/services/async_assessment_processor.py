@@ -0,0 +1,238 @@
+import asyncio
+from typing import Dict, List, Any, Optional
+from datetime import datetime
+from services.openai_client import AsyncOpenAIClient
+from services.assessment_processor import AssessmentProcessor
+from services.job_data_cache import job_data_cache
+from services.area_fields import area_field_mapper
+from services.idempotency import assessment_registry
+from utils.prompts import SYSTEM_PROMPT_FORMAL_ASSESSMENT
+from config import Config
+from utils.database import db
+from utils.http import get_async_http_client
+
+class AsyncAssessmentProcessor(AssessmentProcessor):
+    """
+    Asyncio engine for assessments. Area evaluations of every candidate handled by
+    this processor share one concurrency cap, so a bulk screening keeps many LLM
+    calls in flight on a single event loop instead of one thread per call.
+    Result rows are still written through the synchronous session, from a worker thread
+    so the loop keeps serving other assessments meanwhile.
+    """
+    def __init__(self, max_concurrency: Optional[int] = None):
+        self.openai_client = AsyncOpenAIClient()
+        self.job_service_url = Config.JOB_MANAGEMENT_SERVICE_URL
+        self.max_concurrency = max_concurrency or Config.ASYNC_ASSESSMENT_MAX_CONCURRENCY
+        self._semaphore = None
+    
+    async def fetch_job_data(self, job_id: int) -> Dict[str, Any]:
+        """
+        Fetch job data from job management service
+        """
+        return await self._fetch_cached(f"job:{job_id}", f"{self.job_service_url}/api/jobs/{job_id}")
+    
+    async def fetch_job_criteria(self, job_id: int) -> Dict[str, Any]:
+        """
+        Fetch job criteria from job management service
+        """
+        return await self._fetch_cached(f"criteria:{job_id}", f"{self.job_service_url}/api/jobs/{job_id}/criteria")
+    
+    async def fetch_assessment_bundle(self, job_id: int) -> Dict[str, Any]:
+        """
+        Fetch job data and both ordered criteria lists in a single request
+        """
+        return await self._fetch_cached(f"bundle:{job_id}", f"{self.job_service_url}/api/jobs/{job_id}/assessment-bundle")
+    
+    async def _fetch_cached(self, cache_key: str, url: str) -> Optional[Dict[str, Any]]:
+        payload = job_data_cache.get_fresh(cache_key)
+        if payload is not None:
+            return payload
+        
+        try:
+            response = await get_async_http_client().get(url, headers=job_data_cache.validators(cache_key))
+            return self._handle_fetch_response(cache_key, response.status_code, response.json, response.headers)
+        except Exception as e:
+            return None
+    
+    async def process_min_qualification_assessment(self, job_id: int, candidate_id: str, candidate_data: dict,
+                                                   bundle: dict = None, evaluation_mode: str = None,
+                                                   fail_fast: bool = None, on_area_result=None) -> Dict[str, Any]:
+        """
+        Process minimum qualification assessment with all areas evaluated concurrently
+        (in waves that stop at the first FAIL when fail_fast is set).
+        on_area_result, if given, receives each area's result as soon as it is known.
+        """
+        start_time = datetime.now()
+        
+        try:
+            # Fetch job criteria unless already loaded for a batch
+            criteria_data = bundle or await self.fetch_assessment_bundle(job_id)
+            if not criteria_data:
+                return {"success": False, "error": "Failed to fetch job criteria"}
+            
+            min_qual_criteria = criteria_data.get('min_qualification_criteria', [])
+            if not min_qual_criteria:
+                return {"success": False, "error": "No minimum qualification criteria found"}
+            
+            evaluation_mode = evaluation_mode or Config.MIN_QUAL_EVALUATION_MODE
+            fail_fast = Config.MIN_QUAL_FAIL_FAST if fail_fast is None else fail_fast
+            
+            # Identical requests against unchanged criteria replay the stored result
+            fingerprint = assessment_registry.fingerprint(
+                "min_qualification", job_id, candidate_id, candidate_data, min_qual_criteria,
+                {"evaluation_mode": evaluation_mode, "fail_fast": fail_fast}
+            )
+            result = await assessment_registry.run_async(
+                fingerprint, {"assessment_type": "min_qualification", "job_id": job_id, "candidate_id": candidate_id},
+                lambda: self._assess_min_qualification(
+                    job_id, candidate_id, candidate_data, criteria_data, min_qual_criteria, evaluation_mode,
+                    fail_fast, on_area_result, start_time
+                )
+            )
+            if result.get("idempotent_replay"):
+                self._replay_area_results(result, on_area_result)
+            return result
+        
+        except Exception as e:
+            db.session.rollback()
+            return {"success": False, "error": str(e)}
+    
+    async def _assess_min_qualification(self, job_id: int, candidate_id: str, candidate_data: dict,
+                                        criteria_data: dict, min_qual_criteria: List[dict], evaluation_mode: str,
+                                        fail_fast: bool, on_area_result, start_time: datetime) -> Dict[str, Any]:
+        min_qual_criteria = await asyncio.to_thread(
+            self._order_min_qual_criteria, job_id, min_qual_criteria, fail_fast
+        )
+        rule_pairs, min_qual_criteria = self._apply_rules(min_qual_criteria, candidate_data)
+        area_fields = area_field_mapper.compile(job_id, criteria_data)
+        prompts, system_prompt = self._plan_min_qual_calls(
+            min_qual_criteria, candidate_data, evaluation_mode, area_fields
+        )
+        # Stream callers get rule results right away and LLM results as each call finishes
+        on_response = self._min_qual_emitter(
+            job_id, candidate_id, self._call_groups(min_qual_criteria, evaluation_mode), evaluation_mode,
+            on_area_result
+        )
+        if on_area_result:
+            self._emit_min_qual_areas(job_id, candidate_id, rule_pairs, on_area_result)
+        
+        if fail_fast and self._rules_failed(rule_pairs):
+            call_responses = []
+        elif fail_fast:
+            call_responses = await self._run_until_fail(prompts, system_prompt, evaluation_mode, on_response)
+        else:
+            call_responses = await self._run_completions(prompts, system_prompt, on_response)
+        
+        result = await asyncio.to_thread(
+            self._finish_min_qualification, job_id, candidate_id, min_qual_criteria, evaluation_mode, fail_fast,
+            call_responses, start_time, rule_pairs
+        )
+        result["prompt_tokens"] = self._prompt_token_report(
+            prompts, self._call_groups(min_qual_criteria, evaluation_mode)
+        )
+        return result
+    
+    async def process_formal_assessment(self, job_id: int, candidate_id: str, candidate_data: dict,
+                                        bundle: dict = None, on_area_result=None) -> Dict[str, Any]:
+        """
+        Process formal assessment with all areas evaluated concurrently
+        """
+        start_time = datetime.now()
+        
+        try:
+            # Fetch job data and criteria in one round trip unless already loaded for a batch
+            bundle = bundle or await self.fetch_assessment_bundle(job_id)
+            if not bundle:
+                return {"success": False, "error": "Failed to fetch job data"}
+            
+            job_data = bundle['job']
+            formal_criteria = bundle.get('formal_assessment_criteria', [])
+            if not formal_criteria:
+                return {"success": False, "error": "No formal assessment criteria found"}
+            
+            # Identical requests against unchanged criteria replay the stored result
+            fingerprint = assessment_registry.fingerprint(
+                "formal_assessment", job_id, candidate_id, candidate_data, formal_criteria,
+                {"job_description": job_data.get('description')}
+            )
+            result = await assessment_registry.run_async(
+                fingerprint, {"assessment_type": "formal_assessment", "job_id": job_id, "candidate_id": candidate_id},
+                lambda: self._assess_formal(
+                    job_id, candidate_id, candidate_data, bundle, formal_criteria, on_area_result, start_time
+                )
+            )
+            if result.get("idempotent_replay"):
+                self._replay_area_results(result, on_area_result)
+            return result
+        
+        except Exception as e:
+            db.session.rollback()
+            return {"success": False, "error": str(e)}
+    
+    async def _assess_formal(self, job_id: int, candidate_id: str, candidate_data: dict, bundle: dict,
+                             formal_criteria: List[dict], on_area_result, start_time: datetime) -> Dict[str, Any]:
+        job_data = bundle['job']
+        formal_criteria = self._order_criteria(formal_criteria)
+        area_fields = area_field_mapper.compile(job_id, bundle)
+        prompts = self._build_formal_prompts(formal_criteria, candidate_data, job_data, area_fields)
+        ai_responses = await self._run_completions(
+            prompts, SYSTEM_PROMPT_FORMAL_ASSESSMENT,
+            self._formal_emitter(job_id, candidate_id, formal_criteria, on_area_result)
+        )
+        
+        result = await asyncio.to_thread(
+            self._collect_formal_results, job_id, candidate_id, formal_criteria, ai_responses, start_time
+        )
+        result["prompt_tokens"] = self._prompt_token_report(
+            prompts, [[criterion] for criterion in formal_criteria]
+        )
+        return result
+    
+    async def process_formal_batch(self, job_id: int, candidates: List[dict]) -> List[Dict[str, Any]]:
+        """
+        Process formal assessments for several candidates at once.
+        Job data and criteria are fetched once and shared by every candidate.
+        """
+        bundle = await self.fetch_assessment_bundle(job_id)
+        if not bundle:
+            return [{"success": False, "error": "Failed to fetch job data"} for _ in candidates]
+        
+        return await asyncio.gather(*[
+            self.process_formal_assessment(
+                job_id, candidate['candidate_id'], candidate['candidate_data'], bundle=bundle
+            )
+            for candidate in candidates
+        ])
+    
+    async def _run_completions(self, prompts: List[str], system_prompt: str,
+                               on_response=None) -> List[Dict[str, Any]]:
+        """
+        Await one completion per prompt under the shared concurrency cap.
+        Responses are returned in the same order as the prompts; on_response(index, response)
+        is called as each one finishes.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def complete(index, prompt):
+            async with self._semaphore:
+                response = await self.openai_client.generate_completion(prompt=prompt, system_prompt=system_prompt)
+            if on_response:
+                on_response(index, response)
+            return response
+        
+        return list(await asyncio.gather(*[complete(index, prompt) for index, prompt in enumerate(prompts)]))
+    
+    async def _run_until_fail(self, prompts: List[str], system_prompt: str,
+                              evaluation_mode: str, on_response=None) -> List[Dict[str, Any]]:
+        """
+        Await completions in waves of MIN_QUAL_FAIL_FAST_WAVE_SIZE and stop after the wave with the first FAIL
+        """
+        wave_size = max(1, Config.MIN_QUAL_FAIL_FAST_WAVE_SIZE)
+        call_responses = []
+        for i in range(0, len(prompts), wave_size):
+            wave = await self._run_completions(prompts[i:i + wave_size], system_prompt, self._offset(on_response, i))
+            call_responses.extend(wave)
+            if any(self._has_fail(response, evaluation_mode) for response in wave):
+                break
+        return call_responses
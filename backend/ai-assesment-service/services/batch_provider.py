@@ -0,0 +1,157 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Dict, Any, List
+from config import Config
+from utils.http import get_http_session
+
+class BatchProvider(ABC):
+    """
+    Asynchronous batch completion provider. Implementations turn chat completion requests
+    into a provider-side batch job and map its outputs back to OpenAIClient-style responses.
+    """
+    name = None
+    TERMINAL_STATUSES = ('completed', 'failed', 'expired', 'cancelled')
+    
+    @abstractmethod
+    def build_request(self, custom_id: str, prompt: str, system_prompt: str = None) -> Dict[str, Any]:
+        """
+        One provider request line for a chat completion, tagged with custom_id
+        """
+    
+    @abstractmethod
+    def submit(self, requests: List[Dict[str, Any]]) -> str:
+        """
+        Submit the requests as one batch job and return the provider's batch id
+        """
+    
+    @abstractmethod
+    def status(self, provider_batch_id: str) -> Dict[str, Any]:
+        """
+        Current state of a batch job; 'status' is one of TERMINAL_STATUSES once it has finished
+        """
+    
+    @abstractmethod
+    def results(self, state: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Responses of a finished batch job keyed by custom_id
+        """
+
+class OpenAIBatchProvider(BatchProvider):
+    """
+    OpenAI Batch API over plain HTTP (file upload, /batches, output file download).
+    Point BULK_PROVIDER_BASE_URL at a local stand-in server to test without the real API.
+    """
+    name = 'openai'
+    
+    def __init__(self, base_url: str = None, api_key: str = None):
+        self.base_url = (base_url or Config.BULK_PROVIDER_BASE_URL).rstrip('/')
+        self.api_key = api_key or Config.OPENAI_API_KEY
+        self.model = Config.OPENAI_MODEL
+        self.session = get_http_session()
+    
+    def build_request(self, custom_id: str, prompt: str, system_prompt: str = None) -> Dict[str, Any]:
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        
+        return {
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {"model": self.model, "messages": messages, "response_format": {"type": "json_object"}}
+        }
+    
+    def submit(self, requests: List[Dict[str, Any]]) -> str:
+        payload = '\n'.join(json.dumps(request) for request in requests).encode('utf-8')
+        upload = self.session.post(
+            f"{self.base_url}/files",
+            headers=self._headers(),
+            data={'purpose': 'batch'},
+            files={'file': ('assessments.jsonl', payload, 'application/jsonl')},
+            timeout=Config.BULK_PROVIDER_TIMEOUT
+        )
+        upload.raise_for_status()
+        
+        batch = self.session.post(
+            f"{self.base_url}/batches",
+            headers=self._headers(),
+            json={
+                'input_file_id': upload.json()['id'],
+                'endpoint': '/v1/chat/completions',
+                'completion_window': Config.BULK_COMPLETION_WINDOW
+            },
+            timeout=Config.BULK_PROVIDER_TIMEOUT
+        )
+        batch.raise_for_status()
+        return batch.json()['id']
+    
+    def status(self, provider_batch_id: str) -> Dict[str, Any]:
+        response = self.session.get(
+            f"{self.base_url}/batches/{provider_batch_id}",
+            headers=self._headers(),
+            timeout=Config.BULK_PROVIDER_TIMEOUT
+        )
+        response.raise_for_status()
+        return response.json()
+    
+    def results(self, state: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        # Successful requests land in the output file, rejected ones in the error file
+        responses = {}
+        for file_id in (state.get('output_file_id'), state.get('error_file_id')):
+            if not file_id:
+                continue
+            
+            content = self.session.get(
+                f"{self.base_url}/files/{file_id}/content",
+                headers=self._headers(),
+                timeout=Config.BULK_PROVIDER_TIMEOUT
+            )
+            content.raise_for_status()
+            for line in content.text.splitlines():
+                if line.strip():
+                    record = json.loads(line)
+                    responses[record['custom_id']] = self._parse_output(record)
+        return responses
+    
+    def _parse_output(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        response = record.get('response') or {}
+        body = response.get('body') or {}
+        if record.get('error') or response.get('status_code') != 200:
+            error = record.get('error') or body.get('error') or f"HTTP {response.get('status_code')}"
+            return {"success": False, "error": json.dumps(error) if isinstance(error, dict) else str(error),
+                    "content": None, "usage": None}
+        
+        content = body['choices'][0]['message']['content']
+        try:
+            parsed_content = json.loads(content)
+        except json.JSONDecodeError:
+            parsed_content = {"error": "Invalid JSON response", "raw_content": content}
+        
+        usage = body.get('usage') or {}
+        return {
+            "success": True,
+            "content": parsed_content,
+            "usage": {
+                "prompt_tokens": usage.get('prompt_tokens', 0),
+                "completion_tokens": usage.get('completion_tokens', 0),
+                "total_tokens": usage.get('total_tokens', 0),
+                "cost_multiplier": Config.BULK_COST_MULTIPLIER
+            },
+            "model": body.get('model', self.model),
+            "cached": False
+        }
+    
+    def _headers(self) -> Dict[str, str]:
+        return {'Authorization': f'Bearer {self.api_key}'}
+
+# Providers selectable through BULK_PROVIDER
+BATCH_PROVIDERS = {
+    OpenAIBatchProvider.name: OpenAIBatchProvider
+}
+
+def get_batch_provider(name: str = None) -> BatchProvider:
+    name = name or Config.BULK_PROVIDER
+    if name not in BATCH_PROVIDERS:
+        raise ValueError(f"Unknown batch provider: {name}")
+    return BATCH_PROVIDERS[name]()
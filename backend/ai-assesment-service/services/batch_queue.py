@@ -0,0 +1,229 @@
+import json
+import logging
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import List
+from config import Config
+from models.assessment_batch import AssessmentBatch, AssessmentBatchItem
+from services.assessment_processor import AssessmentProcessor
+from utils.database import db
+
+logger = logging.getLogger(__name__)
+
+class BatchQueue:
+    """
+    Database-backed queue for large assessment batches.
+    A dispatcher thread claims pending items and hands them to a bounded worker pool.
+    Items are claimed with a lease, so items left running by a crashed or
+    restarted process are picked up again once the lease expires, up to
+    BATCH_ITEM_MAX_ATTEMPTS claims; after that the item is failed.
+    """
+    def __init__(self):
+        self.app = None
+        self._wakeup = threading.Event()
+        self._slots = None
+        self._executor = None
+    
+    def init_app(self, app):
+        self.app = app
+    
+    def start(self):
+        """
+        Start the dispatcher and worker pool; called in one process only (see utils.background)
+        """
+        if not Config.BATCH_WORKER_ENABLED:
+            return
+        
+        self._slots = threading.BoundedSemaphore(Config.BATCH_WORKER_CONCURRENCY)
+        self._executor = ThreadPoolExecutor(
+            max_workers=Config.BATCH_WORKER_CONCURRENCY,
+            thread_name_prefix='batch-worker'
+        )
+        threading.Thread(target=self._dispatch_loop, name='batch-dispatcher', daemon=True).start()
+    
+    def enqueue(self, job_id: int, assessment_type: str, candidates: List[dict],
+                mode: str = 'assess') -> AssessmentBatch:
+        """
+        Persist a batch and its items, then wake the dispatcher
+        """
+        batch = AssessmentBatch(
+            id=uuid.uuid4().hex,
+            job_id=job_id,
+            assessment_type=assessment_type,
+            mode=mode,
+            status='queued',
+            total_items=len(candidates)
+        )
+        db.session.add(batch)
+        db.session.flush()
+        
+        db.session.execute(db.insert(AssessmentBatchItem), [
+            {
+                'batch_id': batch.id,
+                'item_index': index,
+                'candidate_id': candidate['candidate_id'],
+                'candidate_data': json.dumps(candidate['candidate_data']),
+                'status': 'pending',
+                'attempts': 0,
+                'created_at': datetime.utcnow()
+            }
+            for index, candidate in enumerate(candidates)
+        ])
+        db.session.commit()
+        
+        self._wakeup.set()
+        return batch
+    
+    def _dispatch_loop(self):
+        while True:
+            self._slots.acquire()
+            try:
+                with self.app.app_context():
+                    self._fail_exhausted_items()
+                    item_id = self._claim_next_item()
+            except Exception:
+                logger.exception("Failed to claim batch item")
+                item_id = None
+            
+            if item_id is None:
+                self._slots.release()
+                self._wakeup.wait(timeout=Config.BATCH_POLL_INTERVAL_SECONDS)
+                self._wakeup.clear()
+                continue
+            
+            self._executor.submit(self._run_item, item_id)
+    
+    def _claim_next_item(self):
+        """
+        Atomically move the oldest pending (or lease-expired) item to running
+        """
+        claimable = db.and_(
+            db.or_(
+                AssessmentBatchItem.status == 'pending',
+                db.and_(self._lease_expired(), AssessmentBatchItem.attempts < Config.BATCH_ITEM_MAX_ATTEMPTS)
+            ),
+            self._not_bulk()
+        )
+        
+        try:
+            item = AssessmentBatchItem.query.filter(claimable).order_by(AssessmentBatchItem.id).first()
+            if item is None:
+                return None
+            
+            # Conditional update so two workers cannot claim the same item
+            claimed = AssessmentBatchItem.query.filter(AssessmentBatchItem.id == item.id, claimable).update({
+                'status': 'running',
+                'claimed_at': datetime.utcnow(),
+                'attempts': AssessmentBatchItem.attempts + 1
+            }, synchronize_session=False)
+            AssessmentBatch.query.filter_by(id=item.batch_id, status='queued').update(
+                {'status': 'running'}, synchronize_session=False
+            )
+            db.session.commit()
+            return item.id if claimed else self._claim_next_item()
+        finally:
+            db.session.remove()
+    
+    def _fail_exhausted_items(self):
+        """
+        Fail lease-expired items that already used all their attempts,
+        so an item that keeps crashing its worker isn't retried forever
+        """
+        exhausted = db.and_(
+            self._lease_expired(), AssessmentBatchItem.attempts >= Config.BATCH_ITEM_MAX_ATTEMPTS, self._not_bulk()
+        )
+        
+        try:
+            for item in AssessmentBatchItem.query.filter(exhausted).order_by(AssessmentBatchItem.id).all():
+                attempt = item.attempts
+                if self.finish_item(item, {
+                    "success": False,
+                    "error": f"Gave up after {attempt} attempts; the item did not finish within its lease"
+                }, attempt):
+                    logger.warning("Batch item %s failed after %s attempts", item.id, item.attempts)
+        finally:
+            db.session.remove()
+    
+    @staticmethod
+    def _lease_expired():
+        lease_expired_before = datetime.utcnow() - timedelta(seconds=Config.BATCH_ITEM_LEASE_SECONDS)
+        return db.and_(AssessmentBatchItem.status == 'running', AssessmentBatchItem.claimed_at < lease_expired_before)
+    
+    @staticmethod
+    def _not_bulk():
+        # Bulk batch items are submitted and collected by the bulk assessor
+        return AssessmentBatchItem.batch_id.not_in(db.select(AssessmentBatch.id).where(AssessmentBatch.mode == 'bulk'))
+    
+    def _run_item(self, item_id: int):
+        try:
+            with self.app.app_context():
+                self._process_item(item_id)
+        except Exception:
+            logger.exception("Batch item %s crashed", item_id)
+        finally:
+            self._slots.release()
+    
+    def _process_item(self, item_id: int):
+        try:
+            item = AssessmentBatchItem.query.get(item_id)
+            # The claim this worker runs under; the processor's commits reload item from the database
+            attempt = item.attempts
+            batch = AssessmentBatch.query.get(item.batch_id)
+            candidate_data = json.loads(item.candidate_data)
+            
+            try:
+                processor = AssessmentProcessor()
+                if batch.mode == 'reassess':
+                    result = processor.reassess_candidate(
+                        batch.assessment_type, batch.job_id, item.candidate_id, candidate_data
+                    )
+                elif batch.assessment_type == 'min_qualification':
+                    result = processor.process_min_qualification_assessment(batch.job_id, item.candidate_id, candidate_data)
+                else:
+                    result = processor.process_formal_assessment(batch.job_id, item.candidate_id, candidate_data)
+            except Exception as e:
+                logger.exception("Batch item %s failed", item_id)
+                result = {"success": False, "error": str(e)}
+            
+            self.finish_item(item, result, attempt)
+        finally:
+            db.session.remove()
+    
+    def finish_item(self, item: AssessmentBatchItem, result: dict, attempt: int) -> bool:
+        """
+        Store an item's result and update its batch counters, completing the batch with its last item.
+        Only the claim that produced the result (attempt = the item's attempts when it was claimed) can
+        finish it: if the lease expired and the item was claimed again or failed meanwhile, nothing is
+        written and False is returned.
+        """
+        succeeded = result.get('success', False)
+        finished = AssessmentBatchItem.query.filter(
+            AssessmentBatchItem.id == item.id,
+            AssessmentBatchItem.status == 'running',
+            AssessmentBatchItem.attempts == attempt
+        ).update({
+            'status': 'completed' if succeeded else 'failed',
+            'result': json.dumps(result),
+            'error': None if succeeded else result.get('error'),
+            'completed_at': datetime.utcnow()
+        }, synchronize_session=False)
+        if not finished:
+            db.session.rollback()
+            logger.warning("Batch item %s was finished by another claim; result of attempt %s dropped",
+                           item.id, attempt)
+            return False
+        
+        counter = AssessmentBatch.completed_items if succeeded else AssessmentBatch.failed_items
+        AssessmentBatch.query.filter_by(id=item.batch_id).update(
+            {counter: counter + 1}, synchronize_session=False
+        )
+        AssessmentBatch.query.filter(
+            AssessmentBatch.id == item.batch_id,
+            AssessmentBatch.completed_items + AssessmentBatch.failed_items >= AssessmentBatch.total_items
+        ).update({'status': 'completed', 'completed_at': datetime.utcnow()}, synchronize_session=False)
+        db.session.commit()
+        return True
+
+batch_queue = BatchQueue()
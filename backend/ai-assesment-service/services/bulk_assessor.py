@@ -0,0 +1,306 @@
+import json
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Any, List
+from config import Config
+from models.assessment_batch import AssessmentBatch, AssessmentBatchItem, ProviderBatch
+from services.assessment_processor import AssessmentProcessor
+from services.batch_provider import get_batch_provider
+from services.batch_queue import batch_queue
+from utils.database import db
+
+logger = logging.getLogger(__name__)
+
+CRITERIA_KEYS = {
+    'min_qualification': 'min_qualification_criteria',
+    'formal_assessment': 'formal_assessment_criteria'
+}
+
+class BulkAssessor:
+    """
+    Offline bulk mode for batches created with mode 'bulk'.
+    The LLM calls AssessmentProcessor plans for each item are written to provider batch files
+    and submitted; a poller waits for the provider to finish and maps the outputs back to
+    result rows and usage records. All state lives in the database, so after a restart
+    submitted provider batches are polled again and items never submitted are resubmitted.
+    Items and provider batches are claimed with conditional updates before any provider call,
+    so pollers in several processes never submit or collect the same work twice.
+    """
+    def __init__(self):
+        self.app = None
+        self._wakeup = threading.Event()
+    
+    def init_app(self, app):
+        self.app = app
+    
+    def start(self):
+        """
+        Start the poller; called in one process only (see utils.background)
+        """
+        if not Config.BULK_WORKER_ENABLED:
+            return
+        
+        threading.Thread(target=self._poll_loop, name='bulk-assessor', daemon=True).start()
+    
+    def wake(self):
+        self._wakeup.set()
+    
+    def run_once(self):
+        """
+        Submit pending bulk items, then collect every provider batch that has finished
+        """
+        try:
+            self._release_orphaned_items()
+            
+            pending_batches = db.session.query(AssessmentBatchItem.batch_id).join(
+                AssessmentBatch, AssessmentBatch.id == AssessmentBatchItem.batch_id
+            ).filter(AssessmentBatch.mode == 'bulk', AssessmentBatchItem.status == 'pending').distinct().all()
+            for (batch_id,) in pending_batches:
+                self._submit(batch_id)
+            
+            submitted = db.session.query(ProviderBatch.id).filter_by(status='submitted').order_by(ProviderBatch.id).all()
+            for (provider_batch_id,) in submitted:
+                self._poll(provider_batch_id)
+        finally:
+            db.session.remove()
+    
+    def _poll_loop(self):
+        while True:
+            try:
+                with self.app.app_context():
+                    self.run_once()
+            except Exception:
+                logger.exception("Bulk assessment cycle failed")
+            
+            self._wakeup.wait(timeout=Config.BULK_POLL_INTERVAL_SECONDS)
+            self._wakeup.clear()
+    
+    def _submit(self, batch_id: str):
+        batch = AssessmentBatch.query.get(batch_id)
+        processor = AssessmentProcessor()
+        bundle = processor.fetch_assessment_bundle(batch.job_id)
+        if not bundle:
+            # Left pending, retried on the next cycle
+            logger.warning("Bulk batch %s: failed to fetch job criteria", batch_id)
+            return
+        
+        provider = get_batch_provider()
+        claimed_at = datetime.utcnow()
+        items = self._claim_items(batch_id, claimed_at)
+        item_ids, sent = [item.id for item in items], set()
+        
+        try:
+            self._plan_and_send(provider, processor, batch, bundle, items, sent)
+        except Exception:
+            # Items not yet recorded in a provider batch go back to pending for the next cycle
+            db.session.rollback()
+            self._release_items([item_id for item_id in item_ids if item_id not in sent], claimed_at)
+            raise
+    
+    def _claim_items(self, batch_id: str, claimed_at: datetime) -> List[AssessmentBatchItem]:
+        """
+        Move every pending item of the batch to running in one conditional update and return
+        the items this worker claimed (none if another worker got there first)
+        """
+        claimed_ids = db.session.execute(
+            db.update(AssessmentBatchItem)
+            .where(AssessmentBatchItem.batch_id == batch_id, AssessmentBatchItem.status == 'pending')
+            .values(status='running', claimed_at=claimed_at, attempts=AssessmentBatchItem.attempts + 1)
+            .returning(AssessmentBatchItem.id)
+        ).scalars().all()
+        db.session.commit()
+        if not claimed_ids:
+            return []
+        
+        return AssessmentBatchItem.query.filter(AssessmentBatchItem.id.in_(claimed_ids))\
+                                        .order_by(AssessmentBatchItem.item_index).all()
+    
+    def _release_items(self, item_ids: List[int], claimed_at: datetime):
+        AssessmentBatchItem.query.filter(
+            AssessmentBatchItem.id.in_(item_ids),
+            AssessmentBatchItem.status == 'running',
+            AssessmentBatchItem.claimed_at == claimed_at
+        ).update({'status': 'pending'}, synchronize_session=False)
+        db.session.commit()
+    
+    def _release_orphaned_items(self):
+        """
+        Put back to pending the bulk items claimed by a worker that died before recording their provider batch
+        """
+        claimed_before = datetime.utcnow() - timedelta(seconds=Config.BATCH_ITEM_LEASE_SECONDS)
+        stale = db.session.query(AssessmentBatchItem.id, AssessmentBatchItem.batch_id).join(
+            AssessmentBatch, AssessmentBatch.id == AssessmentBatchItem.batch_id
+        ).filter(
+            AssessmentBatch.mode == 'bulk',
+            AssessmentBatchItem.status == 'running',
+            AssessmentBatchItem.claimed_at < claimed_before
+        ).all()
+        if not stale:
+            return
+        
+        submitted = set()
+        for (plans,) in db.session.query(ProviderBatch.plans).filter(
+            ProviderBatch.batch_id.in_({batch_id for _, batch_id in stale}), ProviderBatch.status == 'submitted'
+        ):
+            submitted.update(int(item_id) for item_id in json.loads(plans))
+        
+        orphaned = [item_id for item_id, _ in stale if item_id not in submitted]
+        if orphaned:
+            AssessmentBatchItem.query.filter(
+                AssessmentBatchItem.id.in_(orphaned),
+                AssessmentBatchItem.status == 'running',
+                AssessmentBatchItem.claimed_at < claimed_before
+            ).update({'status': 'pending'}, synchronize_session=False)
+            db.session.commit()
+            logger.warning("Released %d orphaned bulk items", len(orphaned))
+    
+    def _plan_and_send(self, provider, processor: AssessmentProcessor, batch: AssessmentBatch, bundle: dict,
+                       items: List[AssessmentBatchItem], sent: set):
+        """
+        Plan each claimed item's calls and submit them in provider batches of up to BULK_MAX_REQUESTS_PER_FILE,
+        adding the ids of the items recorded in a provider batch to sent
+        """
+        requests, plans = [], {}
+        
+        # Attempts of this worker's claims, read before any commit reloads the items
+        attempts = {item.id: item.attempts for item in items}
+        for item in items:
+            plan = processor.plan_assessment(batch.assessment_type, batch.job_id, json.loads(item.candidate_data), bundle)
+            if not plan['criteria']:
+                batch_queue.finish_item(item, {"success": False, "error": "No criteria found"}, attempts[item.id])
+                continue
+            if not plan['prompts']:
+                # Every area was decided by the rule engine
+                batch_queue.finish_item(item, processor.finish_planned_assessment(
+                    batch.assessment_type, batch.job_id, item.candidate_id, plan['rule_pairs'], [],
+                    plan['evaluation_mode'], [], datetime.now()
+                ), attempts[item.id])
+                continue
+            
+            # An item's calls always go into the same provider batch
+            if requests and len(requests) + len(plan['prompts']) > Config.BULK_MAX_REQUESTS_PER_FILE:
+                sent.update(self._send(provider, batch, bundle, requests, plans))
+                requests, plans = [], {}
+            
+            requests.extend(
+                provider.build_request(f"{item.id}-{index}", prompt, plan['system_prompt'])
+                for index, prompt in enumerate(plan['prompts'])
+            )
+            plans[str(item.id)] = {
+                "calls": [[criterion['id'] for criterion in group] for group in plan['call_groups']],
+                "rules": [[criterion['id'], response] for criterion, response in plan['rule_pairs']],
+                "evaluation_mode": plan['evaluation_mode']
+            }
+        
+        if requests:
+            sent.update(self._send(provider, batch, bundle, requests, plans))
+    
+    def _send(self, provider, batch: AssessmentBatch, bundle: dict, requests: List[dict],
+              plans: Dict[str, Any]) -> List[int]:
+        """
+        Submit one provider batch of already claimed items, record it and return the item ids.
+        If the worker dies before recording it, the items are released and resubmitted once their claim expires.
+        """
+        provider_batch_id = provider.submit(requests)
+        
+        db.session.add(ProviderBatch(
+            batch_id=batch.id,
+            provider=provider.name,
+            provider_batch_id=provider_batch_id,
+            status='submitted',
+            request_count=len(requests),
+            bundle=json.dumps(bundle),
+            plans=json.dumps(plans)
+        ))
+        AssessmentBatch.query.filter_by(id=batch.id, status='queued').update(
+            {'status': 'running'}, synchronize_session=False
+        )
+        db.session.commit()
+        logger.info("Bulk batch %s: submitted %d requests as %s", batch.id, len(requests), provider_batch_id)
+        return [int(item_id) for item_id in plans]
+    
+    def _poll(self, provider_batch_row_id: int):
+        claimed_at = datetime.utcnow()
+        if not self._claim_provider_batch(provider_batch_row_id, claimed_at):
+            return
+        
+        try:
+            provider_batch = ProviderBatch.query.get(provider_batch_row_id)
+            provider = get_batch_provider(provider_batch.provider)
+            state = provider.status(provider_batch.provider_batch_id)
+            provider_batch.provider_status = state.get('status')
+            
+            if state.get('status') not in provider.TERMINAL_STATUSES:
+                provider_batch.claimed_at = None
+                db.session.commit()
+                return
+            
+            self._collect(provider_batch, provider.results(state))
+            provider_batch.status = 'collected' if state['status'] == 'completed' else 'failed'
+            provider_batch.completed_at = datetime.utcnow()
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            ProviderBatch.query.filter_by(id=provider_batch_row_id, claimed_at=claimed_at).update(
+                {'claimed_at': None}, synchronize_session=False
+            )
+            db.session.commit()
+            raise
+    
+    def _claim_provider_batch(self, provider_batch_row_id: int, claimed_at: datetime) -> bool:
+        """
+        Conditional update so only one worker polls and collects a provider batch at a time.
+        A claim left by a worker that died mid-collection expires after BATCH_ITEM_LEASE_SECONDS.
+        """
+        lease_expired_before = claimed_at - timedelta(seconds=Config.BATCH_ITEM_LEASE_SECONDS)
+        claimed = ProviderBatch.query.filter(
+            ProviderBatch.id == provider_batch_row_id,
+            ProviderBatch.status == 'submitted',
+            db.or_(ProviderBatch.claimed_at.is_(None), ProviderBatch.claimed_at < lease_expired_before)
+        ).update({'claimed_at': claimed_at}, synchronize_session=False)
+        db.session.commit()
+        return bool(claimed)
+    
+    def _collect(self, provider_batch: ProviderBatch, responses: Dict[str, Dict[str, Any]]):
+        """
+        Turn provider outputs into result rows, usage records and item results.
+        Items already collected before a restart are skipped.
+        """
+        batch = AssessmentBatch.query.get(provider_batch.batch_id)
+        bundle = json.loads(provider_batch.bundle)
+        plans = json.loads(provider_batch.plans)
+        criteria_by_id = {criterion['id']: criterion for criterion in bundle.get(CRITERIA_KEYS[batch.assessment_type], [])}
+        processor = AssessmentProcessor()
+        missing = {
+            "success": False,
+            "error": f"No output from provider batch ({provider_batch.provider_status})",
+            "content": None,
+            "usage": None
+        }
+        
+        items = AssessmentBatchItem.query.filter(
+            AssessmentBatchItem.id.in_([int(item_id) for item_id in plans]),
+            AssessmentBatchItem.status == 'running'
+        ).order_by(AssessmentBatchItem.id).all()
+        attempts = {item.id: item.attempts for item in items}
+        
+        for item in items:
+            plan = plans[str(item.id)]
+            call_groups = [[criteria_by_id[criteria_id] for criteria_id in group] for group in plan['calls']]
+            rule_pairs = [(criteria_by_id[criteria_id], response) for criteria_id, response in plan['rules']]
+            call_responses = [responses.get(f"{item.id}-{index}", missing) for index in range(len(call_groups))]
+            
+            try:
+                result = processor.finish_planned_assessment(
+                    batch.assessment_type, batch.job_id, item.candidate_id, rule_pairs, call_groups,
+                    plan['evaluation_mode'], call_responses, datetime.now()
+                )
+            except Exception as e:
+                logger.exception("Bulk item %s failed", item.id)
+                db.session.rollback()
+                result = {"success": False, "error": str(e)}
+            
+            batch_queue.finish_item(item, result, attempts[item.id])
+
+bulk_assessor = BulkAssessor()
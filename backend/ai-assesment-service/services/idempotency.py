@@ -0,0 +1,218 @@
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional
+from sqlalchemy.exc import IntegrityError
+from config import Config
+from models.assessment_record import AssessmentRecord
+from utils.database import db
+
+# Criteria fields that change what an assessment would return
+CRITERIA_CONTENT_FIELDS = ['id', 'area', 'criteria', 'explanation', 'max_score', 'order_index', 'rule']
+
+class _Slot:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self._lock = threading.Lock()
+        self._futures = []
+    
+    def resolve(self, result):
+        with self._lock:
+            self.result = result
+            self.done.set()
+            futures, self._futures = self._futures, []
+        for loop, future in futures:
+            loop.call_soon_threadsafe(self._set_result, future, result)
+    
+    def wait(self, timeout: float) -> Optional[Dict[str, Any]]:
+        return self.result if self.done.wait(timeout) else None
+    
+    async def wait_async(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        wait() for coroutines; waiting holds a future on the event loop, not an executor thread
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            if self.done.is_set():
+                return self.result
+            self._futures.append((loop, future))
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+    
+    @staticmethod
+    def _set_result(future: asyncio.Future, result):
+        if not future.done():
+            future.set_result(result)
+
+class AssessmentRegistry:
+    """
+    Makes assessments idempotent. A completed assessment is stored under a fingerprint
+    of its inputs and replayed for identical requests without calling the LLM.
+    A duplicate that arrives while the first is still running waits for it instead:
+    through a shared in-memory slot within this process, and through a claim row in
+    assessment_records across workers (claims expire after IDEMPOTENCY_CLAIM_LEASE_SECONDS).
+    """
+    def __init__(self):
+        self._inflight = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def fingerprint(assessment_type: str, job_id: int, candidate_id: str, candidate_data: dict,
+                    criteria: List[dict], options: Dict[str, Any] = None) -> str:
+        """
+        Hash of the canonicalized request and the criteria content it is assessed against
+        """
+        payload = json.dumps([
+            assessment_type,
+            job_id,
+            str(candidate_id),
+            candidate_data,
+            [{field: criterion.get(field) for field in CRITERIA_CONTENT_FIELDS} for criterion in criteria],
+            options or {}
+        ], sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def run(self, fingerprint: str, meta: Dict[str, Any], compute) -> Dict[str, Any]:
+        """
+        Return the stored or in-flight result for the fingerprint, or compute and store it
+        """
+        if not Config.IDEMPOTENCY_ENABLED:
+            return compute()
+        
+        slot, owner = self._join(fingerprint)
+        if not owner:
+            return self._replayed(slot.wait(Config.IDEMPOTENCY_WAIT_SECONDS)) or compute()
+        
+        engine = db.engine
+        result = None
+        try:
+            result = self._prepare(fingerprint, meta, engine)
+            if result is None:
+                try:
+                    result = compute()
+                finally:
+                    self._record(fingerprint, result, engine)
+            return result
+        finally:
+            self._leave(fingerprint, slot, result)
+    
+    async def run_async(self, fingerprint: str, meta: Dict[str, Any], compute) -> Dict[str, Any]:
+        """
+        run() for coroutine computations; database work and waiting happen off the event loop
+        """
+        if not Config.IDEMPOTENCY_ENABLED:
+            return await compute()
+        
+        slot, owner = self._join(fingerprint)
+        if not owner:
+            result = await slot.wait_async(Config.IDEMPOTENCY_WAIT_SECONDS)
+            return self._replayed(result) or await compute()
+        
+        engine = db.engine
+        result = None
+        try:
+            result = await asyncio.to_thread(self._prepare, fingerprint, meta, engine)
+            if result is None:
+                try:
+                    result = await compute()
+                finally:
+                    await asyncio.to_thread(self._record, fingerprint, result, engine)
+            return result
+        finally:
+            self._leave(fingerprint, slot, result)
+    
+    def _join(self, fingerprint: str):
+        with self._lock:
+            slot = self._inflight.get(fingerprint)
+            if slot is not None:
+                return slot, False
+            slot = self._inflight[fingerprint] = _Slot()
+            return slot, True
+    
+    def _leave(self, fingerprint: str, slot: _Slot, result: Optional[Dict[str, Any]]):
+        with self._lock:
+            self._inflight.pop(fingerprint, None)
+        slot.resolve(result)
+    
+    def _prepare(self, fingerprint: str, meta: Dict[str, Any], engine) -> Optional[Dict[str, Any]]:
+        """
+        Replay a completed record, or claim the fingerprint (waiting out another worker's claim).
+        Returns None when the caller should compute.
+        """
+        deadline = time.monotonic() + Config.IDEMPOTENCY_WAIT_SECONDS
+        while True:
+            record = self._load(fingerprint, engine)
+            if record is not None and record.status == 'completed':
+                return self._replayed(json.loads(record.response))
+            if self._claim(fingerprint, meta, record, engine):
+                return None
+            if time.monotonic() > deadline:
+                # The other worker is taking too long; assess without coalescing
+                return None
+            time.sleep(Config.IDEMPOTENCY_POLL_INTERVAL_SECONDS)
+    
+    def _load(self, fingerprint: str, engine):
+        table = AssessmentRecord.__table__
+        with engine.connect() as connection:
+            return connection.execute(
+                db.select(table.c.status, table.c.response, table.c.claimed_at)
+                .where(table.c.fingerprint == fingerprint)
+            ).first()
+    
+    def _claim(self, fingerprint: str, meta: Dict[str, Any], record, engine) -> bool:
+        table = AssessmentRecord.__table__
+        now = datetime.utcnow()
+        try:
+            with engine.begin() as connection:
+                if record is None:
+                    connection.execute(table.insert().values(
+                        fingerprint=fingerprint, status='running', claimed_at=now, created_at=now, **meta
+                    ))
+                    return True
+                
+                # Take over a claim left behind by a crashed worker
+                stale_before = now - timedelta(seconds=Config.IDEMPOTENCY_CLAIM_LEASE_SECONDS)
+                taken = connection.execute(
+                    table.update()
+                    .where(table.c.fingerprint == fingerprint, table.c.status == 'running',
+                           table.c.claimed_at < stale_before)
+                    .values(claimed_at=now)
+                )
+                return taken.rowcount == 1
+        except IntegrityError:
+            return False
+    
+    def _record(self, fingerprint: str, result: Dict[str, Any], engine):
+        """
+        Store a complete result for replay; release the claim otherwise so the request can be retried
+        """
+        table = AssessmentRecord.__table__
+        with engine.begin() as connection:
+            if self._replayable(result):
+                connection.execute(
+                    table.update().where(table.c.fingerprint == fingerprint).values(
+                        status='completed', response=json.dumps(result, default=str), completed_at=datetime.utcnow()
+                    )
+                )
+            else:
+                connection.execute(
+                    table.delete().where(table.c.fingerprint == fingerprint, table.c.status == 'running')
+                )
+    
+    def _replayable(self, result: Optional[Dict[str, Any]]) -> bool:
+        # Areas that errored (timeouts, provider failures) must be retried, not replayed
+        return bool(result and result.get('success') and not result.get('failed_areas'))
+    
+    def _replayed(self, result: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        if not self._replayable(result):
+            return result
+        return {**result, 'idempotent_replay': True}
+
+assessment_registry = AssessmentRegistry()
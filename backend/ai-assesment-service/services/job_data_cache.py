@@ -0,0 +1,103 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+from config import Config
+
+class JobDataCache:
+    """
+    Process-wide TTL cache for job and criteria payloads fetched from the job
+    management service. Expired entries keep their ETag/Last-Modified validators
+    so they can be revalidated with a conditional GET instead of refetched.
+    Each worker process has its own copy: edits reach every worker through that
+    revalidation within the (short) TTL, not through invalidate().
+    Keys look like 'criteria:42', so a job's entries can be dropped together.
+    """
+    def __init__(self, ttl_seconds: int, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'revalidated': 0, 'invalidations': 0}
+    
+    def get_fresh(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached payload if it is still within its TTL
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry['fresh_until'] > time.time():
+                self._entries.move_to_end(key)
+                self._stats['hits'] += 1
+                return entry['payload']
+            
+            self._stats['misses'] += 1
+            return None
+    
+    def validators(self, key: str) -> Dict[str, str]:
+        """
+        Conditional request headers for revalidating a stale entry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return {}
+            
+            headers = {}
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+            return headers
+    
+    def store(self, key: str, payload: Dict[str, Any], etag: str = None, last_modified: str = None,
+              ttl_seconds: int = None):
+        with self._lock:
+            self._entries[key] = {
+                'payload': payload,
+                'etag': etag,
+                'last_modified': last_modified,
+                'fresh_until': time.time() + (self.ttl_seconds if ttl_seconds is None else ttl_seconds)
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def revalidate(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Mark an entry fresh again after a 304 and return its payload
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            
+            entry['fresh_until'] = time.time() + self.ttl_seconds
+            self._stats['revalidated'] += 1
+            return entry['payload']
+    
+    def invalidate(self, job_id: int = None) -> int:
+        """
+        Drop the entries of one job, or everything when no job_id is given
+        """
+        with self._lock:
+            if job_id is None:
+                keys = list(self._entries)
+            else:
+                keys = [key for key in self._entries if key.endswith(f":{job_id}")]
+            
+            for key in keys:
+                del self._entries[key]
+            
+            self._stats['invalidations'] += len(keys)
+            return len(keys)
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, 'entries': len(self._entries)}
+
+job_data_cache = JobDataCache(
+    ttl_seconds=Config.JOB_DATA_CACHE_TTL_SECONDS,
+    max_entries=Config.JOB_DATA_CACHE_MAX_ENTRIES
+)
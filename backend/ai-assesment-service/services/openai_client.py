@@ -1,59 +1,229 @@
 import openai
 import json
+import time
+import asyncio
+import logging
+import threading
 from typing import Dict, Any, Optional
 from config import Config
+from services.response_cache import ResponseCache, get_response_cache
+from services.rate_limiter import rate_limiter
+
+logger = logging.getLogger(__name__)
+
+_client = None
+_async_client = None
+_client_lock = threading.Lock()
+
+def get_openai_client() -> openai.OpenAI:
+    """
+    Process-wide OpenAI SDK client, so every processor shares one connection pool.
+    Retries are handled by OpenAIClient, behind the shared rate limiter.
+    """
+    global _client
+    
+    with _client_lock:
+        if _client is None:
+            _client = openai.OpenAI(api_key=Config.OPENAI_API_KEY, max_retries=0)
+        return _client
+
+def get_async_openai_client() -> openai.AsyncOpenAI:
+    """
+    Process-wide async OpenAI SDK client. Its connections belong to the shared event loop
+    (utils.event_loop), which every async assessment runs on.
+    """
+    global _async_client
+    
+    with _client_lock:
+        if _async_client is None:
+            _async_client = openai.AsyncOpenAI(api_key=Config.OPENAI_API_KEY, max_retries=0)
+        return _async_client
 
 class OpenAIClient:
     def __init__(self):
         if not Config.OPENAI_API_KEY:
             raise ValueError("OpenAI API key is required")
         
-        self.client = openai.OpenAI(api_key=Config.OPENAI_API_KEY)
+        self.client = get_openai_client()
         self.model = Config.OPENAI_MODEL
+        self.response_format = {"type": "json_object"}
+        self.cache = get_response_cache()
+        self.rate_limiter = rate_limiter
     
     def generate_completion(self, prompt: str, system_prompt: str = None) -> Dict[str, Any]:
         """
         Generate a completion from OpenAI with usage tracking
         """
-        try:
-            messages = []
+        cache_key = self._cache_key(prompt, system_prompt)
+        cached = self._get_cached(cache_key)
+        if cached:
+            return cached
+        
+        estimated_tokens = self.rate_limiter.estimate_tokens(prompt, system_prompt)
+        wait_ms = 0
+        
+        for attempt in range(Config.OPENAI_MAX_RETRIES + 1):
+            wait_ms += self.rate_limiter.acquire(estimated_tokens)
             
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
+            try:
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=self._build_messages(prompt, system_prompt),
+                    response_format=self.response_format
+                )
             
-            messages.append({"role": "user", "content": prompt})
+            except openai.RateLimitError as e:
+                if attempt == Config.OPENAI_MAX_RETRIES:
+                    return self._error_response(e, wait_ms)
+                
+                delay = self.rate_limiter.backoff_delay(attempt, self._retry_after(e))
+                time.sleep(delay)
+                wait_ms += int(delay * 1000)
+                continue
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                response_format={"type": "json_object"}
-            )
+            except Exception as e:
+                return self._error_response(e, wait_ms)
             
-            # Extract response data
-            content = response.choices[0].message.content
-            usage = response.usage
+            return self._store_cached(cache_key, self._complete(response, estimated_tokens, wait_ms))
+    
+    def _build_messages(self, prompt: str, system_prompt: str = None) -> list:
+        messages = []
+        
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        
+        messages.append({"role": "user", "content": prompt})
+        return messages
+    
+    def _parse_response(self, response) -> Dict[str, Any]:
+        # Extract response data
+        content = response.choices[0].message.content
+        usage = response.usage
+        
+        # Parse JSON response
+        try:
+            parsed_content = json.loads(content)
+        except json.JSONDecodeError:
+            parsed_content = {"error": "Invalid JSON response", "raw_content": content}
+        
+        return {
+            "success": True,
+            "content": parsed_content,
+            "usage": {
+                "prompt_tokens": usage.prompt_tokens,
+                "completion_tokens": usage.completion_tokens,
+                "total_tokens": usage.total_tokens
+            },
+            "model": self.model,
+            "cached": False
+        }
+    
+    def _complete(self, response, estimated_tokens: int, wait_ms: int) -> Dict[str, Any]:
+        result = self._parse_response(response)
+        self.rate_limiter.settle(estimated_tokens, result["usage"]["total_tokens"])
+        result["rate_limit_wait_ms"] = wait_ms
+        return result
+    
+    def _retry_after(self, error: Exception) -> Optional[float]:
+        """
+        Seconds the provider asked us to wait, if it said
+        """
+        response = getattr(error, "response", None)
+        try:
+            return float(response.headers.get("retry-after"))
+        except (AttributeError, TypeError, ValueError):
+            return None
+    
+    def _cache_key(self, prompt: str, system_prompt: str = None) -> str:
+        return ResponseCache.make_key(self.model, system_prompt, prompt, self.response_format)
+    
+    def _get_cached(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        if self.cache is None:
+            return None
+        
+        # The cache is an optimisation: if it fails (e.g. the shared file is locked), call the API uncached
+        try:
+            value = self.cache.get(cache_key)
+        except Exception as e:
+            logger.warning("LLM response cache read failed: %s", e)
+            return None
+        if value is None:
+            return None
+        
+        return {"success": True, **value, "cached": True}
+    
+    def _store_cached(self, cache_key: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        # Unparseable responses are not worth replaying
+        if self.cache is not None and "error" not in result["content"]:
+            try:
+                self.cache.set(cache_key, {
+                    "content": result["content"],
+                    "usage": result["usage"],
+                    "model": result["model"]
+                })
+            except Exception as e:
+                logger.warning("LLM response cache write failed: %s", e)
+        return result
+    
+    def _error_response(self, error: Exception, wait_ms: int = 0) -> Dict[str, Any]:
+        return {
+            "success": False,
+            "error": str(error),
+            "content": None,
+            "usage": None,
+            "rate_limit_wait_ms": wait_ms
+        }
+
+class AsyncOpenAIClient(OpenAIClient):
+    """
+    Asyncio variant of OpenAIClient, so many completions can be awaited on one event loop
+    """
+    def __init__(self):
+        if not Config.OPENAI_API_KEY:
+            raise ValueError("OpenAI API key is required")
+        
+        self.client = get_async_openai_client()
+        self.model = Config.OPENAI_MODEL
+        self.response_format = {"type": "json_object"}
+        self.cache = get_response_cache()
+        self.rate_limiter = rate_limiter
+    
+    async def generate_completion(self, prompt: str, system_prompt: str = None) -> Dict[str, Any]:
+        """
+        Generate a completion from OpenAI with usage tracking
+        """
+        cache_key = self._cache_key(prompt, system_prompt)
+        # The response cache is SQLite-backed, so it is read and written off the event loop
+        cached = await asyncio.to_thread(self._get_cached, cache_key) if self.cache is not None else None
+        if cached:
+            return cached
+        
+        estimated_tokens = self.rate_limiter.estimate_tokens(prompt, system_prompt)
+        wait_ms = 0
+        
+        for attempt in range(Config.OPENAI_MAX_RETRIES + 1):
+            wait_ms += await self.rate_limiter.acquire_async(estimated_tokens)
             
-            # Parse JSON response
             try:
-                parsed_content = json.loads(content)
-            except json.JSONDecodeError:
-                parsed_content = {"error": "Invalid JSON response", "raw_content": content}
-            
-            return {
-                "success": True,
-                "content": parsed_content,
-                "usage": {
-                    "prompt_tokens": usage.prompt_tokens,
-                    "completion_tokens": usage.completion_tokens,
-                    "total_tokens": usage.total_tokens
-                },
-                "model": self.model
-            }
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=self._build_messages(prompt, system_prompt),
+                    response_format=self.response_format
+                )
             
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "content": None,
-                "usage": None
-            }
\ No newline at end of file
+            except openai.RateLimitError as e:
+                if attempt == Config.OPENAI_MAX_RETRIES:
+                    return self._error_response(e, wait_ms)
+                
+                delay = self.rate_limiter.backoff_delay(attempt, self._retry_after(e))
+                await asyncio.sleep(delay)
+                wait_ms += int(delay * 1000)
+                continue
+            
+            except Exception as e:
+                return self._error_response(e, wait_ms)
+            
+            result = self._complete(response, estimated_tokens, wait_ms)
+            if self.cache is None:
+                return result
+            return await asyncio.to_thread(self._store_cached, cache_key, result)
@@ -0,0 +1,117 @@
+import json
+from typing import Any, List, Optional
+from config import Config
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Contact and bookkeeping fields that never help a qualification decision, dropped first
+DROPPABLE_FIELDS = {
+    'id', 'application_id', 'created_at',
+    'address', 'address_line', 'phone', 'phone_no', 'mobile', 'fax', 'email',
+    'reference_name', 'reference_email', 'reference_phone', 'name_of_direct_supervisor'
+}
+
+TRUNCATION_MARKER = ' [truncated]'
+
+class PromptBudget:
+    """
+    Counts prompt tokens locally (tiktoken when installed, ~4 characters per token otherwise)
+    and fits candidate data into a per-area token budget. Oversized data is compacted in a
+    fixed order so the same input always yields the same prompt (and LLM cache key):
+    compact JSON, contact fields dropped, most recent experiences kept, long text fields
+    shortened, older entries dropped, and finally a hard cut.
+    """
+    def __init__(self, encoding_name: str):
+        self._encoding = None
+        if tiktoken is not None:
+            try:
+                self._encoding = tiktoken.get_encoding(encoding_name)
+            except Exception:
+                self._encoding = None
+    
+    def count_tokens(self, text: Optional[str]) -> int:
+        if not text:
+            return 0
+        if self._encoding is not None:
+            return len(self._encoding.encode(text, disallowed_special=()))
+        return (len(text) + 3) // 4
+    
+    def fit(self, area_data: Any, budget: int = None) -> str:
+        """
+        Serialize area data for a prompt, compacting it until it fits the token budget
+        """
+        budget = Config.PROMPT_AREA_TOKEN_BUDGET if budget is None else budget
+        if area_data is None or area_data == '':
+            return ''
+        if isinstance(area_data, str):
+            return self.truncate(area_data, budget)
+        
+        text = self._serialize(area_data)
+        if not budget or self.count_tokens(text) <= budget:
+            return text
+        
+        for compact in (self._drop_fields, self._keep_recent, self._shorten_fields):
+            area_data = compact(area_data)
+            text = self._serialize(area_data)
+            if self.count_tokens(text) <= budget:
+                return text
+        
+        # Drop the oldest remaining entries one at a time
+        while isinstance(area_data, list) and len(area_data) > 1:
+            area_data = area_data[:-1]
+            text = self._serialize(area_data)
+            if self.count_tokens(text) <= budget:
+                return text
+        
+        return self.truncate(text, budget)
+    
+    def truncate(self, text: str, budget: int) -> str:
+        """
+        Cut text to at most budget tokens, marking the cut
+        """
+        if not text or not budget or self.count_tokens(text) <= budget:
+            return text or ''
+        
+        keep = max(budget - self.count_tokens(TRUNCATION_MARKER), 1)
+        if self._encoding is not None:
+            return self._encoding.decode(self._encoding.encode(text, disallowed_special=())[:keep]) + TRUNCATION_MARKER
+        return text[:keep * 4] + TRUNCATION_MARKER
+    
+    def _serialize(self, data: Any) -> str:
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=str)
+    
+    def _drop_fields(self, data: Any) -> Any:
+        if isinstance(data, dict):
+            return {key: self._drop_fields(value) for key, value in data.items() if key not in DROPPABLE_FIELDS}
+        if isinstance(data, list):
+            return [self._drop_fields(item) for item in data]
+        return data
+    
+    def _keep_recent(self, data: Any) -> Any:
+        """
+        Keep the PROMPT_MAX_EXPERIENCES most recent dated entries, most recent first
+        """
+        if isinstance(data, dict):
+            return {key: self._keep_recent(value) for key, value in data.items()}
+        if isinstance(data, list) and data and all(isinstance(item, dict) and 'start_date' in item for item in data):
+            ordered = sorted(data, key=self._recency, reverse=True)
+            return ordered[:Config.PROMPT_MAX_EXPERIENCES]
+        return data
+    
+    def _recency(self, entry: dict):
+        ongoing = bool(entry.get('current')) or not entry.get('end_date')
+        return (ongoing, str(entry.get('end_date') or ''), str(entry.get('start_date') or ''))
+    
+    def _shorten_fields(self, data: Any) -> Any:
+        if isinstance(data, dict):
+            return {key: self._shorten_fields(value) for key, value in data.items()}
+        if isinstance(data, list):
+            return [self._shorten_fields(item) for item in data]
+        if isinstance(data, str) and len(data) > Config.PROMPT_MAX_FIELD_CHARS:
+            return data[:Config.PROMPT_MAX_FIELD_CHARS] + '...'
+        return data
+
+prompt_budget = PromptBudget(Config.PROMPT_TOKENIZER_ENCODING)
@@ -0,0 +1,143 @@
+import asyncio
+import random
+import threading
+import time
+from typing import Dict, Any, Optional
+from config import Config
+from services.prompt_budget import prompt_budget
+
+class _TokenBucket:
+    def __init__(self, per_minute: int, burst_seconds: float):
+        self.rate = per_minute / 60.0
+        self.capacity = max(self.rate * burst_seconds, 1.0)
+        self.level = self.capacity
+        self.updated = time.monotonic()
+    
+    def time_until(self, amount: float, now: float) -> float:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+        amount = min(amount, self.capacity)
+        return max(0.0, (amount - self.level) / self.rate)
+    
+    def take(self, amount: float):
+        # Level may go negative: later callers then wait for the deficit too
+        self.level -= min(amount, self.capacity)
+    
+    def give_back(self, amount: float):
+        self.level = min(self.capacity, self.level + amount)
+
+class RateLimiter:
+    """
+    Process-wide limiter enforcing both requests-per-minute and tokens-per-minute budgets.
+    Callers reserve capacity up front and sleep until it is theirs, so waiting callers
+    are served in arrival order and the provider never sees a burst above the budget.
+    With several worker processes each one enforces its share of the budgets (see share_budget).
+    """
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int, burst_seconds: float):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.burst_seconds = burst_seconds
+        self.processes = 1
+        self._lock = threading.Lock()
+        self._build_buckets()
+        self._stats = {'requests': 0, 'throttled_requests': 0, 'total_wait_ms': 0, 'max_wait_ms': 0,
+                       'rate_limited_responses': 0, 'retries': 0}
+    
+    def share_budget(self, processes: int):
+        """
+        Limit this process to an equal share of the budgets, which are split between the given number of processes
+        """
+        with self._lock:
+            self.processes = max(1, processes)
+            self._build_buckets()
+    
+    def _build_buckets(self):
+        requests, tokens = self.requests_per_minute / self.processes, self.tokens_per_minute / self.processes
+        self._requests = _TokenBucket(requests, self.burst_seconds) if requests > 0 else None
+        self._tokens = _TokenBucket(tokens, self.burst_seconds) if tokens > 0 else None
+    
+    def estimate_tokens(self, prompt: str, system_prompt: Optional[str] = None) -> int:
+        """
+        Pre-call estimate: locally counted prompt tokens plus the expected completion
+        """
+        prompt_tokens = prompt_budget.count_tokens(prompt) + prompt_budget.count_tokens(system_prompt)
+        return prompt_tokens + Config.RATE_LIMIT_COMPLETION_TOKENS_ESTIMATE
+    
+    def acquire(self, tokens: int) -> int:
+        """
+        Block until a request of the given size fits the budget; returns the wait in ms
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return int(wait * 1000)
+    
+    async def acquire_async(self, tokens: int) -> int:
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return int(wait * 1000)
+    
+    def settle(self, estimated_tokens: int, actual_tokens: int):
+        """
+        Correct the token bucket once the real usage is known
+        """
+        if self._tokens is None or not actual_tokens:
+            return
+        
+        with self._lock:
+            difference = estimated_tokens - actual_tokens
+            if difference > 0:
+                self._tokens.give_back(difference)
+            else:
+                self._tokens.take(-difference)
+    
+    def backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Full-jitter exponential backoff, never shorter than the provider's Retry-After
+        """
+        with self._lock:
+            self._stats['rate_limited_responses'] += 1
+            self._stats['retries'] += 1
+        
+        ceiling = min(Config.OPENAI_RETRY_MAX_DELAY, Config.OPENAI_RETRY_BASE_DELAY * (2 ** attempt))
+        return max(random.uniform(0, ceiling), retry_after or 0.0)
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                'average_wait_ms': round(self._stats['total_wait_ms'] / self._stats['requests'], 2)
+                if self._stats['requests'] else 0.0,
+                'requests_per_minute': Config.RATE_LIMIT_REQUESTS_PER_MINUTE,
+                'tokens_per_minute': Config.RATE_LIMIT_TOKENS_PER_MINUTE,
+                'processes': self.processes
+            }
+    
+    def _reserve(self, tokens: int) -> float:
+        with self._lock:
+            now = time.monotonic()
+            wait = 0.0
+            if self._requests is not None:
+                wait = max(wait, self._requests.time_until(1, now))
+            if self._tokens is not None:
+                wait = max(wait, self._tokens.time_until(tokens, now))
+            
+            if self._requests is not None:
+                self._requests.take(1)
+            if self._tokens is not None:
+                self._tokens.take(tokens)
+            
+            wait_ms = int(wait * 1000)
+            self._stats['requests'] += 1
+            self._stats['total_wait_ms'] += wait_ms
+            self._stats['max_wait_ms'] = max(self._stats['max_wait_ms'], wait_ms)
+            if wait > 0:
+                self._stats['throttled_requests'] += 1
+            return wait
+
+rate_limiter = RateLimiter(
+    requests_per_minute=Config.RATE_LIMIT_REQUESTS_PER_MINUTE,
+    tokens_per_minute=Config.RATE_LIMIT_TOKENS_PER_MINUTE,
+    burst_seconds=Config.RATE_LIMIT_BURST_SECONDS
+)
@@ -0,0 +1,171 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+class ResponseCache:
+    """
+    Two-tier cache for LLM responses, keyed by a hash of the request content.
+    A bounded in-memory LRU sits in front of a SQLite file so cached responses
+    survive restarts. Both tiers honour the same TTL.
+    The file is shared by every worker process, so it is opened in WAL mode (readers never
+    wait for a writer) with a busy timeout for concurrent writers.
+    """
+    def __init__(self, path: str, ttl_seconds: int, memory_max_entries: int, disk_max_entries: int,
+                 busy_timeout_seconds: float = 2.0):
+        self.ttl_seconds = ttl_seconds
+        self.memory_max_entries = memory_max_entries
+        self.disk_max_entries = disk_max_entries
+        
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes_since_eviction = 0
+        self._stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+        
+        self._conn = sqlite3.connect(path, timeout=busy_timeout_seconds, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS llm_response_cache ('
+            'key TEXT PRIMARY KEY, value TEXT NOT NULL, '
+            'expires_at REAL NOT NULL, last_access REAL NOT NULL)'
+        )
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS ix_llm_response_cache_last_access '
+            'ON llm_response_cache (last_access)'
+        )
+        self._conn.commit()
+    
+    @staticmethod
+    def make_key(model: str, system_prompt: Optional[str], prompt: str, response_format: Optional[dict]) -> str:
+        """
+        Content-address a completion request
+        """
+        payload = json.dumps([model, system_prompt, prompt, response_format], sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self._stats['memory_hits'] += 1
+                    return value
+                del self._memory[key]
+            
+            row = self._conn.execute(
+                'SELECT value, expires_at FROM llm_response_cache WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None or row[1] <= now:
+                self._stats['misses'] += 1
+                return None
+            
+            self._write('UPDATE llm_response_cache SET last_access = ? WHERE key = ?', (now, key))
+            
+            value = json.loads(row[0])
+            self._remember(key, row[1], value)
+            self._stats['disk_hits'] += 1
+            return value
+    
+    def set(self, key: str, value: Dict[str, Any]):
+        now = time.time()
+        expires_at = now + self.ttl_seconds
+        
+        with self._lock:
+            self._remember(key, expires_at, value)
+            self._write(
+                'INSERT OR REPLACE INTO llm_response_cache (key, value, expires_at, last_access) '
+                'VALUES (?, ?, ?, ?)',
+                (key, json.dumps(value), expires_at, now)
+            )
+            self._stats['stores'] += 1
+            
+            # Trimming the disk tier scans the index, so only do it every so often
+            self._writes_since_eviction += 1
+            if self._writes_since_eviction >= 100:
+                self._evict_disk(now)
+                self._writes_since_eviction = 0
+    
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._conn.execute('DELETE FROM llm_response_cache')
+            self._conn.commit()
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits = self._stats['memory_hits'] + self._stats['disk_hits']
+            lookups = hits + self._stats['misses']
+            return {
+                **self._stats,
+                'hits': hits,
+                'hit_rate': round(hits / lookups, 4) if lookups else 0.0,
+                'memory_entries': len(self._memory),
+                'disk_entries': self._conn.execute('SELECT COUNT(*) FROM llm_response_cache').fetchone()[0]
+            }
+    
+    def _write(self, sql: str, parameters: tuple):
+        """
+        Execute and commit one statement; on failure (e.g. the file stayed locked) roll back so the
+        connection isn't left holding an open transaction
+        """
+        try:
+            self._conn.execute(sql, parameters)
+            self._conn.commit()
+        except sqlite3.Error:
+            self._conn.rollback()
+            raise
+    
+    def _remember(self, key: str, expires_at: float, value: Dict[str, Any]):
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_max_entries:
+            self._memory.popitem(last=False)
+            self._stats['evictions'] += 1
+    
+    def _evict_disk(self, now: float):
+        expired = self._conn.execute('DELETE FROM llm_response_cache WHERE expires_at <= ?', (now,)).rowcount
+        overflow = self._conn.execute(
+            'DELETE FROM llm_response_cache WHERE key IN ('
+            'SELECT key FROM llm_response_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?)',
+            (self.disk_max_entries,)
+        ).rowcount
+        self._conn.commit()
+        self._stats['evictions'] += expired + overflow
+
+_response_cache = None
+_response_cache_lock = threading.Lock()
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Process-wide response cache, or None when caching is disabled
+    """
+    global _response_cache
+    
+    if not Config.LLM_CACHE_ENABLED:
+        return None
+    
+    with _response_cache_lock:
+        if _response_cache is None:
+            try:
+                _response_cache = ResponseCache(
+                    path=Config.LLM_CACHE_PATH,
+                    ttl_seconds=Config.LLM_CACHE_TTL_SECONDS,
+                    memory_max_entries=Config.LLM_CACHE_MEMORY_MAX_ENTRIES,
+                    disk_max_entries=Config.LLM_CACHE_DISK_MAX_ENTRIES,
+                    busy_timeout_seconds=Config.LLM_CACHE_BUSY_TIMEOUT_SECONDS
+                )
+            except sqlite3.Error as e:
+                # Run uncached for now; the next client tries to open the file again
+                logger.warning("LLM response cache unavailable: %s", e)
+        return _response_cache
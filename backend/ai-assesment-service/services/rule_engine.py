@@ -0,0 +1,188 @@
+import re
+from typing import Dict, Any, List, Optional, Tuple
+
+# Ordinal scale for proficiency fields; unknown labels leave the criterion to the LLM
+PROFICIENCY_RANKS = {
+    'poor': 0, 'weak': 0,
+    'basic': 1, 'fair': 1,
+    'intermediate': 2, 'good': 2,
+    'very good': 3, 'fluent': 3, 'excellent': 3,
+    'native': 4, 'mother tongue': 4
+}
+
+LANGUAGE_SKILLS = ['read', 'write', 'speak']
+
+YEARS_PATTERN = re.compile(
+    r'^\s*(?:a\s+)?(?:at least|minimum(?: of)?|no less than)\s+(\d+(?:\.\d+)?)\s+years?\s+of\s+'
+    r'(?:(public|private)[\s-]sector\s+)?(?:work\s+|professional\s+)?experience'
+    r'(?:\s+in\s+the\s+(public|private)\s+sector)?\s*\.?\s*$',
+    re.IGNORECASE
+)
+CITIZENSHIP_PATTERN = re.compile(
+    r'^\s*(?:must\s+)?(?:hold|holds|have held|has held|be a|is a)\s+lebanese\s+citizen(?:ship)?\s+'
+    r'(?:for\s+)?(?:more than|over|at least)\s+(?:ten|10)\s+years\s*\.?\s*$',
+    re.IGNORECASE
+)
+COMPUTER_PATTERN = re.compile(
+    r'^\s*(excellent|very good|good|fair|basic)\s+(?:command of|knowledge of|proficiency in|skills in)\s+'
+    r'computer(?:\s+tools|\s+skills|\s+applications)?\s*\.?\s*$',
+    re.IGNORECASE
+)
+LANGUAGE_PATTERN = re.compile(
+    r'^\s*(excellent|very good|good|fair|basic)\s+(?:command of|knowledge of|proficiency in)\s+'
+    r'((?:arabic|english|french)(?:\s*(?:,|and)\s*(?:arabic|english|french))*)'
+    r'(?:\s+languages?)?\s*\.?\s*$',
+    re.IGNORECASE
+)
+
+class RuleEngine:
+    """
+    Evaluates machine-readable minimum qualification rules against structured
+    candidate fields, so plain comparisons never reach the LLM.
+    
+    Rules are JSON objects:
+        {"field": "personal_information.total_years_of_experience", "op": ">=", "value": 5}
+        {"language": "English", "at_least": "Good", "skills": ["read", "write"]}
+        {"all": [rule, ...]} / {"any": [rule, ...]}
+    Supported ops: ==, !=, >, >=, <, <=, in, not_in, is_true, is_false, at_least (proficiency scale).
+    A rule that cannot be decided from the data evaluates to None and the criterion
+    falls back to the LLM.
+    """
+    def rule_for(self, criterion: dict, auto_derive: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        The criterion's explicit rule, or one derived from its text when the wording is unambiguous
+        """
+        if isinstance(criterion.get('rule'), dict):
+            return criterion['rule']
+        if auto_derive:
+            return self.derive(criterion.get('criteria') or '')
+        return None
+    
+    def derive(self, text: str) -> Optional[Dict[str, Any]]:
+        """
+        Derive a rule from criteria text that is nothing more than a simple structured requirement
+        """
+        match = YEARS_PATTERN.match(text)
+        if match:
+            sector = (match.group(2) or match.group(3) or '').lower()
+            field = {
+                'public': 'years_in_public_sector',
+                'private': 'years_in_private_sector'
+            }.get(sector, 'total_years_of_experience')
+            return {'field': f'personal_information.{field}', 'op': '>=', 'value': float(match.group(1))}
+        
+        if CITIZENSHIP_PATTERN.match(text):
+            return {'field': 'personal_information.holds_lebanese_citizenship_more_than_ten_years', 'op': 'is_true'}
+        
+        match = COMPUTER_PATTERN.match(text)
+        if match:
+            return {
+                'field': 'personal_information.computer_tools_proficiency_level',
+                'op': 'at_least',
+                'value': match.group(1)
+            }
+        
+        match = LANGUAGE_PATTERN.match(text)
+        if match:
+            languages = re.findall(r'arabic|english|french', match.group(2), re.IGNORECASE)
+            rules = [{'language': language.capitalize(), 'at_least': match.group(1)} for language in languages]
+            return rules[0] if len(rules) == 1 else {'all': rules}
+        
+        return None
+    
+    def evaluate(self, rule: Dict[str, Any], candidate_data: dict) -> Optional[Tuple[bool, str]]:
+        """
+        Return (passed, evidence), or None when the rule cannot be decided from the candidate data
+        """
+        try:
+            if 'all' in rule or 'any' in rule:
+                return self._evaluate_group(rule, candidate_data)
+            if 'language' in rule:
+                return self._evaluate_language(rule, candidate_data)
+            if 'field' in rule:
+                return self._evaluate_field(rule, candidate_data)
+        except (TypeError, ValueError):
+            pass
+        return None
+    
+    def describe(self, rule: Dict[str, Any]) -> str:
+        if 'all' in rule or 'any' in rule:
+            joiner = ' AND ' if 'all' in rule else ' OR '
+            return '(' + joiner.join(self.describe(r) for r in rule.get('all') or rule.get('any')) + ')'
+        if 'language' in rule:
+            skills = '/'.join(rule.get('skills') or LANGUAGE_SKILLS)
+            return f"{rule['language']} {skills} at least {rule['at_least']}"
+        value = '' if rule.get('op') in ('is_true', 'is_false') else f" {rule.get('value')!r}"
+        return f"{rule.get('field')} {rule.get('op')}{value}"
+    
+    def _evaluate_group(self, rule: Dict[str, Any], candidate_data: dict) -> Optional[Tuple[bool, str]]:
+        require_all = 'all' in rule
+        outcomes = [self.evaluate(sub_rule, candidate_data) for sub_rule in rule['all' if require_all else 'any']]
+        if not outcomes or any(outcome is None for outcome in outcomes):
+            return None
+        
+        passed = all(p for p, _ in outcomes) if require_all else any(p for p, _ in outcomes)
+        return passed, '; '.join(evidence for _, evidence in outcomes)
+    
+    def _evaluate_field(self, rule: Dict[str, Any], candidate_data: dict) -> Optional[Tuple[bool, str]]:
+        found, actual = self._lookup(candidate_data, rule['field'])
+        if not found or actual is None:
+            return None
+        
+        op = rule.get('op', '==')
+        expected = rule.get('value')
+        if op == 'is_true':
+            passed = actual is True
+        elif op == 'is_false':
+            passed = actual is False
+        elif op == 'at_least':
+            actual_rank = PROFICIENCY_RANKS.get(str(actual).strip().lower())
+            expected_rank = PROFICIENCY_RANKS.get(str(expected).strip().lower())
+            if actual_rank is None or expected_rank is None:
+                return None
+            passed = actual_rank >= expected_rank
+        elif op in ('in', 'not_in'):
+            passed = (actual in expected) == (op == 'in')
+        elif op in ('>', '>=', '<', '<='):
+            actual, expected = float(actual), float(expected)
+            passed = {
+                '>': actual > expected, '>=': actual >= expected,
+                '<': actual < expected, '<=': actual <= expected
+            }[op]
+        elif op in ('==', '!='):
+            passed = (actual == expected) == (op == '==')
+        else:
+            return None
+        
+        return passed, f"{rule['field']} = {actual!r}"
+    
+    def _evaluate_language(self, rule: Dict[str, Any], candidate_data: dict) -> Optional[Tuple[bool, str]]:
+        languages = candidate_data.get('language_proficiency')
+        required_rank = PROFICIENCY_RANKS.get(str(rule.get('at_least', '')).strip().lower())
+        if not isinstance(languages, list) or required_rank is None:
+            return None
+        
+        skills = rule.get('skills') or LANGUAGE_SKILLS
+        entry = next(
+            (item for item in languages
+             if isinstance(item, dict) and str(item.get('language', '')).strip().lower() == rule['language'].lower()),
+            None
+        )
+        if entry is None:
+            return False, f"{rule['language']} not listed"
+        
+        ranks = [PROFICIENCY_RANKS.get(str(entry.get(skill, '')).strip().lower()) for skill in skills]
+        if any(rank is None for rank in ranks):
+            return None
+        
+        levels = ', '.join(f"{skill} {entry.get(skill)}" for skill in skills)
+        return all(rank >= required_rank for rank in ranks), f"{rule['language']}: {levels}"
+    
+    def _lookup(self, data: Any, path: str) -> Tuple[bool, Any]:
+        for key in path.split('.'):
+            if not isinstance(data, dict) or key not in data:
+                return False, None
+            data = data[key]
+        return True, data
+
+rule_engine = RuleEngine()
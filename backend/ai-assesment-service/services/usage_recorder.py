@@ -0,0 +1,92 @@
+import atexit
+import logging
+import threading
+from typing import Dict, Any
+from config import Config
+from models.usage_tracking import UsageTracking
+from utils.database import db
+
+logger = logging.getLogger(__name__)
+
+class UsageRecorder:
+    """
+    Write-behind buffer for UsageTracking rows.
+    Records are kept in memory and written with one bulk insert when the buffer
+    reaches USAGE_FLUSH_BATCH_SIZE, every USAGE_FLUSH_INTERVAL_SECONDS, and at exit.
+    Flushes use their own connection, so they never commit the caller's session.
+    """
+    def __init__(self):
+        self.app = None
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+    
+    def init_app(self, app):
+        self.app = app
+        threading.Thread(target=self._flush_loop, name='usage-recorder', daemon=True).start()
+        atexit.register(self.flush)
+    
+    def record(self, job_id, assessment_type, usage_data, success=True,
+               candidate_id=None, processing_time_ms=None, cached=False, model=None):
+        row = UsageTracking.build_record(
+            job_id, assessment_type, usage_data, success=success,
+            candidate_id=candidate_id, processing_time_ms=processing_time_ms, cached=cached, model=model
+        )
+        
+        with self._lock:
+            self._buffer.append(row)
+            full = len(self._buffer) >= Config.USAGE_FLUSH_BATCH_SIZE
+        
+        if self.app is None:
+            # Not running inside the service (scripts, shell): write through
+            self.flush()
+        elif full:
+            self._wakeup.set()
+    
+    def flush(self) -> int:
+        """
+        Bulk insert everything buffered so far; returns the number of rows written
+        """
+        with self._flush_lock:
+            with self._lock:
+                rows, self._buffer = self._buffer, []
+            
+            if not rows:
+                return 0
+            
+            try:
+                if self.app is not None:
+                    with self.app.app_context():
+                        self._insert(rows)
+                else:
+                    self._insert(rows)
+                return len(rows)
+            except Exception:
+                logger.exception("Failed to flush %d usage records", len(rows))
+                self._requeue(rows)
+                return 0
+    
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._buffer)
+    
+    def _insert(self, rows):
+        with db.engine.begin() as connection:
+            connection.execute(UsageTracking.__table__.insert(), rows)
+    
+    def _requeue(self, rows):
+        with self._lock:
+            self._buffer = rows + self._buffer
+            overflow = len(self._buffer) - Config.USAGE_BUFFER_MAX_RECORDS
+            if overflow > 0:
+                logger.warning("Usage buffer full, dropping %d oldest records", overflow)
+                self._buffer = self._buffer[overflow:]
+    
+    def _flush_loop(self):
+        while True:
+            self._wakeup.wait(timeout=Config.USAGE_FLUSH_INTERVAL_SECONDS)
+            self._wakeup.clear()
+            self.flush()
+
+usage_recorder = UsageRecorder()
\ No newline at end of file
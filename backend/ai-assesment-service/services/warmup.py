@@ -0,0 +1,37 @@
+import logging
+from config import Config
+from models.usage_tracking import UsageTracking
+from services.assessment_processor import AssessmentProcessor
+from services.openai_client import get_openai_client
+from utils.database import db
+from utils.http import get_http_session
+
+logger = logging.getLogger(__name__)
+
+def warm_up(app):
+    """
+    Per-worker warmup: create the shared OpenAI client and HTTP session, open a database
+    connection and preload the job data cache with the bundles of the most recently assessed jobs.
+    The bundles are only fresh for JOB_DATA_CACHE_TTL_SECONDS; after that the preload still saves
+    the full download, since their ETags let the first real fetch revalidate with a 304.
+    """
+    with app.app_context():
+        if Config.OPENAI_API_KEY:
+            get_openai_client()
+        get_http_session()
+        
+        with db.engine.connect() as connection:
+            connection.execute(db.text('SELECT 1'))
+        
+        if not Config.WARMUP_PRELOAD_JOBS or not Config.OPENAI_API_KEY:
+            return 0
+        
+        recent_jobs = db.session.query(UsageTracking.job_id).group_by(UsageTracking.job_id)\
+                                .order_by(db.func.max(UsageTracking.created_at).desc())\
+                                .limit(Config.WARMUP_PRELOAD_JOBS).all()
+        db.session.remove()
+        
+        processor = AssessmentProcessor()
+        preloaded = sum(1 for (job_id,) in recent_jobs if processor.fetch_assessment_bundle(job_id))
+        logger.info("Worker warmup preloaded %d job bundles", preloaded)
+        return preloaded
\ No newline at end of file
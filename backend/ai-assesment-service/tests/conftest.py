@@ -0,0 +1,25 @@
+import os
+import sys
+
+# Configure the service before config.py is imported: in-memory database, no background
+# workers, no on-disk LLM cache, and no real OpenAI calls (tests swap in fake clients)
+os.environ.setdefault('OPENAI_API_KEY', 'test-key')
+os.environ['DATABASE_URL'] = 'sqlite://'
+os.environ['BATCH_WORKER_ENABLED'] = 'false'
+os.environ['BULK_WORKER_ENABLED'] = 'false'
+os.environ['LLM_CACHE_ENABLED'] = 'false'
+os.environ['TRACK_USAGE'] = 'false'
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from app import create_app
+from utils.database import db
+
+@pytest.fixture
+def app():
+    app = create_app()
+    with app.app_context():
+        yield app
+        db.session.remove()
+        db.drop_all()
\ No newline at end of file
@@ -0,0 +1,37 @@
+from services.area_fields import AreaFieldMapper
+
+CANDIDATE = {
+    'education': [{'degree': 'BA'}],
+    'language_proficiency': [{'language': 'French', 'level': 'C1'}],
+    'professional_experience': [{'title': 'Clerk'}],
+    'hobbies': ['chess']
+}
+
+def test_overlapping_criteria_ids_keep_their_own_areas():
+    # Both criteria tables number their rows from 1
+    bundle = {
+        'job': {'id': 1},
+        'min_qualification_criteria': [{'id': 1, 'area': 'Education'}, {'id': 2, 'area': 'Language Proficiency'}],
+        'formal_assessment_criteria': [{'id': 1, 'area': 'Professional Experience'}, {'id': 2, 'area': 'Education'}]
+    }
+    compiled = AreaFieldMapper(max_jobs=10).compile(1, bundle)
+    
+    min_qual, formal = bundle['min_qualification_criteria'], bundle['formal_assessment_criteria']
+    assert compiled.extract(CANDIDATE, min_qual[0]) == [{'degree': 'BA'}]
+    assert compiled.extract(CANDIDATE, min_qual[1]) == [{'language': 'French', 'level': 'C1'}]
+    assert compiled.extract(CANDIDATE, formal[0]) == [{'title': 'Clerk'}]
+    assert compiled.extract(CANDIDATE, formal[1]) == [{'degree': 'BA'}]
+
+def test_unmapped_area_gets_the_whole_candidate_by_default():
+    bundle = {'job': {'id': 2}, 'min_qualification_criteria': [{'id': 1, 'area': 'Leisure Pursuits'}]}
+    mapper = AreaFieldMapper(max_jobs=10)
+    compiled = mapper.compile(2, bundle)
+    
+    assert compiled.extract(CANDIDATE, bundle['min_qualification_criteria'][0]) == CANDIDATE
+    assert mapper.stats()['unmapped_extractions'] == 1
+
+def test_job_mapping_applies_to_areas_outside_the_compiled_bundle():
+    bundle = {'job': {'id': 3, 'area_field_mapping': {'Hobbies': ['hobbies']}}, 'min_qualification_criteria': []}
+    compiled = AreaFieldMapper(max_jobs=10).compile(3, bundle)
+    
+    assert compiled.extract(CANDIDATE, {'id': 9, 'area': 'hobbies '}) == ['chess']
\ No newline at end of file
@@ -0,0 +1,18 @@
+import threading
+import utils.background as background
+from config import Config
+
+def test_background_workers_start_in_one_process_at_a_time(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, 'BACKGROUND_LOCK_PATH', str(tmp_path / 'background.lock'))
+    monkeypatch.setattr(background, '_lock_files', [])
+    first, second = threading.Event(), threading.Event()
+    
+    # Each call opens the lock file on its own, like a separate worker process would
+    background.run_in_one_process(first.set)
+    assert first.wait(timeout=1)
+    background.run_in_one_process(second.set)
+    assert not second.wait(timeout=0.2)
+    
+    # The first process exits: the waiting one takes over
+    background._lock_files[0].close()
+    assert second.wait(timeout=1)
\ No newline at end of file
@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta
+from config import Config
+from models.assessment_batch import AssessmentBatch, AssessmentBatchItem
+from services.batch_queue import batch_queue
+from utils.database import db
+
+def _expire_lease(item_id, attempts):
+    AssessmentBatchItem.query.filter_by(id=item_id).update({
+        'status': 'running',
+        'attempts': attempts,
+        'claimed_at': datetime.utcnow() - timedelta(seconds=Config.BATCH_ITEM_LEASE_SECONDS + 1)
+    })
+    db.session.commit()
+
+def test_lease_expired_items_are_retried_until_max_attempts(app):
+    batch = batch_queue.enqueue(7, 'formal_assessment', [
+        {'candidate_id': 'retry', 'candidate_data': {}},
+        {'candidate_id': 'exhausted', 'candidate_data': {}}
+    ])
+    batch_id = batch.id
+    retry, exhausted = AssessmentBatchItem.query.filter_by(batch_id=batch_id).order_by(AssessmentBatchItem.id).all()
+    retry_id, exhausted_id = retry.id, exhausted.id
+    _expire_lease(retry_id, Config.BATCH_ITEM_MAX_ATTEMPTS - 1)
+    _expire_lease(exhausted_id, Config.BATCH_ITEM_MAX_ATTEMPTS)
+    
+    batch_queue._fail_exhausted_items()
+    assert batch_queue._claim_next_item() == retry_id
+    assert batch_queue._claim_next_item() is None
+    
+    retry, exhausted = db.session.get(AssessmentBatchItem, retry_id), db.session.get(AssessmentBatchItem, exhausted_id)
+    assert (retry.status, retry.attempts) == ('running', Config.BATCH_ITEM_MAX_ATTEMPTS)
+    assert exhausted.status == 'failed'
+    assert f'Gave up after {Config.BATCH_ITEM_MAX_ATTEMPTS} attempts' in exhausted.error
+    assert db.session.get(AssessmentBatch, batch_id).failed_items == 1
+    
+    # Failing is counted once, however often the dispatcher runs
+    batch_queue._fail_exhausted_items()
+    assert db.session.get(AssessmentBatch, batch_id).failed_items == 1
+
+def test_a_claim_whose_lease_expired_cannot_finish_the_item(app):
+    batch_id = batch_queue.enqueue(7, 'formal_assessment', [{'candidate_id': 'slow', 'candidate_data': {}}]).id
+    item_id = batch_queue._claim_next_item()
+    item = db.session.get(AssessmentBatchItem, item_id)
+    
+    # The lease runs out while the first worker is still busy, and the item is claimed again
+    _expire_lease(item_id, 1)
+    assert batch_queue._claim_next_item() == item_id
+    
+    # The first worker finishes late, then the second one
+    assert not batch_queue.finish_item(item, {'success': True}, attempt=1)
+    assert batch_queue.finish_item(item, {'success': True}, attempt=2)
+    
+    batch = db.session.get(AssessmentBatch, batch_id)
+    assert (batch.status, batch.completed_items, batch.failed_items) == ('completed', 1, 0)
\ No newline at end of file
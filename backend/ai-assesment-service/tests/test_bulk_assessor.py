@@ -0,0 +1,100 @@
+from datetime import datetime
+import pytest
+import services.bulk_assessor as bulk_assessor_module
+from models.assessment_batch import AssessmentBatch, AssessmentBatchItem, ProviderBatch
+from models.formal_assessment_results import FormalAssessmentResult
+from services.assessment_processor import AssessmentProcessor
+from services.batch_provider import BatchProvider
+from services.batch_queue import batch_queue
+from services.bulk_assessor import bulk_assessor
+from utils.database import db
+from tests.test_formal_assessment import BUNDLE, CANDIDATE, _completion
+
+class FakeProvider(BatchProvider):
+    name = 'fake'
+    
+    def __init__(self):
+        self.submitted = []
+        self.fail_submit = False
+    
+    def build_request(self, custom_id, prompt, system_prompt=None):
+        return {'custom_id': custom_id, 'prompt': prompt}
+    
+    def submit(self, requests):
+        if self.fail_submit:
+            raise RuntimeError('provider unavailable')
+        self.submitted.append(requests)
+        return f"pb-{len(self.submitted)}"
+    
+    def status(self, provider_batch_id):
+        return {'status': 'completed', 'id': provider_batch_id}
+    
+    def results(self, state):
+        requests = self.submitted[int(state['id'].split('-')[1]) - 1]
+        return {request['custom_id']: _completion(request['prompt']) for request in requests}
+
+@pytest.fixture
+def provider(app, monkeypatch):
+    provider = FakeProvider()
+    monkeypatch.setattr(bulk_assessor_module, 'get_batch_provider', lambda name=None: provider)
+    monkeypatch.setattr(AssessmentProcessor, 'fetch_assessment_bundle', lambda self, job_id: BUNDLE)
+    return provider
+
+def _bulk_batch(count=2):
+    batch = batch_queue.enqueue(7, 'formal_assessment', [
+        {'candidate_id': f'cand-{index}', 'candidate_data': CANDIDATE} for index in range(count)
+    ], mode='bulk')
+    return batch.id
+
+def test_bulk_batch_is_submitted_and_collected_once(provider):
+    batch_id = _bulk_batch()
+    
+    bulk_assessor.run_once()
+    bulk_assessor.run_once()
+    
+    assert len(provider.submitted) == 1
+    batch = db.session.get(AssessmentBatch, batch_id)
+    assert (batch.status, batch.completed_items, batch.failed_items) == ('completed', 2, 0)
+    assert FormalAssessmentResult.query.count() == 4
+
+def test_items_and_provider_batches_are_claimed_by_one_worker(provider):
+    batch_id = _bulk_batch()
+    
+    now = datetime.utcnow()
+    assert len(bulk_assessor._claim_items(batch_id, now)) == 2
+    # A second worker finds nothing left to submit
+    assert bulk_assessor._claim_items(batch_id, datetime.utcnow()) == []
+    
+    db.session.add(ProviderBatch(batch_id=batch_id, provider='fake', provider_batch_id='pb-1', bundle='{}', plans='{}'))
+    db.session.commit()
+    provider_batch_id = ProviderBatch.query.one().id
+    assert bulk_assessor._claim_provider_batch(provider_batch_id, datetime.utcnow())
+    assert not bulk_assessor._claim_provider_batch(provider_batch_id, datetime.utcnow())
+
+def test_failed_submission_releases_the_claimed_items(provider):
+    batch_id = _bulk_batch()
+    provider.fail_submit = True
+    
+    with pytest.raises(RuntimeError):
+        bulk_assessor._submit(batch_id)
+    
+    assert {item.status for item in AssessmentBatchItem.query.filter_by(batch_id=batch_id)} == {'pending'}
+    assert ProviderBatch.query.count() == 0
+
+def test_items_of_a_worker_that_died_before_submitting_are_released(provider):
+    batch_id = _bulk_batch()
+    bulk_assessor._claim_items(batch_id, datetime(2000, 1, 1))
+    
+    bulk_assessor._release_orphaned_items()
+    
+    assert {item.status for item in AssessmentBatchItem.query.filter_by(batch_id=batch_id)} == {'pending'}
+
+def test_a_provider_missing_methods_cannot_be_created():
+    class PollOnlyProvider(BatchProvider):
+        name = 'poll-only'
+        
+        def status(self, provider_batch_id):
+            return {'status': 'completed'}
+    
+    with pytest.raises(TypeError):
+        PollOnlyProvider()
\ No newline at end of file
@@ -0,0 +1,31 @@
+import asyncio
+import threading
+from models.formal_assessment_results import FormalAssessmentResult
+from utils.event_loop import run_async
+
+async def _loop_and_rows():
+    # The session only works inside an app context
+    return asyncio.get_running_loop(), threading.current_thread().name, FormalAssessmentResult.query.count()
+
+def test_run_async_reuses_one_loop_with_app_context(app):
+    first_loop, thread_name, rows = run_async(_loop_and_rows())
+    second_loop, _, _ = run_async(_loop_and_rows())
+    
+    assert first_loop is second_loop and first_loop.is_running()
+    assert thread_name == 'assessment-event-loop'
+    assert rows == 0
+
+def test_run_async_runs_requests_concurrently(app):
+    results = []
+    
+    def request_thread():
+        with app.app_context():
+            results.append(run_async(asyncio.sleep(0.2, result='done')))
+    
+    threads = [threading.Thread(target=request_thread) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=0.6)
+    
+    assert results == ['done'] * 5
\ No newline at end of file
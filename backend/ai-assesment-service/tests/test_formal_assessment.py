@@ -0,0 +1,86 @@
+import asyncio
+from models.formal_assessment_results import FormalAssessmentResult
+from services.assessment_processor import AssessmentProcessor
+from services.async_assessment_processor import AsyncAssessmentProcessor
+
+BUNDLE = {
+    'job_id': 7,
+    'job': {'id': 7, 'title': 'Analyst', 'description': 'Data analyst role'},
+    'min_qualification_criteria': [],
+    'formal_assessment_criteria': [
+        {'id': 1, 'area': 'Education', 'criteria': 'Relevant degree', 'max_score': 10, 'order_index': 1, 'version': 1},
+        {'id': 2, 'area': 'Experience', 'criteria': 'Years in the field', 'max_score': 20, 'order_index': 2, 'version': 1}
+    ]
+}
+
+SCORES = {'Education': 8, 'Experience': 5}
+
+def _completion(prompt):
+    area = next(area for area in SCORES if f"Area: {area}" in prompt)
+    return {
+        'success': True,
+        'content': {'raw_score': SCORES[area], 'evidence': 'cv', 'justification': f'{area} reviewed'},
+        'usage': {'prompt_tokens': 10, 'completion_tokens': 5, 'total_tokens': 15},
+        'model': 'gpt-4'
+    }
+
+class FakeClient:
+    def generate_completion(self, prompt, system_prompt=None):
+        return _completion(prompt)
+
+class AsyncFakeClient:
+    async def generate_completion(self, prompt, system_prompt=None):
+        return _completion(prompt)
+
+CANDIDATE = {'education': [{'degree': 'BSc'}], 'experience': [{'title': 'Analyst', 'years': 3}]}
+
+def _assert_scored_and_stored(result, candidate_id):
+    assert result['success'], result
+    assert result['failed_areas'] == []
+    assert result['overall_score'] == {'total_score': 13.0, 'total_max_score': 30.0, 'percentage': 43.33}
+    
+    rows = FormalAssessmentResult.query.filter_by(job_id=7, candidate_id=candidate_id).order_by(FormalAssessmentResult.criteria_id).all()
+    assert [(row.area, float(row.raw_score), float(row.max_score)) for row in rows] == [
+        ('Education', 8.0, 10.0), ('Experience', 5.0, 20.0)
+    ]
+    assert [area['id'] for area in result['area_results']] == [row.id for row in rows]
+
+def test_formal_assessment_stores_area_results(app, monkeypatch):
+    processor = AssessmentProcessor()
+    processor.openai_client = FakeClient()
+    monkeypatch.setattr(processor, 'fetch_assessment_bundle', lambda job_id: BUNDLE)
+    
+    result = processor.process_formal_assessment(7, 'cand-sync', CANDIDATE)
+    
+    _assert_scored_and_stored(result, 'cand-sync')
+
+def test_async_formal_assessment_stores_area_results(app, monkeypatch):
+    processor = AsyncAssessmentProcessor()
+    processor.openai_client = AsyncFakeClient()
+    
+    async def fetch_bundle(job_id):
+        return BUNDLE
+    monkeypatch.setattr(processor, 'fetch_assessment_bundle', fetch_bundle)
+    
+    result = asyncio.run(processor.process_formal_assessment(7, 'cand-async', CANDIDATE))
+    
+    _assert_scored_and_stored(result, 'cand-async')
+
+def test_reassessment_reevaluates_reused_criteria_id(app, monkeypatch):
+    processor = AssessmentProcessor()
+    processor.openai_client = FakeClient()
+    monkeypatch.setattr(processor, 'fetch_assessment_bundle', lambda job_id: BUNDLE)
+    processor.process_formal_assessment(7, 'cand-reused', CANDIDATE)
+    
+    # Criterion 2 was deleted and a new one created with the same id (and version 1)
+    replaced = {'id': 2, 'area': 'Skills', 'criteria': 'SQL', 'max_score': 20, 'order_index': 2, 'version': 1}
+    bundle = {**BUNDLE, 'formal_assessment_criteria': [BUNDLE['formal_assessment_criteria'][0], replaced]}
+    monkeypatch.setattr(processor, 'fetch_assessment_bundle', lambda job_id: bundle)
+    monkeypatch.setitem(SCORES, 'Skills', 12)
+    
+    result = processor.reassess_candidate('formal_assessment', 7, 'cand-reused', CANDIDATE)
+    
+    assert result['success'], result
+    assert (result['reassessed_areas'], result['reused_areas']) == (1, 1)
+    assert [area['area'] for area in result['area_results']] == ['Education', 'Skills']
+    assert result['overall_score'] == {'total_score': 20.0, 'total_max_score': 30.0, 'percentage': 66.67}
\ No newline at end of file
@@ -0,0 +1,44 @@
+import asyncio
+from services.idempotency import AssessmentRegistry, _Slot
+from utils.event_loop import run_async
+
+def test_async_waiters_leave_the_default_executor_free():
+    async def scenario():
+        slot = _Slot()
+        waiters = [asyncio.ensure_future(slot.wait_async(5)) for _ in range(100)]
+        await asyncio.sleep(0)
+        
+        # Waiters holding executor threads would leave this queued until they gave up
+        free = await asyncio.wait_for(asyncio.to_thread(lambda: 'free'), 1)
+        slot.resolve({'success': True})
+        return free, await asyncio.gather(*waiters)
+    
+    free, results = asyncio.run(scenario())
+    
+    assert free == 'free'
+    assert results == [{'success': True}] * 100
+
+def test_async_waiter_gives_up_after_timeout():
+    assert asyncio.run(_Slot().wait_async(0.05)) is None
+
+def test_duplicate_async_assessments_compute_once(app):
+    registry = AssessmentRegistry()
+    calls = []
+    
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return {'success': True, 'overall_score': 7}
+    
+    async def duplicates():
+        return await asyncio.gather(*[
+            registry.run_async('fingerprint', {'assessment_type': 'formal_assessment', 'job_id': 1,
+                                               'candidate_id': 'c1'}, compute)
+            for _ in range(5)
+        ])
+    
+    results = run_async(duplicates())
+    
+    assert len(calls) == 1
+    assert sum(bool(result.get('idempotent_replay')) for result in results) == 4
+    assert all(result['overall_score'] == 7 for result in results)
\ No newline at end of file
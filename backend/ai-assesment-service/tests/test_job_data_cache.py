@@ -0,0 +1,33 @@
+from types import SimpleNamespace
+import services.assessment_processor as assessment_processor
+from services.assessment_processor import AssessmentProcessor
+from services.job_data_cache import job_data_cache
+
+class FakeSession:
+    """
+    Job management service answering like its response cache: 304 while the ETag still matches
+    """
+    def __init__(self, payload, etag):
+        self.payload, self.etag, self.requests = payload, etag, []
+    
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(headers)
+        if headers.get('If-None-Match') == self.etag:
+            return SimpleNamespace(status_code=304, headers={}, json=None)
+        return SimpleNamespace(status_code=200, headers={'ETag': self.etag}, json=lambda: self.payload)
+
+def test_expired_entry_is_revalidated_then_refetched_after_an_edit(app, monkeypatch):
+    job_data_cache.invalidate()
+    session = FakeSession({'job_id': 7, 'version': 1}, etag='"v1"')
+    monkeypatch.setattr(assessment_processor, 'get_http_session', lambda: session)
+    monkeypatch.setattr(job_data_cache, 'ttl_seconds', 0)
+    processor = AssessmentProcessor()
+    
+    assert processor.fetch_assessment_bundle(7) == {'job_id': 7, 'version': 1}
+    assert processor.fetch_assessment_bundle(7) == {'job_id': 7, 'version': 1}
+    
+    # Criteria edited on the job management service (by any worker's client)
+    session.payload, session.etag = {'job_id': 7, 'version': 2}, '"v2"'
+    assert processor.fetch_assessment_bundle(7) == {'job_id': 7, 'version': 2}
+    
+    assert [headers.get('If-None-Match') for headers in session.requests] == [None, '"v1"', '"v1"']
\ No newline at end of file
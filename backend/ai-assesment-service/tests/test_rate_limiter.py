@@ -0,0 +1,10 @@
+from services.rate_limiter import RateLimiter
+
+def test_each_worker_process_gets_its_share_of_the_budgets():
+    limiter = RateLimiter(requests_per_minute=120, tokens_per_minute=60000, burst_seconds=10)
+    
+    limiter.share_budget(4)
+    
+    assert limiter._requests.rate == 120 / 4 / 60
+    assert limiter._tokens.rate == 60000 / 4 / 60
+    assert limiter.stats()['processes'] == 4
\ No newline at end of file
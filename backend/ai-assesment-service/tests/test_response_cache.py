@@ -0,0 +1,51 @@
+import sqlite3
+from types import SimpleNamespace
+import pytest
+from services.openai_client import OpenAIClient
+from services.response_cache import ResponseCache
+
+class FakeCompletions:
+    def __init__(self):
+        self.calls = 0
+    
+    def create(self, **kwargs):
+        self.calls += 1
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content='{"result": "PASS"}'))],
+            usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5, total_tokens=15)
+        )
+
+@pytest.fixture
+def client(tmp_path):
+    client = OpenAIClient()
+    client.completions = FakeCompletions()
+    client.client = SimpleNamespace(chat=SimpleNamespace(completions=client.completions))
+    client.cache = ResponseCache(str(tmp_path / 'cache.db'), ttl_seconds=60, memory_max_entries=10,
+                                 disk_max_entries=10, busy_timeout_seconds=0.05)
+    return client
+
+def test_cached_completion_is_replayed(client):
+    first = client.generate_completion('prompt')
+    second = client.generate_completion('prompt')
+    
+    assert (first['cached'], second['cached']) == (False, True)
+    assert second['content'] == first['content'] == {'result': 'PASS'}
+    assert client.completions.calls == 1
+
+def test_locked_cache_file_does_not_fail_the_call(client, tmp_path):
+    # Another worker holds the write lock for longer than the busy timeout
+    other_worker = sqlite3.connect(str(tmp_path / 'cache.db'))
+    other_worker.execute('BEGIN EXCLUSIVE')
+    try:
+        result = client.generate_completion('prompt')
+    finally:
+        other_worker.rollback()
+        other_worker.close()
+    
+    assert result['success'] and result['content'] == {'result': 'PASS'}
+    assert client.completions.calls == 1
+    
+    # The connection is usable again once the lock is released
+    client.cache._memory.clear()
+    client.generate_completion('prompt')
+    assert client.generate_completion('prompt')['cached']
\ No newline at end of file
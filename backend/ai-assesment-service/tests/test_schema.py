@@ -0,0 +1,26 @@
+import pytest
+from utils.database import db
+from utils.schema import ADDED_COLUMNS, ADDED_INDEXES, ensure_columns, ensure_indexes
+
+@pytest.mark.parametrize('table_name, column_name', ADDED_COLUMNS)
+def test_missing_column_is_added_at_startup(app, table_name, column_name):
+    # A database created before the column existed
+    with db.engine.begin() as connection:
+        connection.execute(db.text(f"ALTER TABLE {table_name} DROP COLUMN {column_name}"))
+    
+    ensure_columns(app)
+    
+    columns = {column['name'] for column in db.inspect(db.engine).get_columns(table_name)}
+    assert column_name in columns
+
+@pytest.mark.parametrize('table_name, index_name', ADDED_INDEXES)
+def test_missing_index_is_created_at_startup(app, table_name, index_name):
+    # A table created before the index was declared
+    with db.engine.begin() as connection:
+        connection.execute(db.text(f"DROP INDEX {index_name}"))
+    
+    ensure_indexes(app)
+    ensure_indexes(app)
+    
+    indexes = {index['name'] for index in db.inspect(db.engine).get_indexes(table_name)}
+    assert index_name in indexes
\ No newline at end of file
@@ -0,0 +1,21 @@
+from config import Config
+from models.usage_tracking import UsageTracking
+from services.assessment_processor import AssessmentProcessor
+from services.usage_recorder import usage_recorder
+from tests.test_formal_assessment import BUNDLE, CANDIDATE, FakeClient
+
+def test_usage_records_the_model_that_answered(app, monkeypatch):
+    monkeypatch.setattr(Config, 'TRACK_USAGE', True)
+    processor = AssessmentProcessor()
+    processor.openai_client = FakeClient()
+    monkeypatch.setattr(processor, 'fetch_assessment_bundle', lambda job_id: BUNDLE)
+    
+    processor.process_formal_assessment(7, 'cand-1', CANDIDATE)
+    processor.process_formal_assessment(7, 'cand-2', CANDIDATE)
+    usage_recorder.flush()
+    
+    assert [row.model_used for row in UsageTracking.query.all()] == ['gpt-4'] * 4
+    breakdown = UsageTracking.get_breakdown('model')
+    assert [(group['model'], group['total_assessments']) for group in breakdown] == [('gpt-4', 4)]
+    # 10 prompt and 5 completion tokens per call at gpt-4 prices
+    assert breakdown[0]['total_cost'] == round(4 * (0.01 * 0.03 + 0.005 * 0.06), 4)
\ No newline at end of file
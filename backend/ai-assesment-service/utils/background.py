@@ -0,0 +1,26 @@
+import fcntl
+import logging
+import os
+import threading
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Open lock files of this process; the lock is held for as long as the file stays open
+_lock_files = []
+
+def run_in_one_process(start):
+    """
+    Call start() in exactly one process on this host. Every worker process waits for an exclusive
+    lock on BACKGROUND_LOCK_PATH and the holder runs start(); when it exits the lock is released
+    and a waiting process takes over.
+    """
+    def wait_for_lock():
+        lock_file = open(Config.BACKGROUND_LOCK_PATH, 'a')
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        _lock_files.append(lock_file)
+        
+        logger.info("Process %s runs the background workers", os.getpid())
+        start()
+    
+    threading.Thread(target=wait_for_lock, name='background-lock', daemon=True).start()
\ No newline at end of file
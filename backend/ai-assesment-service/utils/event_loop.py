@@ -0,0 +1,33 @@
+import asyncio
+import threading
+from flask import current_app
+
+_loop = None
+_loop_lock = threading.Lock()
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Process-wide event loop run by a daemon thread. Async assessments from every request
+    thread run on it, so the async clients bound to it keep their connection pools between requests.
+    """
+    global _loop
+    
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name='assessment-event-loop', daemon=True).start()
+            _loop = loop
+        return _loop
+
+def run_async(coroutine):
+    """
+    Run a coroutine on the shared event loop inside the caller's app context and wait for its result
+    """
+    app = current_app._get_current_object()
+    
+    async def in_app_context():
+        # Each task pushes its own context, so concurrent assessments get separate sessions
+        with app.app_context():
+            return await coroutine
+    
+    return asyncio.run_coroutine_threadsafe(in_app_context(), get_event_loop()).result()
\ No newline at end of file
@@ -0,0 +1,52 @@
+import threading
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from config import Config
+
+_session = None
+_async_client = None
+_session_lock = threading.Lock()
+
+def get_http_session() -> requests.Session:
+    """
+    Shared keep-alive session for calls to other services.
+    Connections are pooled per host and idempotent GETs are retried with backoff.
+    """
+    global _session
+    
+    with _session_lock:
+        if _session is None:
+            retry = Retry(
+                total=Config.SERVICE_HTTP_MAX_RETRIES,
+                backoff_factor=Config.SERVICE_HTTP_RETRY_BACKOFF,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(['GET'])
+            )
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=Config.SERVICE_HTTP_POOL_SIZE,
+                max_retries=retry
+            )
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _session = session
+        return _session
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Shared keep-alive async client for calls to other services, used on the shared event loop (utils.event_loop).
+    Connection errors are retried; the pool is kept for the life of the process.
+    """
+    global _async_client
+    
+    with _session_lock:
+        if _async_client is None:
+            _async_client = httpx.AsyncClient(
+                timeout=Config.SERVICE_HTTP_TIMEOUT,
+                limits=httpx.Limits(max_connections=Config.SERVICE_HTTP_POOL_SIZE),
+                transport=httpx.AsyncHTTPTransport(retries=Config.SERVICE_HTTP_MAX_RETRIES)
+            )
+        return _async_client
\ No newline at end of file
@@ -10,6 +10,13 @@ Evaluate each area individually. Candidates must meet the specific criteria to p
 Be precise and evidence-based in your assessment.
 """
 
+SYSTEM_PROMPT_MIN_QUALIFICATION_MULTI_AREA = """
+You are an expert HR evaluator assessing minimum qualification requirements.
+You will receive several areas at once. Evaluate each area individually and independently,
+using only the candidate data given for that area. Candidates must meet the specific criteria to pass.
+Be precise and evidence-based in your assessment.
+"""
+
 SYSTEM_PROMPT_FORMAL_ASSESSMENT = """
 You are an HR specialist conducting formal scoring assessments.
 Score each area based on evidence and criteria provided.
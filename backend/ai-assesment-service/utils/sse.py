@@ -0,0 +1,45 @@
+import json
+import queue
+import threading
+from flask import Response, current_app
+
+def stream_assessment(run) -> Response:
+    """
+    Run an assessment in a worker thread and stream it as server-sent events.
+    run(emit) gets a callback for per-area events and returns the final result:
+    each stored area result is sent as an 'area_result' event (failed areas as
+    'area_error') the moment it is known, and the final result as 'summary'.
+    """
+    app = current_app._get_current_object()
+    events = queue.Queue()
+    finished = object()
+    
+    def emit(area_event):
+        if area_event['success']:
+            events.put(('area_result', area_event['result']))
+        else:
+            events.put(('area_error', {key: value for key, value in area_event.items() if key != 'success'}))
+    
+    def worker():
+        try:
+            with app.app_context():
+                result = run(emit)
+        except Exception as e:
+            result = {'success': False, 'error': str(e)}
+        events.put(('summary', result))
+        events.put(finished)
+    
+    def generate():
+        threading.Thread(target=worker, name='assessment-stream', daemon=True).start()
+        while True:
+            item = events.get()
+            if item is finished:
+                return
+            
+            name, payload = item
+            yield f"event: {name}\ndata: {json.dumps(payload, default=str)}\n\n"
+    
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
\ No newline at end of file
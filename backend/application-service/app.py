@@ -32,4 +32,4 @@ def create_app():
 
 if __name__ == '__main__':
     app = create_app()
-    app.run(host='0.0.0.0', port=5003, debug=True)
\ No newline at end of file
+    app.run(host='0.0.0.0', port=Config.PORT, debug=Config.DEBUG)
\ No newline at end of file
@@ -3,6 +3,8 @@ from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
 from config import Config
 from utils.database import db
+from utils.schema import ensure_columns, ensure_indexes
+from utils.job_search import init_job_search
 from routes import entities_bp, jobs_bp, criteria_bp
 
 def create_app():
@@ -20,9 +22,13 @@ def create_app():
     app.register_blueprint(jobs_bp, url_prefix='/api/jobs')
     app.register_blueprint(criteria_bp, url_prefix='/api/criteria')
     
-    # Create tables
+    # Create tables (and the job full-text index)
     with app.app_context():
         db.create_all()
+    # Columns and indexes added since a table was first created
+    ensure_columns(app)
+    ensure_indexes(app)
+    init_job_search(app)
     
     @app.route('/health')
     def health_check():
@@ -36,4 +42,4 @@ def create_app():
 
 if __name__ == '__main__':
     app = create_app()
-    app.run(host='0.0.0.0', port=5003, debug=True)
\ No newline at end of file
+    app.run(host='0.0.0.0', port=Config.PORT, debug=Config.DEBUG)
\ No newline at end of file
@@ -1,7 +1,32 @@
+import multiprocessing
 import os
 
 class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key'
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or \
         'sqlite:///recruitment.db'
-    SQLALCHEMY_TRACK_MODIFICATIONS = False
\ No newline at end of file
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    
+    # Read response cache (in-process, validated by ETags derived from row update timestamps)
+    RESPONSE_CACHE_ENABLED = os.environ.get('RESPONSE_CACHE_ENABLED', 'true').lower() == 'true'
+    RESPONSE_CACHE_MAX_ENTRIES = int(os.environ.get('RESPONSE_CACHE_MAX_ENTRIES', '1000'))
+    
+    # Production serving (pre-fork gunicorn workers, see gunicorn.conf.py; debug only when asked for)
+    PORT = int(os.environ.get('PORT', '5003'))
+    DEBUG = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
+    WEB_WORKERS = int(os.environ.get('WEB_WORKERS', str(multiprocessing.cpu_count() * 2 + 1)))
+    WEB_THREADS = int(os.environ.get('WEB_THREADS', '4'))
+    WEB_TIMEOUT = int(os.environ.get('WEB_TIMEOUT', '30'))
+    
+    # Connection pool per worker process
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', str(WEB_THREADS)))
+    DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', '10'))
+    DB_POOL_TIMEOUT = int(os.environ.get('DB_POOL_TIMEOUT', '30'))
+    DB_POOL_RECYCLE_SECONDS = int(os.environ.get('DB_POOL_RECYCLE_SECONDS', '1800'))
+    SQLALCHEMY_ENGINE_OPTIONS = {'pool_pre_ping': True} if SQLALCHEMY_DATABASE_URI.startswith('sqlite') else {
+        'pool_size': DB_POOL_SIZE,
+        'max_overflow': DB_MAX_OVERFLOW,
+        'pool_timeout': DB_POOL_TIMEOUT,
+        'pool_recycle': DB_POOL_RECYCLE_SECONDS,
+        'pool_pre_ping': True
+    }
\ No newline at end of file
@@ -0,0 +1,18 @@
+from config import Config
+
+# Pre-fork serving. The app is loaded in each worker (not preloaded in the master), so every
+# worker process has its own database pool.
+bind = f"0.0.0.0:{Config.PORT}"
+wsgi_app = 'wsgi:app'
+workers = Config.WEB_WORKERS
+threads = Config.WEB_THREADS
+worker_class = 'gthread'
+timeout = Config.WEB_TIMEOUT
+preload_app = False
+
+def post_worker_init(worker):
+    # Open the worker's first database connection before it takes traffic
+    from utils.database import db
+    with worker.wsgi.app_context():
+        with db.engine.connect() as connection:
+            connection.execute(db.text('SELECT 1'))
\ No newline at end of file
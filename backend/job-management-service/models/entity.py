@@ -1,5 +1,6 @@
 from utils.database import db
 from datetime import datetime
+from .job import Job
 
 class Entity(db.Model):
     __tablename__ = 'entities'
@@ -7,16 +8,30 @@ class Entity(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(255), nullable=False)
     description = db.Column(db.Text)
-    created_at = db.Column(db.DateTime, default=datetime.now())
+    created_at = db.Column(db.DateTime, default=datetime.now)
+    # Also touched when jobs are added or removed (jobs_count); drives the read ETags
+    updated_at = db.Column(db.DateTime, default=datetime.now, onupdate=datetime.now)
     
     # Relationships
     jobs = db.relationship('Job', backref='entity', lazy=True)
     
+    # Counted in the query that loads the entity instead of loading every job
+    jobs_count = db.column_property(
+        db.select(db.func.count(Job.id)).where(Job.entity_id == id).correlate_except(Job).scalar_subquery()
+    )
+    
+    @classmethod
+    def touch(cls, entity_id):
+        """
+        Mark the entity as changed in the current transaction
+        """
+        cls.query.filter_by(id=entity_id).update({cls.updated_at: datetime.now()}, synchronize_session=False)
+    
     def to_dict(self):
         return {
             'id': self.id,
             'name': self.name,
             'description': self.description,
             'created_at': self.created_at.isoformat() if self.created_at else None,
-            'jobs_count': len(self.jobs)
+            'jobs_count': self.jobs_count
         }
\ No newline at end of file
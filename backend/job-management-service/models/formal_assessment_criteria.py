@@ -11,7 +11,9 @@ class FormalAssessmentCriteria(db.Model):
     explanation = db.Column(db.Text)
     max_score = db.Column(db.Numeric(5, 2), default=10.00)
     order_index = db.Column(db.Integer, default=0)
-    created_at = db.Column(db.DateTime, default=datetime.now())
+    # Bumped whenever the content the AI service assesses against changes
+    version = db.Column(db.Integer, nullable=False, default=1)
+    created_at = db.Column(db.DateTime, default=datetime.now)
     
     def to_dict(self):
         return {
@@ -22,5 +24,6 @@ class FormalAssessmentCriteria(db.Model):
             'explanation': self.explanation,
             'max_score': float(self.max_score) if self.max_score else None,
             'order_index': self.order_index,
+            'version': self.version,
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
\ No newline at end of file
@@ -1,8 +1,17 @@
+import json
 from utils.database import db
 from datetime import datetime
+from .min_qualification_criteria import MinQualificationCriteria
+from .formal_assessment_criteria import FormalAssessmentCriteria
 
 class Job(db.Model):
     __tablename__ = 'jobs'
+    __table_args__ = (
+        # Keyset pagination of the job listing, unfiltered and per filter
+        db.Index('ix_jobs_created_id', 'created_at', 'id'),
+        db.Index('ix_jobs_entity_created_id', 'entity_id', 'created_at', 'id'),
+        db.Index('ix_jobs_status_created_id', 'status', 'created_at', 'id'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     entity_id = db.Column(db.Integer, db.ForeignKey('entities.id'), nullable=False)
@@ -11,22 +20,60 @@ class Job(db.Model):
     description = db.Column(db.Text, nullable=False)
     cutoff_grade = db.Column(db.Numeric(5, 2))
     status = db.Column(db.Enum('draft', 'active', 'closed', name='job_status'), default='draft')
-    created_at = db.Column(db.DateTime, default=datetime.now())
+    # Optional JSON object mapping criteria areas to the candidate fields the AI service sends for them
+    area_field_mapping = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.now)
+    # Also touched by criteria writes (the criteria counts and lists); drives the read ETags
+    updated_at = db.Column(db.DateTime, default=datetime.now, onupdate=datetime.now)
     
     # Relationships
     min_qualification_criteria = db.relationship('MinQualificationCriteria', backref='job', lazy=True)
     formal_assessment_criteria = db.relationship('FormalAssessmentCriteria', backref='job', lazy=True)
     
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'entity_id': self.entity_id,
-            'reference_number': self.reference_number,
-            'title': self.title,
-            'description': self.description,
-            'cutoff_grade': float(self.cutoff_grade) if self.cutoff_grade else None,
-            'status': self.status,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'min_qualification_criteria_count': len(self.min_qualification_criteria),
-            'formal_assessment_criteria_count': len(self.formal_assessment_criteria)
-        }
\ No newline at end of file
+    # Criteria counts come from correlated subqueries in the query that loads the job,
+    # so serializing a list of jobs never loads the criteria collections
+    min_qualification_criteria_count = db.column_property(
+        db.select(db.func.count(MinQualificationCriteria.id))
+        .where(MinQualificationCriteria.job_id == id)
+        .correlate_except(MinQualificationCriteria)
+        .scalar_subquery()
+    )
+    formal_assessment_criteria_count = db.column_property(
+        db.select(db.func.count(FormalAssessmentCriteria.id))
+        .where(FormalAssessmentCriteria.job_id == id)
+        .correlate_except(FormalAssessmentCriteria)
+        .scalar_subquery()
+    )
+    
+    @classmethod
+    def touch(cls, job_id):
+        """
+        Mark the job as changed in the current transaction
+        """
+        cls.query.filter_by(id=job_id).update({cls.updated_at: datetime.now()}, synchronize_session=False)
+    
+    def to_dict(self, fields=None):
+        """
+        Serialize the job, or only the given fields
+        """
+        if fields is None:
+            fields = JOB_FIELDS
+        # Only touch the requested attributes, so columns left out by load_only are never loaded
+        return {field: self._serialize_field(field) for field in fields}
+    
+    def _serialize_field(self, field):
+        value = getattr(self, field)
+        if value is None:
+            return None
+        if field == 'cutoff_grade':
+            return float(value) if value else None
+        if field == 'area_field_mapping':
+            return json.loads(value) if value else None
+        if field == 'created_at':
+            return value.isoformat()
+        return value
+
+JOB_FIELDS = [
+    'id', 'entity_id', 'reference_number', 'title', 'description', 'cutoff_grade', 'status',
+    'area_field_mapping', 'created_at', 'min_qualification_criteria_count', 'formal_assessment_criteria_count'
+]
\ No newline at end of file
@@ -1,3 +1,4 @@
+import json
 from utils.database import db
 from datetime import datetime
 
@@ -9,8 +10,12 @@ class MinQualificationCriteria(db.Model):
     area = db.Column(db.String(255), nullable=False)
     criteria = db.Column(db.Text, nullable=False)
     explanation = db.Column(db.Text)
+    # Optional machine-readable rule (JSON) the AI service can evaluate without the LLM
+    rule = db.Column(db.Text)
     order_index = db.Column(db.Integer, default=0)
-    created_at = db.Column(db.DateTime, default=datetime.now())
+    # Bumped whenever the content the AI service assesses against changes
+    version = db.Column(db.Integer, nullable=False, default=1)
+    created_at = db.Column(db.DateTime, default=datetime.now)
     
     def to_dict(self):
         return {
@@ -19,6 +24,8 @@ class MinQualificationCriteria(db.Model):
             'area': self.area,
             'criteria': self.criteria,
             'explanation': self.explanation,
+            'rule': json.loads(self.rule) if self.rule else None,
             'order_index': self.order_index,
+            'version': self.version,
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
\ No newline at end of file
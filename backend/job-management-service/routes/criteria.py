@@ -1,9 +1,34 @@
+import hashlib
+import json
 from flask import Blueprint, request, jsonify
 from models import Job, MinQualificationCriteria, FormalAssessmentCriteria
 from utils.database import db
+from utils.response_cache import response_cache, job_keys
 
 criteria_bp = Blueprint('criteria', __name__)
 
+# Fields whose change invalidates earlier assessment results against a criteria
+MIN_QUAL_CONTENT_FIELDS = ['area', 'criteria', 'explanation', 'rule']
+FORMAL_CONTENT_FIELDS = ['area', 'criteria', 'explanation', 'max_score']
+
+def _bump_version_if_changed(criteria, before, content_fields):
+    """
+    Increment the criteria version if any content field differs from the before snapshot
+    """
+    after = criteria.to_dict()
+    if any(after[field] != before[field] for field in content_fields):
+        criteria.version = (criteria.version or 1) + 1
+
+def _serialize_rule(rule):
+    """
+    Validate an optional criteria rule and return it as stored JSON text
+    """
+    if rule is None:
+        return None
+    if not isinstance(rule, dict):
+        raise ValueError('rule must be an object')
+    return json.dumps(rule)
+
 # MINIMUM QUALIFICATION CRITERIA ROUTES
 @criteria_bp.route('/min-qualification', methods=['POST'])
 def create_min_qualification_criteria():
@@ -17,6 +42,11 @@ def create_min_qualification_criteria():
     if not job:
         return jsonify({'error': 'Job not found'}), 404
     
+    try:
+        rule = _serialize_rule(data.get('rule'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
     max_order = db.session.query(db.func.max(MinQualificationCriteria.order_index))\
                           .filter_by(job_id=data['job_id']).scalar() or 0
     
@@ -25,12 +55,15 @@ def create_min_qualification_criteria():
         area=data['area'],
         criteria=data['criteria'],
         explanation=data.get('explanation'),
+        rule=rule,
         order_index=data.get('order_index', max_order + 1)
     )
     
     try:
         db.session.add(criteria)
+        Job.touch(criteria.job_id)
         db.session.commit()
+        response_cache.invalidate(*job_keys(criteria.job_id))
         return jsonify(criteria.to_dict()), 201
     except Exception as e:
         db.session.rollback()
@@ -44,17 +77,26 @@ def update_min_qualification_criteria(criteria_id):
     if not data:
         return jsonify({'error': 'No data provided'}), 400
     
+    before = criteria.to_dict()
     if 'area' in data:
         criteria.area = data['area']
     if 'criteria' in data:
         criteria.criteria = data['criteria']
     if 'explanation' in data:
         criteria.explanation = data['explanation']
+    if 'rule' in data:
+        try:
+            criteria.rule = _serialize_rule(data['rule'])
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
     if 'order_index' in data:
         criteria.order_index = data['order_index']
+    _bump_version_if_changed(criteria, before, MIN_QUAL_CONTENT_FIELDS)
     
     try:
+        Job.touch(criteria.job_id)
         db.session.commit()
+        response_cache.invalidate(*job_keys(criteria.job_id))
         return jsonify(criteria.to_dict())
     except Exception as e:
         db.session.rollback()
@@ -64,9 +106,13 @@ def update_min_qualification_criteria(criteria_id):
 def delete_min_qualification_criteria(criteria_id):
     criteria = MinQualificationCriteria.query.get_or_404(criteria_id)
     
+    job_id = criteria.job_id
+    
     try:
         db.session.delete(criteria)
+        Job.touch(job_id)
         db.session.commit()
+        response_cache.invalidate(*job_keys(job_id))
         return jsonify({'message': 'Criteria deleted successfully'})
     except Exception as e:
         db.session.rollback()
@@ -99,7 +145,9 @@ def create_formal_assessment_criteria():
     
     try:
         db.session.add(criteria)
+        Job.touch(criteria.job_id)
         db.session.commit()
+        response_cache.invalidate(*job_keys(criteria.job_id))
         return jsonify(criteria.to_dict()), 201
     except Exception as e:
         db.session.rollback()
@@ -113,6 +161,7 @@ def update_formal_assessment_criteria(criteria_id):
     if not data:
         return jsonify({'error': 'No data provided'}), 400
     
+    before = criteria.to_dict()
     if 'area' in data:
         criteria.area = data['area']
     if 'criteria' in data:
@@ -123,9 +172,12 @@ def update_formal_assessment_criteria(criteria_id):
         criteria.max_score = data['max_score']
     if 'order_index' in data:
         criteria.order_index = data['order_index']
+    _bump_version_if_changed(criteria, before, FORMAL_CONTENT_FIELDS)
     
     try:
+        Job.touch(criteria.job_id)
         db.session.commit()
+        response_cache.invalidate(*job_keys(criteria.job_id))
         return jsonify(criteria.to_dict())
     except Exception as e:
         db.session.rollback()
@@ -135,90 +187,213 @@ def update_formal_assessment_criteria(criteria_id):
 def delete_formal_assessment_criteria(criteria_id):
     criteria = FormalAssessmentCriteria.query.get_or_404(criteria_id)
     
+    job_id = criteria.job_id
+    
     try:
         db.session.delete(criteria)
+        Job.touch(job_id)
         db.session.commit()
+        response_cache.invalidate(*job_keys(job_id))
         return jsonify({'message': 'Criteria deleted successfully'})
     except Exception as e:
         db.session.rollback()
         return jsonify({'error': 'Failed to delete criteria'}), 500
 
 # BULK OPERATIONS
-@criteria_bp.route('/min-qualification/bulk', methods=['POST'])
-def create_bulk_min_qualification_criteria():
+BULK_PUT_MODES = ['replace', 'upsert']
+
+def _min_qualification_values(criteria_data):
+    return {
+        'area': criteria_data['area'],
+        'criteria': criteria_data['criteria'],
+        'explanation': criteria_data.get('explanation'),
+        'rule': _serialize_rule(criteria_data.get('rule'))
+    }
+
+def _formal_assessment_values(criteria_data):
+    return {
+        'area': criteria_data['area'],
+        'criteria': criteria_data['criteria'],
+        'explanation': criteria_data.get('explanation'),
+        'max_score': float(criteria_data.get('max_score', 10.00))
+    }
+
+def _criteria_rows(criteria_list, column_values, default_order=True):
+    """
+    Validate a whole criteria list before anything is written and return the column values of each item.
+    Items without an order_index take their list position unless default_order is False.
+    """
+    if not isinstance(criteria_list, list):
+        raise ValueError('criteria_list must be a list')
+    
+    rows = []
+    for index, criteria_data in enumerate(criteria_list):
+        if not isinstance(criteria_data, dict) or not all(field in criteria_data for field in ['area', 'criteria']):
+            raise ValueError(f'Missing required fields in criteria {index}')
+        
+        try:
+            row = column_values(criteria_data)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f'Invalid criteria {index}: {e}')
+        
+        for field in ['id', 'order_index']:
+            value = criteria_data.get(field)
+            # bool is an int subclass, but true/false is never a meaningful id or position
+            if value is not None and (not isinstance(value, int) or isinstance(value, bool)):
+                raise ValueError(f'Invalid criteria {index}: {field} must be an integer')
+        
+        if criteria_data.get('order_index') is not None:
+            row['order_index'] = criteria_data['order_index']
+        elif default_order:
+            row['order_index'] = index + 1
+        if criteria_data.get('id') is not None:
+            row['id'] = criteria_data['id']
+        rows.append(row)
+    return rows
+
+def _content_version(criteria_dicts, content_fields):
+    """
+    Fingerprint of a job's ordered criteria content; changes whenever what the job is assessed against changes
+    """
+    content = [
+        {field: criteria[field] for field in ['id', 'order_index', *content_fields]}
+        for criteria in criteria_dicts
+    ]
+    return hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()[:16]
+
+def _create_bulk_criteria(model, column_values):
     data = request.get_json()
     
     if not data or 'job_id' not in data or 'criteria_list' not in data:
         return jsonify({'error': 'Missing job_id or criteria_list'}), 400
     
     job_id = data['job_id']
-    criteria_list = data['criteria_list']
     
     job = Job.query.get(job_id)
     if not job:
         return jsonify({'error': 'Job not found'}), 404
     
-    created_criteria = []
+    try:
+        rows = _criteria_rows(data['criteria_list'], column_values)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    created_criteria = [model(job_id=job_id, **{k: v for k, v in row.items() if k != 'id'}) for row in rows]
     
     try:
-        for index, criteria_data in enumerate(criteria_list):
-            if not all(field in criteria_data for field in ['area', 'criteria']):
-                return jsonify({'error': f'Missing required fields in criteria {index}'}), 400
-            
-            criteria = MinQualificationCriteria(
-                job_id=job_id,
-                area=criteria_data['area'],
-                criteria=criteria_data['criteria'],
-                explanation=criteria_data.get('explanation'),
-                order_index=criteria_data.get('order_index', index + 1)
-            )
-            
-            db.session.add(criteria)
-            created_criteria.append(criteria)
-        
+        db.session.add_all(created_criteria)
+        Job.touch(job_id)
         db.session.commit()
+        response_cache.invalidate(*job_keys(job_id))
         return jsonify([criteria.to_dict() for criteria in created_criteria]), 201
     
     except Exception as e:
         db.session.rollback()
         return jsonify({'error': 'Failed to create bulk criteria'}), 500
 
-@criteria_bp.route('/formal-assessment/bulk', methods=['POST'])
-def create_bulk_formal_assessment_criteria():
+def _put_criteria_set(model, column_values, content_fields):
+    """
+    Replace (or upsert into) a job's criteria set in one transaction. Items with an id update that
+    criteria, bumping its version only if its content changed; items without one are inserted.
+    In replace mode criteria missing from the list are deleted. In upsert mode items without an
+    order_index keep their current position, or for new criteria are appended after the existing ones.
+    """
     data = request.get_json()
     
     if not data or 'job_id' not in data or 'criteria_list' not in data:
         return jsonify({'error': 'Missing job_id or criteria_list'}), 400
     
     job_id = data['job_id']
-    criteria_list = data['criteria_list']
+    mode = data.get('mode', 'replace')
+    if mode not in BULK_PUT_MODES:
+        return jsonify({'error': f"mode must be one of: {', '.join(BULK_PUT_MODES)}"}), 400
     
     job = Job.query.get(job_id)
     if not job:
         return jsonify({'error': 'Job not found'}), 404
     
-    created_criteria = []
-    
     try:
-        for index, criteria_data in enumerate(criteria_list):
-            if not all(field in criteria_data for field in ['area', 'criteria']):
-                return jsonify({'error': f'Missing required fields in criteria {index}'}), 400
-            
-            criteria = FormalAssessmentCriteria(
-                job_id=job_id,
-                area=criteria_data['area'],
-                criteria=criteria_data['criteria'],
-                explanation=criteria_data.get('explanation'),
-                max_score=criteria_data.get('max_score', 10.00),
-                order_index=criteria_data.get('order_index', index + 1)
-            )
-            
-            db.session.add(criteria)
-            created_criteria.append(criteria)
-        
-        db.session.commit()
-        return jsonify([criteria.to_dict() for criteria in created_criteria]), 201
+        rows = _criteria_rows(data['criteria_list'], column_values, default_order=mode == 'replace')
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    existing = {criteria.id: criteria for criteria in model.query.filter_by(job_id=job_id).all()}
+    updates = [row for row in rows if 'id' in row]
+    
+    ids = [row['id'] for row in updates]
+    unknown = [str(criteria_id) for criteria_id in ids if criteria_id not in existing]
+    if unknown:
+        return jsonify({'error': f"Unknown criteria ids for this job: {', '.join(unknown)}"}), 400
+    if len(set(ids)) != len(ids):
+        return jsonify({'error': 'Duplicate criteria ids'}), 400
+    
+    if mode == 'upsert':
+        # List positions would collide with the criteria already there
+        next_order_index = max((criteria.order_index or 0 for criteria in existing.values()), default=0) + 1
+        for row in rows:
+            if 'order_index' in row:
+                continue
+            if 'id' in row:
+                row['order_index'] = existing[row['id']].order_index
+            else:
+                row['order_index'] = next_order_index
+                next_order_index += 1
+    inserts = [{**row, 'job_id': job_id, 'version': 1} for row in rows if 'id' not in row]
+    
+    # Unchanged criteria are left alone, so resubmitting the same set writes nothing
+    changed_rows = []
+    for row in updates:
+        current = existing[row['id']]
+        before = current.to_dict()
+        after = model(**row).to_dict()
+        content_changed = any(after[field] != before[field] for field in content_fields)
+        if content_changed or after['order_index'] != before['order_index']:
+            row['version'] = (current.version or 1) + 1 if content_changed else current.version
+            changed_rows.append(row)
+    deleted = [criteria_id for criteria_id in existing if criteria_id not in ids] if mode == 'replace' else []
     
+    try:
+        # Set-based statements: one DELETE, and executemany UPDATE / INSERT batches
+        if deleted:
+            db.session.execute(db.delete(model).where(model.id.in_(deleted)))
+        if changed_rows:
+            db.session.execute(db.update(model), changed_rows)
+        if inserts:
+            db.session.execute(db.insert(model), inserts)
+        if deleted or changed_rows or inserts:
+            Job.touch(job_id)
+            db.session.commit()
+            response_cache.invalidate(*job_keys(job_id))
     except Exception as e:
         db.session.rollback()
-        return jsonify({'error': 'Failed to create bulk criteria'}), 500
\ No newline at end of file
+        return jsonify({'error': 'Failed to save criteria'}), 500
+    
+    criteria_set = [
+        criteria.to_dict()
+        for criteria in model.query.filter_by(job_id=job_id).order_by(model.order_index, model.id).all()
+    ]
+    return jsonify({
+        'job_id': job_id,
+        'mode': mode,
+        'criteria': criteria_set,
+        'content_version': _content_version(criteria_set, content_fields),
+        'created': len(inserts),
+        'updated': len(changed_rows),
+        'deleted': len(deleted)
+    })
+
+@criteria_bp.route('/min-qualification/bulk', methods=['POST'])
+def create_bulk_min_qualification_criteria():
+    return _create_bulk_criteria(MinQualificationCriteria, _min_qualification_values)
+
+@criteria_bp.route('/min-qualification/bulk', methods=['PUT'])
+def put_bulk_min_qualification_criteria():
+    return _put_criteria_set(MinQualificationCriteria, _min_qualification_values, MIN_QUAL_CONTENT_FIELDS)
+
+@criteria_bp.route('/formal-assessment/bulk', methods=['POST'])
+def create_bulk_formal_assessment_criteria():
+    return _create_bulk_criteria(FormalAssessmentCriteria, _formal_assessment_values)
+
+@criteria_bp.route('/formal-assessment/bulk', methods=['PUT'])
+def put_bulk_formal_assessment_criteria():
+    return _put_criteria_set(FormalAssessmentCriteria, _formal_assessment_values, FORMAL_CONTENT_FIELDS)
\ No newline at end of file
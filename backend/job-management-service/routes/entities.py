@@ -1,18 +1,22 @@
-from flask import Blueprint, request, jsonify
-from models import Entity
+from flask import Blueprint, request, jsonify, abort
+from models import Entity, Job
 from utils.database import db
+from utils.response_cache import response_cache, entity_keys
 
 entities_bp = Blueprint('entities', __name__)
 
 @entities_bp.route('', methods=['GET'])
 def get_entities():
-    entities = Entity.query.order_by(Entity.created_at.desc()).all()
-    return jsonify([entity.to_dict() for entity in entities])
+    # Any create, update or delete changes the count or the latest update timestamp
+    validator = tuple(db.session.query(db.func.count(Entity.id), db.func.max(Entity.updated_at)).one())
+    return response_cache.respond('entities', validator, lambda: [
+        entity.to_dict() for entity in Entity.query.order_by(Entity.created_at.desc()).all()
+    ])
 
 @entities_bp.route('', methods=['POST'])
 def create_entity():
     data = request.get_json()
-
+    
     if not data or 'name' not in data:
         return jsonify({'error': 'Name is required'}), 400
     
@@ -29,6 +33,7 @@ def create_entity():
     try:
         db.session.add(entity)
         db.session.commit()
+        response_cache.invalidate('entities')
         return jsonify(entity.to_dict()), 201
     except Exception as e:
         db.session.rollback()
@@ -36,8 +41,13 @@ def create_entity():
 
 @entities_bp.route('/<int:entity_id>', methods=['GET'])
 def get_entity(entity_id):
-    entity = Entity.query.get_or_404(entity_id)
-    return jsonify(entity.to_dict())
+    row = db.session.query(Entity.updated_at).filter_by(id=entity_id).first()
+    if row is None:
+        abort(404)
+    return response_cache.respond(
+        f"entity:{entity_id}", row.updated_at,
+        lambda: Entity.query.get_or_404(entity_id).to_dict()
+    )
 
 @entities_bp.route('/<int:entity_id>', methods=['PUT'])
 def update_entity(entity_id):
@@ -61,6 +71,7 @@ def update_entity(entity_id):
     
     try:
         db.session.commit()
+        response_cache.invalidate(*entity_keys(entity_id))
         return jsonify(entity.to_dict())
     except Exception as e:
         db.session.rollback()
@@ -70,12 +81,14 @@ def update_entity(entity_id):
 def delete_entity(entity_id):
     entity = Entity.query.get_or_404(entity_id)
     
-    if len(entity.jobs) > 0:
+    has_jobs = db.session.query(Job.query.filter_by(entity_id=entity_id).exists()).scalar()
+    if has_jobs:
         return jsonify({'error': 'Cannot delete entity with associated jobs'}), 400
     
     try:
         db.session.delete(entity)
         db.session.commit()
+        response_cache.invalidate(*entity_keys(entity_id))
         return jsonify({'message': 'Entity deleted successfully'})
     except Exception as e:
         db.session.rollback()
@@ -1,23 +1,170 @@
-from flask import Blueprint, request, jsonify
+import base64
+import json
+from datetime import datetime, timedelta
+from flask import Blueprint, request, jsonify, abort
 from models import Job, Entity
+from models.job import JOB_FIELDS
 from utils.database import db
+from utils.job_search import search_terms, search_job_ids
+from utils.response_cache import response_cache, job_keys, entity_keys
 
 jobs_bp = Blueprint('jobs', __name__)
 
+JOB_STATUSES = ['draft', 'active', 'closed']
+
+def _serialize_area_field_mapping(mapping):
+    """
+    Validate an optional {area: [candidate field, ...]} mapping and return it as stored JSON text
+    """
+    if mapping is None:
+        return None
+    if not isinstance(mapping, dict) or not all(
+        isinstance(fields, list) and all(isinstance(field, str) and field for field in fields)
+        for fields in mapping.values()
+    ):
+        raise ValueError('area_field_mapping must map each area to a list of field names')
+    return json.dumps(mapping)
+
 @jobs_bp.route('/', methods=['GET'])
 def get_jobs():
-    entity_id = request.args.get('entity_id')
+    """
+    Newest jobs first, one page at a time. Pass the returned next_cursor to get the following page.
+    Supports entity_id, status, start_date/end_date (created_at range) filters and sparse
+    field selection with fields=id,title,...
+    """
+    limit = max(1, min(request.args.get('limit', 50, type=int), 500))
+    
+    try:
+        fields = _job_list_fields(request.args.get('fields'))
+        start_date, end_date = _created_range(request.args.get('start_date'), request.args.get('end_date'))
+        last_key = _decode_cursor(request.args.get('cursor'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
     status = request.args.get('status')
+    if status and status not in JOB_STATUSES:
+        return jsonify({'error': 'Invalid status'}), 400
     
     query = Job.query
     
+    entity_id = request.args.get('entity_id', type=int)
     if entity_id:
         query = query.filter_by(entity_id=entity_id)
     if status:
         query = query.filter_by(status=status)
+    if start_date:
+        query = query.filter(Job.created_at >= start_date)
+    if end_date:
+        query = query.filter(Job.created_at < end_date)
+    if last_key:
+        query = query.filter(db.tuple_(Job.created_at, Job.id) < db.tuple_(*last_key))
+    if fields:
+        # Only read the requested columns and counts (plus the sort key)
+        columns = [getattr(Job, field) for field in fields if field in Job.__mapper__.column_attrs]
+        query = query.options(db.load_only(Job.id, Job.created_at, *columns))
+    
+    # Keyset pagination: an index range scan from the cursor, however deep the page
+    jobs = query.order_by(Job.created_at.desc(), Job.id.desc()).limit(limit + 1).all()
+    has_more = len(jobs) > limit
+    jobs = jobs[:limit]
+    
+    return jsonify({
+        'jobs': [job.to_dict(fields) for job in jobs],
+        'limit': limit,
+        'next_cursor': _encode_cursor(jobs[-1]) if has_more else None
+    })
+
+@jobs_bp.route('/search', methods=['GET'])
+def search_jobs():
+    """
+    Jobs matching every word of q in title, description or reference number (prefix matches),
+    most relevant first, one page at a time via next_cursor. Supports fields= like the listing.
+    """
+    terms = search_terms(request.args.get('q'))
+    if not terms:
+        return jsonify({'error': 'q is required'}), 400
+    
+    limit = max(1, min(request.args.get('limit', 20, type=int), 100))
     
-    jobs = query.order_by(Job.created_at.desc()).all()
-    return jsonify([job.to_dict() for job in jobs])
+    try:
+        fields = _job_list_fields(request.args.get('fields'))
+        after = _decode_key(request.args.get('cursor'), (float, int))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    matches = search_job_ids(terms, limit + 1, after)
+    has_more = len(matches) > limit
+    matches = matches[:limit]
+    last_id, last_score = matches[-1] if matches else (None, None)
+    
+    query = Job.query.filter(Job.id.in_([job_id for job_id, _ in matches]))
+    if fields:
+        columns = [getattr(Job, field) for field in fields if field in Job.__mapper__.column_attrs]
+        query = query.options(db.load_only(Job.id, *columns))
+    jobs = {job.id: job for job in query.all()}
+    
+    return jsonify({
+        'jobs': [
+            {**jobs[job_id].to_dict(fields), 'score': -score}
+            for job_id, score in matches if job_id in jobs
+        ],
+        'limit': limit,
+        'next_cursor': _encode_key([last_score, last_id]) if has_more else None
+    })
+
+def _job_list_fields(value):
+    if not value:
+        return None
+    
+    fields = [field.strip() for field in value.split(',') if field.strip()]
+    unknown = [field for field in fields if field not in JOB_FIELDS]
+    if unknown:
+        raise ValueError(f'Unknown fields: {", ".join(unknown)}')
+    return fields
+
+def _created_range(start_value, end_value):
+    """
+    Parse the created_at range; a date-only end_date includes that whole day
+    """
+    parsed = []
+    for name, value in [('start_date', start_value), ('end_date', end_value)]:
+        if not value:
+            parsed.append(None)
+            continue
+        
+        try:
+            moment = datetime.fromisoformat(value)
+        except ValueError:
+            raise ValueError(f'{name} must be an ISO 8601 date or datetime')
+        
+        if name == 'end_date' and len(value) == 10:
+            moment += timedelta(days=1)
+        parsed.append(moment)
+    return parsed
+
+def _encode_cursor(job):
+    return _encode_key([job.created_at.isoformat(), job.id])
+
+def _decode_cursor(cursor):
+    return _decode_key(cursor, (datetime.fromisoformat, int))
+
+def _encode_key(last_key):
+    return base64.urlsafe_b64encode(json.dumps(last_key).encode()).decode()
+
+def _decode_key(cursor, types):
+    """
+    Decode an opaque cursor back into the last key of the previous page, converting each part
+    """
+    if not cursor:
+        return None
+    
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+        if len(values) != len(types):
+            raise ValueError
+        return tuple(convert(value) for convert, value in zip(types, values))
+    except (ValueError, TypeError):
+        raise ValueError('Invalid cursor')
 
 @jobs_bp.route('', methods=['POST'])
 def create_job():
@@ -37,18 +184,26 @@ def create_job():
     if existing_job:
         return jsonify({'error': 'Reference number already exists'}), 400
     
+    try:
+        area_field_mapping = _serialize_area_field_mapping(data.get('area_field_mapping'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
     job = Job(
         entity_id=data['entity_id'],
         reference_number=data['reference_number'],
         title=data['title'],
         description=data['description'],
         cutoff_grade=data.get('cutoff_grade'),
-        status=data.get('status', 'draft')
+        status=data.get('status', 'draft'),
+        area_field_mapping=area_field_mapping
     )
     
     try:
         db.session.add(job)
+        Entity.touch(job.entity_id)
         db.session.commit()
+        response_cache.invalidate(*entity_keys(job.entity_id))
         return jsonify(job.to_dict()), 201
     except Exception as e:
         db.session.rollback()
@@ -56,8 +211,10 @@ def create_job():
 
 @jobs_bp.route('/<int:job_id>', methods=['GET'])
 def get_job(job_id):
-    job = Job.query.get_or_404(job_id)
-    return jsonify(job.to_dict())
+    return response_cache.respond(
+        f"job:{job_id}", _job_validator(job_id),
+        lambda: Job.query.get_or_404(job_id).to_dict()
+    )
 
 @jobs_bp.route('/<int:job_id>', methods=['PUT'])
 def update_job(job_id):
@@ -74,12 +231,18 @@ def update_job(job_id):
     if 'cutoff_grade' in data:
         job.cutoff_grade = data['cutoff_grade']
     if 'status' in data:
-        if data['status'] not in ['draft', 'active', 'closed']:
+        if data['status'] not in JOB_STATUSES:
             return jsonify({'error': 'Invalid status'}), 400
         job.status = data['status']
+    if 'area_field_mapping' in data:
+        try:
+            job.area_field_mapping = _serialize_area_field_mapping(data['area_field_mapping'])
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
     
     try:
         db.session.commit()
+        response_cache.invalidate(*job_keys(job_id))
         return jsonify(job.to_dict())
     except Exception as e:
         db.session.rollback()
@@ -89,9 +252,13 @@ def update_job(job_id):
 def delete_job(job_id):
     job = Job.query.get_or_404(job_id)
     
+    entity_id = job.entity_id
+    
     try:
         db.session.delete(job)
+        Entity.touch(entity_id)
         db.session.commit()
+        response_cache.invalidate(*job_keys(job_id), *entity_keys(entity_id))
         return jsonify({'message': 'Job deleted successfully'})
     except Exception as e:
         db.session.rollback()
@@ -99,13 +266,41 @@ def delete_job(job_id):
 
 @jobs_bp.route('/<int:job_id>/criteria', methods=['GET'])
 def get_job_criteria(job_id):
+    return response_cache.respond(
+        f"criteria:{job_id}", _job_validator(job_id),
+        lambda: {'job_id': job_id, **_ordered_criteria(Job.query.get_or_404(job_id))}
+    )
+
+@jobs_bp.route('/<int:job_id>/assessment-bundle', methods=['GET'])
+def get_job_assessment_bundle(job_id):
+    """
+    Job plus both ordered criteria lists in one response, so an assessment needs a single round trip
+    """
+    return response_cache.respond(f"bundle:{job_id}", _job_validator(job_id), lambda: _assessment_bundle(job_id))
+
+def _assessment_bundle(job_id):
     job = Job.query.get_or_404(job_id)
     
+    return {
+        'job_id': job_id,
+        'job': job.to_dict(),
+        **_ordered_criteria(job)
+    }
+
+def _ordered_criteria(job):
     min_qual_criteria = sorted(job.min_qualification_criteria, key=lambda x: x.order_index)
     formal_criteria = sorted(job.formal_assessment_criteria, key=lambda x: x.order_index)
     
-    return jsonify({
-        'job_id': job_id,
+    return {
         'min_qualification_criteria': [criteria.to_dict() for criteria in min_qual_criteria],
         'formal_assessment_criteria': [criteria.to_dict() for criteria in formal_criteria]
-    })
\ No newline at end of file
+    }
+
+def _job_validator(job_id):
+    """
+    The job's update timestamp (criteria writes touch it too), read without loading the job
+    """
+    row = db.session.query(Job.updated_at).filter_by(id=job_id).first()
+    if row is None:
+        abort(404)
+    return row.updated_at
\ No newline at end of file
@@ -0,0 +1,23 @@
+import os
+import sys
+
+# In-memory database; config.py reads DATABASE_URL when it is imported
+os.environ['DATABASE_URL'] = 'sqlite://'
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from app import create_app
+from utils.database import db
+
+@pytest.fixture
+def app():
+    app = create_app()
+    with app.app_context():
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
\ No newline at end of file
@@ -0,0 +1,65 @@
+import pytest
+from models import Entity, Job, FormalAssessmentCriteria
+from utils.database import db
+
+@pytest.fixture
+def job(app):
+    job = Job(entity=Entity(name='Entity'), reference_number='REF-1', title='Analyst', description='Data analyst role')
+    job.formal_assessment_criteria = [FormalAssessmentCriteria(area='Education', criteria='Degree', order_index=1)]
+    db.session.add(job)
+    db.session.commit()
+    return job
+
+@pytest.mark.parametrize('item, message', [
+    ({'order_index': 'abc'}, 'Invalid criteria 1: order_index must be an integer'),
+    ({'order_index': True}, 'Invalid criteria 1: order_index must be an integer'),
+    ({'id': [1]}, 'Invalid criteria 1: id must be an integer'),
+    ({'id': '1'}, 'Invalid criteria 1: id must be an integer'),
+    ({'id': False}, 'Invalid criteria 1: id must be an integer'),
+])
+@pytest.mark.parametrize('method', ['post', 'put'])
+def test_bulk_criteria_rejects_non_integer_id_and_order_index(client, job, method, item, message):
+    criteria_list = [
+        {'area': 'Experience', 'criteria': 'Years', 'order_index': 1},
+        {'area': 'Skills', 'criteria': 'SQL', **item}
+    ]
+    
+    response = getattr(client, method)('/api/criteria/formal-assessment/bulk', json={
+        'job_id': job.id, 'criteria_list': criteria_list
+    })
+    
+    assert response.status_code == 400
+    assert response.get_json() == {'error': message}
+    assert [criteria.area for criteria in FormalAssessmentCriteria.query.filter_by(job_id=job.id)] == ['Education']
+
+def test_bulk_put_accepts_integer_id_and_order_index(client, job):
+    criteria_id = job.formal_assessment_criteria[0].id
+    
+    response = client.put('/api/criteria/formal-assessment/bulk', json={
+        'job_id': job.id,
+        'criteria_list': [
+            {'area': 'Skills', 'criteria': 'SQL', 'order_index': 1},
+            {'id': criteria_id, 'area': 'Education', 'criteria': 'Degree', 'order_index': 2}
+        ]
+    })
+    
+    assert response.status_code == 200, response.get_data()
+    assert [(c['area'], c['order_index']) for c in response.get_json()['criteria']] == [('Skills', 1), ('Education', 2)]
+
+def test_bulk_upsert_appends_new_criteria_without_order_index(client, job):
+    criteria_id = job.formal_assessment_criteria[0].id
+    
+    response = client.put('/api/criteria/formal-assessment/bulk', json={
+        'job_id': job.id,
+        'mode': 'upsert',
+        'criteria_list': [
+            {'area': 'Skills', 'criteria': 'SQL'},
+            {'area': 'Experience', 'criteria': 'Years'},
+            {'id': criteria_id, 'area': 'Education', 'criteria': 'Masters'}
+        ]
+    })
+    
+    assert response.status_code == 200, response.get_data()
+    assert [(c['area'], c['order_index']) for c in response.get_json()['criteria']] == [
+        ('Education', 1), ('Skills', 2), ('Experience', 3)
+    ]
\ No newline at end of file
@@ -0,0 +1,93 @@
+import itertools
+import pytest
+from sqlalchemy import event
+from models import Entity, Job, MinQualificationCriteria, FormalAssessmentCriteria
+from utils.database import db
+
+_entity_numbers = itertools.count()
+
+@pytest.fixture
+def statements(app):
+    """
+    SQL statements issued while the test runs, cleared by the test before each measured request
+    """
+    executed = []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+    
+    event.listen(db.engine, 'before_cursor_execute', record)
+    yield executed
+    event.remove(db.engine, 'before_cursor_execute', record)
+
+def _query_count(statements, client, path):
+    statements.clear()
+    response = client.get(path)
+    assert response.status_code == 200, response.get_data()
+    return len(statements)
+
+def _seed(entities, jobs_per_entity, criteria_per_job=2):
+    jobs = []
+    for _ in range(entities):
+        number = next(_entity_numbers)
+        entity = Entity(name=f'Entity {number}')
+        for job_index in range(jobs_per_entity):
+            job = Job(
+                entity=entity, reference_number=f'REF-{number}-{job_index}',
+                title=f'Analyst {job_index}', description='Data analyst role'
+            )
+            job.min_qualification_criteria = [
+                MinQualificationCriteria(area=f'Area {i}', criteria='c', order_index=i) for i in range(criteria_per_job)
+            ]
+            job.formal_assessment_criteria = [
+                FormalAssessmentCriteria(area=f'Area {i}', criteria='c', order_index=i) for i in range(criteria_per_job)
+            ]
+            jobs.append(job)
+        db.session.add(entity)
+    db.session.commit()
+    return jobs
+
+@pytest.mark.parametrize('path', [
+    '/api/jobs/',
+    '/api/jobs/?fields=id,title,min_qualification_criteria_count',
+    '/api/jobs/search?q=analyst'
+])
+def test_job_listing_query_count_is_constant(client, statements, path):
+    _seed(1, 1)
+    one = _query_count(statements, client, path)
+    _seed(1, 49)
+    fifty = _query_count(statements, client, path)
+    
+    assert len(client.get(path).get_json()['jobs']) == (20 if 'search' in path else 50)
+    assert fifty == one
+
+def test_entity_listing_query_count_is_constant(client, statements):
+    _seed(1, 1)
+    one = _query_count(statements, client, '/api/entities')
+    _seed(49, 1)
+    fifty = _query_count(statements, client, '/api/entities')
+    
+    assert [entity['jobs_count'] for entity in client.get('/api/entities').get_json()] == [1] * 50
+    assert fifty == one
+
+@pytest.mark.parametrize('suffix', ['/criteria', '/assessment-bundle'])
+def test_criteria_listing_query_count_is_constant(client, statements, suffix):
+    small = _seed(1, 1, criteria_per_job=1)[0].id
+    large = _seed(1, 1, criteria_per_job=50)[0].id
+    
+    one = _query_count(statements, client, f'/api/jobs/{small}{suffix}')
+    fifty = _query_count(statements, client, f'/api/jobs/{large}{suffix}')
+    
+    assert len(client.get(f'/api/jobs/{large}{suffix}').get_json()['formal_assessment_criteria']) == 50
+    assert fifty == one
+
+def test_entity_delete_checks_for_jobs_without_loading_them(client, statements):
+    entity_id = _seed(1, 50)[0].entity_id
+    
+    statements.clear()
+    response = client.delete(f'/api/entities/{entity_id}')
+    
+    assert response.status_code == 400
+    # The entity row (with its jobs_count subquery) and one EXISTS check; no job rows are selected
+    assert len(statements) == 2
+    assert not any('jobs.title' in statement for statement in statements)
\ No newline at end of file
@@ -0,0 +1,107 @@
+import re
+from utils.database import db
+
+# Full-text index over job title, description and reference number.
+# SQLite: an external-content FTS5 table kept in sync by triggers on jobs.
+# PostgreSQL (12+): a generated tsvector column on jobs with a GIN index.
+# Both are maintained by the database itself, so every write path (routes, bulk statements,
+# other tools) keeps the index current. Scores are "lower is better" on both backends.
+
+SQLITE_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+        title, description, reference_number,
+        content='jobs', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+        INSERT INTO jobs_fts(rowid, title, description, reference_number)
+        VALUES (new.id, new.title, new.description, new.reference_number);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, description, reference_number)
+        VALUES ('delete', old.id, old.title, old.description, old.reference_number);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE OF title, description, reference_number ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, description, reference_number)
+        VALUES ('delete', old.id, old.title, old.description, old.reference_number);
+        INSERT INTO jobs_fts(rowid, title, description, reference_number)
+        VALUES (new.id, new.title, new.description, new.reference_number);
+    END
+    """
+]
+
+POSTGRES_DDL = [
+    """
+    ALTER TABLE jobs ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(reference_number, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_jobs_search_vector ON jobs USING GIN (search_vector)"
+]
+
+# Column weights for SQLite's bm25 (title, description, reference_number)
+SQLITE_SCORE = 'bm25(jobs_fts, 10.0, 1.0, 10.0)'
+
+def init_job_search(app):
+    """
+    Create the full-text index if it is missing (and fill it from existing jobs)
+    """
+    with app.app_context():
+        dialect = db.engine.dialect.name
+        with db.engine.begin() as connection:
+            if dialect == 'sqlite':
+                exists = connection.execute(db.text(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'"
+                )).first()
+                for statement in SQLITE_DDL:
+                    connection.execute(db.text(statement))
+                if not exists:
+                    connection.execute(db.text("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')"))
+            elif dialect == 'postgresql':
+                for statement in POSTGRES_DDL:
+                    connection.execute(db.text(statement))
+
+def search_terms(query):
+    """
+    Words of a free-text query; punctuation and search operators are dropped so input can't break the match syntax
+    """
+    return re.findall(r'\w+', query or '')
+
+def search_job_ids(terms, limit, after=None):
+    """
+    Ids and scores of the best matching jobs (every term, prefix-matched), best first,
+    starting after the (score, id) of the previous page's last result
+    """
+    if db.engine.dialect.name == 'postgresql':
+        match = ' & '.join(f"{term}:*" for term in terms)
+        matches = f"""
+            SELECT id, -ts_rank_cd(search_vector, query)::float8 AS score
+            FROM jobs, to_tsquery('english', :match) AS query
+            WHERE search_vector @@ query
+        """
+    else:
+        match = ' '.join(f'"{term}"*' for term in terms)
+        matches = f"""
+            SELECT rowid AS id, {SQLITE_SCORE} AS score
+            FROM jobs_fts
+            WHERE jobs_fts MATCH :match
+        """
+    
+    params = {'match': match, 'limit': limit}
+    # Materialized so the cursor predicate is applied to computed scores (SQLite would otherwise
+    # flatten it into the FTS5 scan, where bm25 can't be filtered on reliably)
+    sql = f"WITH matches AS MATERIALIZED ({matches}) SELECT id, score FROM matches"
+    if after is not None:
+        sql += " WHERE score > :score OR (score = :score AND id > :id)"
+        params['score'], params['id'] = after
+    sql += " ORDER BY score, id LIMIT :limit"
+    
+    return [(row.id, row.score) for row in db.session.execute(db.text(sql), params)]
\ No newline at end of file
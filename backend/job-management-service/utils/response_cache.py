@@ -0,0 +1,102 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict
+from flask import Response, request, jsonify
+from config import Config
+
+class ResponseCache:
+    """
+    Process-wide LRU of serialized JSON read responses with strong ETags.
+    The ETag is derived from a cheap validator (row update timestamps), so If-None-Match
+    is answered with 304 before anything is loaded or serialized, and a cached body is
+    only served while its ETag still matches. Entries written by another worker process
+    therefore never go stale; invalidation on writes just frees them early.
+    Keys look like 'job:42', 'criteria:42' or 'entities'.
+    """
+    def __init__(self, enabled: bool, max_entries: int):
+        self.enabled = enabled
+        self.max_entries = max_entries
+        
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'not_modified': 0, 'invalidations': 0}
+    
+    def respond(self, key: str, validator: Any, build: Callable[[], Any]) -> Response:
+        """
+        Conditional JSON response for a resource; build() is only called on a cache miss
+        """
+        etag = self.etag(key, validator)
+        if request.if_none_match.contains(etag):
+            with self._lock:
+                self._stats['not_modified'] += 1
+            return self._tagged(Response(status=304), etag)
+        
+        body = self._get(key, etag)
+        if body is None:
+            body = jsonify(build()).get_data()
+            self._store(key, etag, body)
+        return self._tagged(Response(body, mimetype='application/json'), etag)
+    
+    def invalidate(self, *keys: str) -> int:
+        with self._lock:
+            removed = 0
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    removed += 1
+            
+            self._stats['invalidations'] += removed
+            return removed
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, 'entries': len(self._entries)}
+    
+    @staticmethod
+    def etag(key: str, validator: Any) -> str:
+        return hashlib.sha1(repr((key, validator)).encode()).hexdigest()
+    
+    def _get(self, key, etag):
+        if not self.enabled:
+            return None
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry['etag'] == etag:
+                self._entries.move_to_end(key)
+                self._stats['hits'] += 1
+                return entry['body']
+            
+            self._stats['misses'] += 1
+            return None
+    
+    def _store(self, key, etag, body):
+        if not self.enabled:
+            return
+        
+        with self._lock:
+            self._entries[key] = {'etag': etag, 'body': body}
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    @staticmethod
+    def _tagged(response, etag):
+        response.set_etag(etag)
+        # Clients may keep the body but must revalidate it before reuse
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+
+def job_keys(job_id: int):
+    """
+    Cache keys of every read response that includes the job or its criteria
+    """
+    return [f"job:{job_id}", f"criteria:{job_id}", f"bundle:{job_id}"]
+
+def entity_keys(entity_id: int):
+    return [f"entity:{entity_id}", 'entities']
+
+response_cache = ResponseCache(
+    enabled=Config.RESPONSE_CACHE_ENABLED,
+    max_entries=Config.RESPONSE_CACHE_MAX_ENTRIES
+)
\ No newline at end of file
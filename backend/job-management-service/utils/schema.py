@@ -0,0 +1,62 @@
+import logging
+from sqlalchemy.schema import CreateIndex
+from utils.database import db
+
+logger = logging.getLogger(__name__)
+
+# Columns added to tables that existed before them, as (table, column). db.create_all() never
+# alters an existing table, so these are added at startup when a database predates them.
+ADDED_COLUMNS = [
+    ('min_qualification_criteria', 'rule'),
+    ('jobs', 'area_field_mapping'),
+    ('min_qualification_criteria', 'version'),
+    ('formal_assessment_criteria', 'version'),
+    ('jobs', 'updated_at'),
+    ('entities', 'updated_at'),
+]
+
+# Indexes declared on tables that existed before them, as (table, index name); added at startup too
+ADDED_INDEXES = [
+    ('jobs', 'ix_jobs_created_id'),
+    ('jobs', 'ix_jobs_entity_created_id'),
+    ('jobs', 'ix_jobs_status_created_id'),
+]
+
+def ensure_columns(app, added_columns=ADDED_COLUMNS):
+    """
+    ALTER TABLE ... ADD COLUMN for declared columns missing from existing tables (SQLite and PostgreSQL).
+    Existing rows get the column's scalar default, if it has one.
+    """
+    with app.app_context():
+        with db.engine.begin() as connection:
+            inspector = db.inspect(connection)
+            for table_name, column_name in added_columns:
+                existing = {column['name'] for column in inspector.get_columns(table_name)}
+                if column_name in existing:
+                    continue
+                
+                column = db.metadata.tables[table_name].c[column_name]
+                connection.execute(db.text(_add_column_sql(connection.dialect, table_name, column)))
+                logger.info("Added missing column %s.%s", table_name, column_name)
+
+def _add_column_sql(dialect, table_name, column):
+    column_type = column.type.compile(dialect=dialect)
+    sql = f"ALTER TABLE {table_name} ADD COLUMN {column.name} {column_type}"
+    
+    default = column.default.arg if column.default is not None and column.default.is_scalar else None
+    if default is not None:
+        literal = db.literal(default, column.type).compile(dialect=dialect, compile_kwargs={'literal_binds': True})
+        sql += f" DEFAULT {literal}"
+        if not column.nullable:
+            sql += " NOT NULL"
+    return sql
+
+def ensure_indexes(app, added_indexes=ADDED_INDEXES):
+    """
+    CREATE INDEX IF NOT EXISTS for declared indexes missing from existing tables (SQLite and PostgreSQL)
+    """
+    with app.app_context():
+        with db.engine.begin() as connection:
+            for table_name, index_name in added_indexes:
+                index = next(index for index in db.metadata.tables[table_name].indexes if index.name == index_name)
+                connection.execute(CreateIndex(index, if_not_exists=True))
\ No newline at end of file
@@ -0,0 +1,4 @@
+from app import create_app
+
+# WSGI entry point for production servers: gunicorn -c gunicorn.conf.py wsgi:app
+app = create_app()
\ No newline at end of file
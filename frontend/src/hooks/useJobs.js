@@ -1,6 +1,8 @@
 import { useState, useEffect, useCallback } from 'react';
 import { jobService } from '../services/jobService';
 
+const JOBS_PAGE_SIZE = 500;
+
 export const useJobs = (entityId = null) => {
   const [jobs, setJobs] = useState([]);
   const [loading, setLoading] = useState(false);
@@ -10,11 +12,20 @@ export const useJobs = (entityId = null) => {
     setLoading(true);
     setError(null);
     try {
-      const data = await jobService.getJobs(
-        filters.entityId || entityId, 
-        filters.status
-      );
-      setJobs(data);
+      // The listing is paginated: follow next_cursor until every job is loaded
+      const allJobs = [];
+      let cursor = null;
+      do {
+        const page = await jobService.getJobs(
+          filters.entityId || entityId, 
+          filters.status,
+          cursor,
+          JOBS_PAGE_SIZE
+        );
+        allJobs.push(...page.jobs);
+        cursor = page.next_cursor;
+      } while (cursor);
+      setJobs(allJobs);
     } catch (err) {
       setError(err.message);
       console.error('Error fetching jobs:', err);
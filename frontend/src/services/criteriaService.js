@@ -21,6 +21,15 @@ export const criteriaService = {
     });
   },
 
+  // Save the whole set in one transaction ('replace' also deletes criteria missing from the list)
+  async saveMinQualificationCriteriaSet(jobId, criteriaList, mode = 'replace') {
+    return jobManagementApi.put('/api/criteria/min-qualification/bulk', {
+      job_id: jobId,
+      criteria_list: criteriaList,
+      mode,
+    });
+  },
+
   // Formal Assessment Criteria
   async createFormalAssessmentCriteria(criteriaData) {
     return jobManagementApi.post('/api/criteria/formal-assessment', criteriaData);
@@ -40,4 +49,12 @@ export const criteriaService = {
       criteria_list: criteriaList,
     });
   },
+
+  async saveFormalAssessmentCriteriaSet(jobId, criteriaList, mode = 'replace') {
+    return jobManagementApi.put('/api/criteria/formal-assessment/bulk', {
+      job_id: jobId,
+      criteria_list: criteriaList,
+      mode,
+    });
+  },
 };
\ No newline at end of file
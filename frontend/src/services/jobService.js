@@ -1,13 +1,15 @@
 import { jobManagementApi } from './api.js';
 
 export const jobService = {
-  // Get all jobs with optional filters
-  async getJobs(entityId = null, status = null) {
-    let endpoint = '/api/jobs';
+  // Get one page of jobs ({ jobs, limit, next_cursor }) with optional filters
+  async getJobs(entityId = null, status = null, cursor = null, limit = null) {
+    let endpoint = '/api/jobs/';
     const params = new URLSearchParams();
     
     if (entityId) params.append('entity_id', entityId);
     if (status) params.append('status', status);
+    if (cursor) params.append('cursor', cursor);
+    if (limit) params.append('limit', limit);
     
     if (params.toString()) {
       endpoint += `?${params.toString()}`;
@@ -16,6 +18,14 @@ export const jobService = {
     return jobManagementApi.get(endpoint);
   },
 
+  // Full-text search over title, description and reference number (most relevant first)
+  async searchJobs(query, cursor = null, limit = 20) {
+    const params = new URLSearchParams({ q: query, limit });
+    if (cursor) params.append('cursor', cursor);
+    
+    return jobManagementApi.get(`/api/jobs/search?${params.toString()}`);
+  },
+
   // Get job by ID
   async getJob(id) {
     return jobManagementApi.get(`/api/jobs/${id}`);